@@ -0,0 +1,88 @@
+"""
+Incremental JSON accumulation for streamed LLM replies
+
+Accumulating streamed chunks and re-running json.loads on the growing buffer
+is O(n^2) in reply length. JSONStreamAccumulator tracks string/escape state
+and bracket depth as each fragment arrives, so completeness detection is O(1)
+per character and the full parse runs exactly once, when the top-level value
+closes. Agents that move to streaming should feed chunks through this instead
+of re-parsing.
+"""
+from typing import Any, Optional
+
+import orjson
+
+
+class JSONStreamAccumulator:
+    """Feed streamed text fragments; get the parsed document when it completes.
+
+    Tolerates a prose or ```json fence prefix before the JSON payload (the
+    same leniency as extract_json). Parsing only ever runs once; feed() after
+    completion is a no-op.
+    """
+
+    def __init__(self):
+        self._parts: list = []
+        self._started = False
+        self._opener = ""
+        self._closer = ""
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._complete = False
+        self._result: Optional[Any] = None
+        self._start_offset = 0  # chars consumed before the payload began
+        self._scanned = 0
+
+    @property
+    def complete(self) -> bool:
+        return self._complete
+
+    @property
+    def result(self) -> Optional[Any]:
+        return self._result
+
+    def feed(self, fragment: str) -> Optional[Any]:
+        """Consume a fragment; return the parsed document once it is complete."""
+        if self._complete or not fragment:
+            return self._result
+        self._parts.append(fragment)
+        for ch in fragment:
+            self._scanned += 1
+            if not self._started:
+                if ch == "{" or ch == "[":
+                    self._started = True
+                    self._opener = ch
+                    self._closer = "}" if ch == "{" else "]"
+                    self._depth = 1
+                    self._start_offset = self._scanned - 1
+                continue
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+            if ch == '"':
+                self._in_string = True
+            elif ch == self._opener:
+                self._depth += 1
+            elif ch == self._closer:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._complete = True
+                    # The depth counter pins the payload's exact span, so any
+                    # prose before/after it in the stream is sliced away.
+                    text = "".join(self._parts)
+                    try:
+                        self._result = orjson.loads(text[self._start_offset:self._scanned])
+                    except orjson.JSONDecodeError:
+                        self._result = None
+                    return self._result
+        return None
+
+    def text(self) -> str:
+        """Everything fed so far (for raw-text fallbacks)."""
+        return "".join(self._parts)
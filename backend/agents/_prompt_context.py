@@ -0,0 +1,79 @@
+"""
+Shared prompt context - pre-joined role/JD/briefing text blocks
+
+The role, JD and briefing text is identical for every candidate in a role,
+but agents used to rebuild the same f-string blocks for each call. Build
+them once per distinct (role, jd, briefing) content and reuse.
+"""
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
+
+import orjson
+
+
+@dataclass(frozen=True)
+class PromptContext:
+    role_title: str
+    jd_text: str
+    briefing_text: str
+    cache_key: str  # content hash; stable identifier for downstream caches
+
+
+def _jd_text(jd: Optional[dict]) -> str:
+    if not jd:
+        return ""
+    reqs = jd.get("requirements", [])
+    if isinstance(reqs, list):
+        reqs = ", ".join(str(r) for r in reqs)
+    skills = jd.get("skills", [])
+    if isinstance(skills, list):
+        skills = ", ".join(str(s) for s in skills)
+    return f"""
+            Job Title: {jd.get('job_title', '')}
+            Summary: {jd.get('job_summary', '')}
+            Requirements: {reqs}
+            Skills: {skills}
+            """
+
+
+def _briefing_text(briefing: Optional[dict]) -> str:
+    if not briefing:
+        return ""
+    ef = briefing.get("extracted_fields", {}) or {}
+    if not isinstance(ef, dict):
+        ef = {}
+    return f"""
+            HR Briefing (use for context, priorities, team fit):
+            Summary: {briefing.get('summary') or ''}
+            Key points: {ef}
+            """
+
+
+# Keyed on serialized content rather than updated_at: JD/briefing dicts are
+# plain projections without timestamps, and a content key also survives
+# no-op re-saves. Bounded the same way as the eval-context cache in main.py.
+_cache: dict = {}
+_MAX_ENTRIES = 256
+
+
+def get_prompt_context(role: Optional[dict], jd: Optional[dict] = None,
+                       briefing: Optional[dict] = None) -> PromptContext:
+    """Build (or fetch cached) pre-joined prompt blocks for a role."""
+    key = orjson.dumps(
+        [(role or {}).get("id"), (role or {}).get("title"), jd, briefing],
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    )
+    ctx = _cache.get(key)
+    if ctx is None:
+        ctx = PromptContext(
+            role_title=(role or {}).get("title", "") or "",
+            jd_text=_jd_text(jd),
+            briefing_text=_briefing_text(briefing),
+            cache_key=hashlib.sha1(key).hexdigest()[:16],
+        )
+        if len(_cache) >= _MAX_ENTRIES:
+            _cache.clear()
+        _cache[key] = ctx
+    return ctx
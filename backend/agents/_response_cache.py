@@ -0,0 +1,48 @@
+"""
+Content-hash cache for deterministic-ish LLM extractions
+
+Users re-upload the same JD PDF or re-run briefing extraction after tweaking
+unrelated fields; each retry used to burn a full API call. Lookups are keyed
+on sha256(input) + model, so identical input returns the stored response in
+microseconds. Failures are swallowed: a missing or broken cache table must
+never block the extraction itself.
+"""
+import hashlib
+import logging
+from datetime import datetime
+from typing import Optional
+
+from backend.db.db import SessionLocal
+from backend.models.llm_cache import LLMResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+def _key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+
+
+def get_cached(model: str, text: str) -> Optional[dict]:
+    """Return the cached response for (model, input text), or None."""
+    try:
+        with SessionLocal() as session:
+            row = session.get(LLMResponseCache, (_key(text), model))
+            return row.response if row else None
+    except Exception:
+        logger.debug("LLM response cache lookup failed", exc_info=True)
+        return None
+
+
+def store(model: str, text: str, response: dict) -> None:
+    """Persist a successful extraction for future identical inputs."""
+    try:
+        with SessionLocal() as session:
+            session.merge(LLMResponseCache(
+                sha256=_key(text),
+                model=model,
+                response=response,
+                created_at=datetime.now().isoformat(),
+            ))
+            session.commit()
+    except Exception:
+        logger.debug("LLM response cache store failed", exc_info=True)
@@ -0,0 +1,75 @@
+"""
+Proactive rate limiting for batched LLM calls.
+
+Batch jobs (parsing dozens of resumes, outreach for a whole role) can burst
+past the OpenAI account's requests-per-minute / tokens-per-minute limits;
+reactive 429 retries then waste seconds sleeping. The token-bucket limiter
+here spends from both budgets before each call so batches run at the limit
+without tripping it. Budgets are configurable via OPENAI_RPM / OPENAI_TPM.
+"""
+import asyncio
+import os
+import time
+
+from backend.agents import _util
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough prompt-token count for budget accounting (not billing-exact)."""
+    if not text:
+        return 0
+    try:
+        return len(_util._get_encoder().encode(text))
+    except Exception:
+        return len(text) // 4
+
+
+class RateLimiter:
+    """Token-bucket limiter tracking requests/min and tokens/min together."""
+
+    def __init__(self, rpm: int = 500, tpm: int = 200_000):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._req_budget = float(rpm)
+        self._tok_budget = float(tpm)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._req_budget = min(float(self.rpm), self._req_budget + elapsed * self.rpm / 60.0)
+        self._tok_budget = min(float(self.tpm), self._tok_budget + elapsed * self.tpm / 60.0)
+
+    async def acquire(self, estimated_tokens: int = 0):
+        """Block until one request plus estimated_tokens fit in the budgets."""
+        while True:
+            async with self._lock:
+                self._refill()
+                if self._req_budget >= 1.0 and self._tok_budget >= estimated_tokens:
+                    self._req_budget -= 1.0
+                    self._tok_budget -= estimated_tokens
+                    return
+                req_wait = (1.0 - self._req_budget) * 60.0 / self.rpm if self._req_budget < 1.0 else 0.0
+                tok_wait = (estimated_tokens - self._tok_budget) * 60.0 / self.tpm if self._tok_budget < estimated_tokens else 0.0
+                wait = max(req_wait, tok_wait, 0.05)
+            await asyncio.sleep(wait)
+
+
+# Shared limiter for all agent batch paths in this process
+limiter = RateLimiter(
+    rpm=int(os.getenv("OPENAI_RPM", "500")),
+    tpm=int(os.getenv("OPENAI_TPM", "200000")),
+)
+
+
+async def run_batch(coros, max_concurrency: int = 20) -> list:
+    """Run coroutines with bounded concurrency; results keep input order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros))
@@ -0,0 +1,92 @@
+"""
+Shared helpers for agent modules
+"""
+import re
+from functools import lru_cache
+from typing import Any, Optional
+
+import orjson
+import tiktoken
+
+# Fenced code block in an LLM reply: ```json ... ``` (language tag optional)
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+def extract_json(text: str) -> Optional[Any]:
+    """
+    Extract and decode the JSON payload from an LLM reply.
+
+    Handles fenced ```json blocks as well as bare JSON. Returns None when
+    nothing decodable is found so callers can apply their own fallback.
+    """
+    if not text:
+        return None
+    match = _JSON_FENCE.search(text)
+    candidate = match.group(1) if match else text.strip()
+    try:
+        return orjson.loads(candidate)
+    except orjson.JSONDecodeError:
+        pass
+    # Last resort: slice from the first opening bracket to the matching
+    # closing one (models sometimes wrap bare JSON in prose).
+    start = min((i for i in (text.find("{"), text.find("[")) if i != -1), default=-1)
+    if start == -1:
+        return None
+    opener = text[start]
+    closer = "}" if opener == "{" else "]"
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == opener:
+            depth += 1
+        elif text[i] == closer:
+            depth -= 1
+            if depth == 0:
+                try:
+                    return orjson.loads(text[start:i + 1])
+                except orjson.JSONDecodeError:
+                    return None
+    return None
+
+
+_encoder = None
+
+
+def _get_encoder():
+    """GPT-4 tokenizer, built once (construction is ~50ms and may fetch the BPE file)"""
+    global _encoder
+    if _encoder is None:
+        _encoder = tiktoken.encoding_for_model("gpt-4")
+    return _encoder
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """
+    Trim text to a token budget before embedding it in an LLM prompt.
+
+    Cost and latency scale with prompt tokens, so unbounded fields (full PDF
+    text, long experience blobs, chat history) are capped here. Falls back to
+    a ~4 chars/token cut when the tokenizer is unavailable (e.g. no cached
+    BPE file and no network).
+    """
+    if not text:
+        return text
+    try:
+        enc = _get_encoder()
+        tokens = enc.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return enc.decode(tokens[:max_tokens])
+    except Exception:
+        max_chars = max_tokens * 4
+        return text if len(text) <= max_chars else text[:max_chars]
+
+
+@lru_cache(maxsize=4096)
+def truncate_tokens_cached(text: str, max_tokens: int) -> str:
+    """truncate_tokens with memoization.
+
+    For fields re-trimmed with the same budget across calls (the same
+    candidate profile feeds outreach and recruiter notes), the encode/decode
+    pass runs once.
+    """
+    return truncate_tokens(text, max_tokens)
@@ -7,6 +7,8 @@ import os
 from dotenv import load_dotenv
 
 from backend.openai_env import openai_api_key_for_clients
+from backend.agents._throttle import estimate_tokens, limiter, run_batch
+from backend.agents._util import extract_json, truncate_tokens
 from backend.agents.crew_compat import run_crew_task_async, task_output_to_str
 
 load_dotenv()
@@ -28,9 +30,31 @@ class CandidateParserAgent:
             verbose=True
         )
     
+    async def parse_candidates(self, pdf_contents: list) -> list:
+        """Parse multiple resumes concurrently instead of one LLM round trip at a time.
+
+        Concurrency is bounded and each call spends from the shared RPM/TPM
+        budget first, so large uploads run at the rate limit instead of
+        tripping 429 retries.
+        """
+        tasks = [self._build_task(content) for content in pdf_contents]
+
+        async def _run(task: Task):
+            await limiter.acquire(estimate_tokens(task.description))
+            return await run_crew_task_async(task)
+
+        results = await run_batch([_run(t) for t in tasks])
+        return [self._parse_result(task_output_to_str(r)) for r in results]
+
     async def parse_candidate(self, pdf_content: str) -> dict:
         """Parse candidate resume"""
-        task = Task(
+        task = self._build_task(pdf_content)
+        result = task_output_to_str(await run_crew_task_async(task))
+        return self._parse_result(result)
+
+    def _build_task(self, pdf_content: str) -> Task:
+        pdf_content = truncate_tokens(pdf_content, 6000)
+        return Task(
             description=f"""
             Parse the following candidate resume and extract structured information.
             
@@ -60,26 +84,16 @@ class CandidateParserAgent:
             agent=self.agent,
             expected_output="A JSON object with name, summary, skills, experience, and parsed_insights fields"
         )
-        
-        result = task_output_to_str(await run_crew_task_async(task))
-        
-        import json
-        try:
-            if "```json" in result:
-                json_str = result.split("```json")[1].split("```")[0].strip()
-            elif "```" in result:
-                json_str = result.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = result.strip()
-            
-            parsed_data = json.loads(json_str)
+
+    def _parse_result(self, result: str) -> dict:
+        parsed_data = extract_json(result)
+        if isinstance(parsed_data, dict):
             return parsed_data
-        except:
-            return {
-                "name": "",
-                "summary": result[:500] if result else "",
-                "skills": [],
-                "experience": "",
-                "parsed_insights": {}
-            }
+        return {
+            "name": "",
+            "summary": result[:500] if result else "",
+            "skills": [],
+            "experience": "",
+            "parsed_insights": {}
+        }
 
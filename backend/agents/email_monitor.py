@@ -7,6 +7,7 @@ import os
 from dotenv import load_dotenv
 
 from backend.openai_env import openai_api_key_for_clients
+from backend.agents._util import extract_json, truncate_tokens
 from backend.agents.crew_compat import run_crew_task_async, task_output_to_str
 
 load_dotenv()
@@ -30,6 +31,7 @@ class EmailMonitorAgent:
     
     async def analyze_email(self, email_content: str, candidate_name: str = None) -> dict:
         """Analyze email for sentiment and intent"""
+        email_content = truncate_tokens(email_content, 2000)
         task = Task(
             description=f"""
             Analyze the following email from a candidate and determine:
@@ -55,22 +57,14 @@ class EmailMonitorAgent:
         )
         
         result = task_output_to_str(await run_crew_task_async(task))
-        
-        import json
-        try:
-            if "```json" in result:
-                json_str = result.split("```json")[1].split("```")[0].strip()
-            elif "```" in result:
-                json_str = result.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = result.strip()
-            
-            return json.loads(json_str)
-        except:
-            return {
-                "sentiment": "neutral",
-                "intent": "needs_info",
-                "key_points": [],
-                "recommended_action": "Follow up"
-            }
+
+        parsed = extract_json(result)
+        if isinstance(parsed, dict):
+            return parsed
+        return {
+            "sentiment": "neutral",
+            "intent": "needs_info",
+            "key_points": [],
+            "recommended_action": "Follow up"
+        }
 
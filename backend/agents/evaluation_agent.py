@@ -1,33 +1,34 @@
 """
 Evaluation Agent - Provides intelligent candidate evaluation through chat interface
 """
-from crewai import Agent, Task
-from langchain_openai import ChatOpenAI
+import logging
 import os
 from dotenv import load_dotenv
-
-from backend.openai_env import openai_api_key_for_clients
-from backend.agents.crew_compat import run_crew_task_async, task_output_to_str
+from backend.openai_env import shared_async_openai
+from backend.agents._util import truncate_tokens
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Shared client so the underlying httpx connection pool is reused across
+# requests and agents instead of being rebuilt per evaluation.
+_aclient = shared_async_openai()
+
+_SYSTEM_PROMPT = (
+    "You are a Candidate Evaluation Specialist: an expert recruiter with deep knowledge "
+    "of candidate evaluation. Your goal is to evaluate candidates comprehensively using "
+    "job requirements, HR briefings, interviews, and comparison with other candidates. "
+    "You can analyze fit, compare candidates, and provide actionable insights based on "
+    "multiple data sources."
+)
+
 
 class EvaluationAgent:
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model_name="gpt-4",
-            temperature=0.4,
-            openai_api_key=openai_api_key_for_clients()
-        )
-        
-        self.agent = Agent(
-            role="Candidate Evaluation Specialist",
-            goal="Evaluate candidates comprehensively using job requirements, HR briefings, interviews, and comparison with other candidates",
-            backstory="You are an expert recruiter with deep knowledge of candidate evaluation. You can analyze fit, compare candidates, and provide actionable insights based on multiple data sources.",
-            llm=self.llm,
-            verbose=True
-        )
-    
+        self.model = "gpt-4"
+        self.temperature = 0.4
+
     async def evaluate(self, question: str, role: dict, candidate: dict, jd: dict = None, 
                       briefing: dict = None, interview: dict = None, other_candidates: list = None,
                       conversation_history: list = None) -> str:
@@ -82,63 +83,66 @@ class EvaluationAgent:
         candidate_names_list = []
         
         if other_candidates:
+            # Build each candidate block with list-append + single join; avoids the
+            # pile of intermediate strings the old repeated concatenation created.
             candidates_details = []
-            
+
             for idx, cand in enumerate(other_candidates, 1):
+                cand_get = cand.get
                 # Extract name - try multiple fields
-                candidate_name = cand.get('name', '') or cand.get('Name', '') or ''
-                if not candidate_name or candidate_name.strip() == '':
+                candidate_name = (cand_get('name') or cand_get('Name') or '').strip()
+                if not candidate_name:
                     candidate_name = f'Candidate {idx} (Name not extracted)'
                 else:
                     candidate_names_list.append(candidate_name)
-                
+
                 # Get interview data if available
                 interview_info = ""
-                if cand.get('interview'):
-                    interview = cand['interview']
+                interview = cand_get('interview')
+                if interview:
+                    key_points = interview.get('key_points')
+                    strengths = interview.get('strengths')
+                    concerns = interview.get('concerns')
                     interview_info = f"""
             - Interview Summary: {interview.get('summary', 'N/A')}
-            - Interview Key Points: {', '.join(interview.get('key_points', [])) if interview.get('key_points') else 'N/A'}
-            - Strengths: {', '.join(interview.get('strengths', [])) if interview.get('strengths') else 'N/A'}
-            - Concerns: {', '.join(interview.get('concerns', [])) if interview.get('concerns') else 'N/A'}
+            - Interview Key Points: {', '.join(key_points) if key_points else 'N/A'}
+            - Strengths: {', '.join(strengths) if strengths else 'N/A'}
+            - Concerns: {', '.join(concerns) if concerns else 'N/A'}
             - Fit Score: {interview.get('fit_score', 'N/A')}/100
             - Recommendation: {interview.get('recommendation', 'N/A')}
             """
-                
+
                 # Format parsed insights
-                insights = cand.get('parsed_insights', {})
+                insights = cand_get('parsed_insights') or {}
+                insights_parts = []
+                if insights.get('years_of_experience'):
+                    insights_parts.append(f"Years of Experience: {insights['years_of_experience']}")
+                if insights.get('current_role'):
+                    insights_parts.append(f"Current Role: {insights['current_role']}")
+                if insights.get('education'):
+                    insights_parts.append(f"Education: {insights['education']}")
+                if insights.get('key_achievements'):
+                    insights_parts.append(f"Key Achievements: {', '.join(insights['key_achievements'])}")
                 insights_text = ""
-                if insights:
-                    insights_parts = []
-                    if insights.get('years_of_experience'):
-                        insights_parts.append(f"Years of Experience: {insights.get('years_of_experience')}")
-                    if insights.get('current_role'):
-                        insights_parts.append(f"Current Role: {insights.get('current_role')}")
-                    if insights.get('education'):
-                        insights_parts.append(f"Education: {insights.get('education')}")
-                    if insights.get('key_achievements'):
-                        insights_parts.append(f"Key Achievements: {', '.join(insights.get('key_achievements', []))}")
-                    if insights_parts:
-                        insights_text = "\n            - " + "\n            - ".join(insights_parts)
-                
+                if insights_parts:
+                    insights_text = "\n            - " + "\n            - ".join(insights_parts)
+
                 # Format skills properly
-                skills_text = 'N/A'
-                if cand.get('skills'):
-                    if isinstance(cand['skills'], list):
-                        skills_text = ', '.join(cand['skills']) if cand['skills'] else 'N/A'
-                    else:
-                        skills_text = str(cand['skills'])
-                
-                candidate_detail = f"""
+                skills = cand_get('skills')
+                if isinstance(skills, list):
+                    skills_text = ', '.join(skills) if skills else 'N/A'
+                else:
+                    skills_text = str(skills) if skills else 'N/A'
+
+                candidates_details.append(f"""
             ===== CANDIDATE {idx}: {candidate_name} =====
             NAME: {candidate_name}
-            Summary: {cand.get('summary', 'N/A')}
+            Summary: {truncate_tokens(cand_get('summary') or 'N/A', 800)}
             Skills: {skills_text}
-            Experience: {cand.get('experience', 'N/A')}{insights_text}
-            Status: {cand.get('column', 'unknown')} ({cand.get('color', 'unknown')}){interview_info}
+            Experience: {truncate_tokens(cand_get('experience') or 'N/A', 1500)}{insights_text}
+            Status: {cand_get('column', 'unknown')} ({cand_get('color', 'unknown')}){interview_info}
             ============================================
-            """
-                candidates_details.append(candidate_detail)
+            """)
             
             # Build names summary
             if candidate_names_list:
@@ -165,7 +169,7 @@ class EvaluationAgent:
                 content = msg.get("content", "")
                 if content:
                     label = "User" if role_label == "user" else "Assistant"
-                    history_lines.append(f"{label}: {content}")
+                    history_lines.append(f"{label}: {truncate_tokens(content, 500)}")
             if history_lines:
                 conversation_context = """
             PREVIOUS CONVERSATION (use this for context when answering follow-up questions):
@@ -176,19 +180,18 @@ class EvaluationAgent:
 
         context = "\n\n".join(context_parts)
         
-        # Debug: Print context to verify data is being passed
-        print(f"\n{'='*60}")
-        print(f"DEBUG Evaluation Agent - Question: {question}")
-        print(f"DEBUG Evaluation Agent - Number of candidates: {len(other_candidates) if other_candidates else 0}")
-        if other_candidates:
-            for i, cand in enumerate(other_candidates, 1):
-                name = cand.get('name', '') or cand.get('Name', '') or 'NO NAME'
-                print(f"DEBUG Candidate {i}: Name='{name}', Skills={cand.get('skills', [])[:3] if cand.get('skills') else 'N/A'}")
-        print(f"DEBUG Names Summary: {names_summary}")
-        print(f"{'='*60}\n")
+        # Debug: log context to verify data is being passed. Guarded so the
+        # per-candidate string building is skipped entirely at INFO and above.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Evaluation Agent - Question: %s", question)
+            logger.debug("Evaluation Agent - Number of candidates: %d", len(other_candidates) if other_candidates else 0)
+            if other_candidates:
+                for i, cand in enumerate(other_candidates, 1):
+                    name = cand.get('name', '') or cand.get('Name', '') or 'NO NAME'
+                    logger.debug("Candidate %d: Name='%s', Skills=%s", i, name, cand.get('skills', [])[:3] if cand.get('skills') else 'N/A')
+            logger.debug("Names Summary: %s", names_summary)
         
-        task = Task(
-            description=f"""
+        prompt = f"""
             You are evaluating candidates for a recruitment role. Answer the following question:
             {conversation_context}
             
@@ -210,13 +213,25 @@ class EvaluationAgent:
             EXAMPLE: If a candidate is named "John Smith", say "John Smith has 5 years of Python experience" 
             NOT "Candidate 1 has 5 years of experience" or "The first candidate..."
             
-            IMPORTANT: The candidate data above includes their NAMES (listed at the top), summaries, skills, experience, and parsed insights. 
+            IMPORTANT: The candidate data above includes their NAMES (listed at the top), summaries, skills, experience, and parsed insights.
             You MUST use the actual candidate names when answering questions. If names are not available, mention that names need to be extracted from the resumes.
-            """,
-            agent=self.agent,
-            expected_output="A detailed, specific answer that references actual candidate names, skills, and qualifications from the provided data"
+            """
+
+        # Direct async client with streaming: the event loop stays free during the
+        # 3-8s completion and tokens are consumed as they arrive.
+        stream = await _aclient.chat.completions.create(
+            model=self.model,
+            temperature=self.temperature,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            stream=True,
         )
-        
-        result = task_output_to_str(await run_crew_task_async(task))
-        return result.strip()
+        chunks = []
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                chunks.append(delta)
+        return "".join(chunks).strip()
 
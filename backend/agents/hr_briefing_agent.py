@@ -1,45 +1,34 @@
 """
 HR Briefing Agent - Transcribes and extracts key details from HR briefings
 """
-from crewai import Agent, Task
-from langchain_openai import ChatOpenAI
-import os
 from dotenv import load_dotenv
 
-from backend.openai_env import openai_api_key_for_clients
-from backend.agents.crew_compat import run_crew_task_async, task_output_to_str
+from backend.openai_env import shared_async_openai
+from backend.agents._response_cache import get_cached, store
+from backend.agents._util import extract_json
 
 load_dotenv()
 
+# System prompt replaces the old CrewAI role/goal/backstory; one-shot JSON
+# extraction goes straight to the chat completions API.
+_SYSTEM_PROMPT = (
+    "You are an expert at understanding HR briefings and extracting actionable "
+    "information for recruiters. You can identify priorities, constraints, and "
+    "special requirements mentioned in verbal briefings."
+)
+
+# Static instruction prefix. Kept byte-identical across calls (the dynamic
+# transcription goes after it) so OpenAI prompt caching can hit on the prefix.
+# The transcription is no longer echoed back through the model; the caller
+# attaches it to the parsed result, saving its length in output tokens.
+_PROCESS_BRIEFING_INSTRUCTIONS = """
+            Analyze the HR briefing transcription below and extract key information.
+            Respond ONLY with a JSON object.
 
-class HRBriefingAgent:
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model_name="gpt-4",
-            temperature=0.3,
-            openai_api_key=openai_api_key_for_clients()
-        )
-        
-        self.agent = Agent(
-            role="HR Briefing Analyst",
-            goal="Transcribe HR briefings, summarize key points, and extract critical hiring details",
-            backstory="You are an expert at understanding HR briefings and extracting actionable information for recruiters. You can identify priorities, constraints, and special requirements mentioned in verbal briefings.",
-            llm=self.llm,
-            verbose=True
-        )
-    
-    async def process_briefing(self, transcription: str) -> dict:
-        """Process HR briefing transcription"""
-        task = Task(
-            description=f"""
-            Analyze the following HR briefing transcription and extract key information:
-            
-            {transcription}
-            
             Extract and return a JSON object with:
-            {{
+            {
                 "summary": "Brief summary of the briefing",
-                "extracted_fields": {{
+                "extracted_fields": {
                     "priorities": ["string"],
                     "constraints": ["string"],
                     "special_requirements": ["string"],
@@ -47,32 +36,44 @@ class HRBriefingAgent:
                     "timeline_notes": "string",
                     "team_dynamics": "string",
                     "culture_fit_notes": "string"
-                }},
-                "transcription": "{transcription}"
-            }}
-            """,
-            agent=self.agent,
-            expected_output="A JSON object with summary, extracted_fields (priorities, constraints, special_requirements, budget_notes, timeline_notes, team_dynamics, culture_fit_notes), and transcription"
+                }
+            }
+            """
+
+
+class HRBriefingAgent:
+    def __init__(self):
+        # gpt-4o-mini: structured extraction needs schema-following, not prose
+        # quality; json_mode guarantees parseable output at a fraction of the cost
+        self.client = shared_async_openai()
+        self.model = "gpt-4o-mini"
+        self.temperature = 0.3
+
+    async def process_briefing(self, transcription: str) -> dict:
+        """Process HR briefing transcription"""
+        # Re-running extraction on an unchanged transcription is a repeat of
+        # the same (input, model) call; serve the stored result instead.
+        cached = get_cached(self.model, transcription)
+        if cached is not None:
+            return cached
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            temperature=self.temperature,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": f"{_PROCESS_BRIEFING_INSTRUCTIONS}\n            TRANSCRIPTION:\n            {transcription}\n            "},
+            ],
         )
-        
-        result = task_output_to_str(await run_crew_task_async(task))
-        
-        import json
-        try:
-            if "```json" in result:
-                json_str = result.split("```json")[1].split("```")[0].strip()
-            elif "```" in result:
-                json_str = result.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = result.strip()
-            
-            parsed_data = json.loads(json_str)
+        result = response.choices[0].message.content or ""
+
+        parsed_data = extract_json(result)
+        if isinstance(parsed_data, dict):
             parsed_data["transcription"] = transcription
+            store(self.model, transcription, parsed_data)
             return parsed_data
-        except:
-            return {
-                "summary": result[:500] if result else "",
-                "extracted_fields": {},
-                "transcription": transcription
-            }
-
+        return {
+            "summary": result[:500] if result else "",
+            "extracted_fields": {},
+            "transcription": transcription
+        }
@@ -1,23 +1,53 @@
 """
 Interview Assistant Agent - Processes interview transcriptions and provides guidance
 """
+import asyncio
+
 from crewai import Agent, Task
 from langchain_openai import ChatOpenAI
 import os
 from dotenv import load_dotenv
 
-from backend.openai_env import openai_api_key_for_clients
+from backend.openai_env import openai_api_key_for_clients, shared_http_clients
+from backend.agents._prompt_context import PromptContext, get_prompt_context
+from backend.agents._util import extract_json
 from backend.agents.crew_compat import run_crew_task_async, task_output_to_str
 
 load_dotenv()
 
+_http_client, _http_async_client = shared_http_clients()
+
+# Static instruction prefix for process_interview. Dynamic parts (the
+# role-specific candidate_responses fields and the transcription) come after
+# it so OpenAI prompt caching can hit on the byte-identical prefix.
+_PROCESS_INTERVIEW_INSTRUCTIONS = """
+            Analyze the interview transcription below and extract structured insights.
+            Respond ONLY with a JSON object.
+
+            Extract and return a JSON object with:
+            {
+                "summary": "Brief summary of the interview",
+                "key_points": ["string"],
+                "candidate_responses": {"<field>": "string", ...},
+                "strengths": ["string"],
+                "concerns": ["string"],
+                "fit_score": "number (0-100)",
+                "recommendation": "yes|no|maybe"
+            }
+            """
+
 
 class InterviewAssistantAgent:
     def __init__(self):
+        # gpt-4o-mini: structured extraction needs schema-following, not prose
+        # quality; json_mode guarantees parseable output at a fraction of the cost
         self.llm = ChatOpenAI(
-            model_name="gpt-4",
+            model_name="gpt-4o-mini",
             temperature=0.3,
-            openai_api_key=openai_api_key_for_clients()
+            model_kwargs={"response_format": {"type": "json_object"}},
+            openai_api_key=openai_api_key_for_clients(),
+            http_client=_http_client,
+            http_async_client=_http_async_client,
         )
         
         self.agent = Agent(
@@ -29,7 +59,8 @@ class InterviewAssistantAgent:
         )
     
     async def generate_guidance(self, candidate: dict, jd: dict = None, briefing: dict = None,
-                               current_transcription: str = "", existing_interview: dict = None, role: dict = None) -> dict:
+                               current_transcription: str = "", existing_interview: dict = None, role: dict = None,
+                               context: PromptContext = None) -> dict:
         """Generate real-time interview guidance"""
         # Determine what fields are missing
         collected_fields = {}
@@ -47,15 +78,10 @@ class InterviewAssistantAgent:
                          for f in required_fields 
                          if not collected_fields.get(f)]
         
-        # Build context for guidance
-        jd_text = ""
-        if jd:
-            jd_text = f"""
-            Job Title: {jd.get('job_title', '')}
-            Requirements: {', '.join(jd.get('requirements', []))}
-            Skills: {', '.join(jd.get('skills', []))}
-            """
-        
+        # Build context for guidance (JD block pre-joined and cached per role)
+        ctx = context or get_prompt_context(role, jd, briefing)
+        jd_text = ctx.jd_text
+
         candidate_text = f"""
         Candidate: {candidate.get('name', 'Unknown')}
         Skills: {', '.join(candidate.get('skills', []))}
@@ -101,30 +127,21 @@ class InterviewAssistantAgent:
         )
         
         result = task_output_to_str(await run_crew_task_async(task))
-        
-        import json
-        try:
-            if "```json" in result:
-                json_str = result.split("```json")[1].split("```")[0].strip()
-            elif "```" in result:
-                json_str = result.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = result.strip()
-            
-            return json.loads(json_str)
-        except:
-            return {
-                "missing_fields": missing_fields,
-                "suggested_questions": [],
-                "behavioral_probes": [],
-                "technical_probes": [],
-                "fitment_notes": []
-            }
+
+        parsed_data = extract_json(result)
+        if parsed_data is not None:
+            return parsed_data
+        return {
+            "missing_fields": missing_fields,
+            "suggested_questions": [],
+            "behavioral_probes": [],
+            "technical_probes": [],
+            "fitment_notes": []
+        }
     
     async def process_interview(self, transcription: str, role_id: str, candidate_id: str, role: dict = None) -> dict:
         """Process interview transcription"""
         # Build candidate_responses structure based on role's requirement fields
-        import json
         candidate_responses_structure = {}
         if role and role.get('candidate_requirement_fields'):
             for field in role.get('candidate_requirement_fields', []):
@@ -142,54 +159,57 @@ class InterviewAssistantAgent:
         fields_list = ', '.join(candidate_responses_structure.keys())
         
         task = Task(
-            description=f"""
-            Analyze the following interview transcription and extract structured insights:
-            
-            {transcription}
-            
-            Extract and return a JSON object with:
-            {{
-                "summary": "Brief summary of the interview",
-                "key_points": ["string"],
-                "candidate_responses": {{
-                    {', '.join([f'"{k}": "string"' for k in candidate_responses_structure.keys()])}
-                }},
-                "strengths": ["string"],
-                "concerns": ["string"],
-                "fit_score": "number (0-100)",
-                "recommendation": "yes|no|maybe"
-            }}
-            
+            description=f"""{_PROCESS_INTERVIEW_INSTRUCTIONS}
             For candidate_responses, extract the values for these fields from the transcription:
             {fields_list}
+
+            TRANSCRIPTION:
+            {transcription}
             """,
             agent=self.agent,
             expected_output="A JSON object with summary, key_points, candidate_responses, strengths, concerns, fit_score (0-100), and recommendation (yes/no/maybe)"
         )
         
         result = task_output_to_str(await run_crew_task_async(task))
-        
-        import json
-        try:
-            if "```json" in result:
-                json_str = result.split("```json")[1].split("```")[0].strip()
-            elif "```" in result:
-                json_str = result.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = result.strip()
-            
-            parsed_data = json.loads(json_str)
+
+        parsed_data = extract_json(result)
+        if isinstance(parsed_data, dict):
             parsed_data["transcription"] = transcription
             return parsed_data
-        except:
-            return {
-                "summary": result[:500] if result else "",
-                "key_points": [],
-                "candidate_responses": {},
-                "strengths": [],
-                "concerns": [],
-                "fit_score": 50,
-                "recommendation": "maybe",
-                "transcription": transcription
+        return {
+            "summary": result[:500] if result else "",
+            "key_points": [],
+            "candidate_responses": {},
+            "strengths": [],
+            "concerns": [],
+            "fit_score": 50,
+            "recommendation": "maybe",
+            "transcription": transcription
+        }
+
+    async def process_interview_and_guidance(self, transcription: str, role_id: str, candidate_id: str,
+                                             candidate: dict, jd: dict = None, briefing: dict = None,
+                                             existing_interview: dict = None, role: dict = None) -> tuple:
+        """Process a transcription and generate guidance concurrently.
+
+        The two LLM calls are independent, so running them via asyncio.gather
+        costs max() of the two latencies instead of their sum.
+        """
+        interview_data, guidance = await asyncio.gather(
+            self.process_interview(transcription, role_id, candidate_id, role),
+            self.generate_guidance(candidate, jd, briefing, transcription, existing_interview, role),
+            return_exceptions=True,
+        )
+        if isinstance(interview_data, BaseException):
+            raise interview_data
+        if isinstance(guidance, BaseException):
+            # Guidance is advisory; don't fail the interview processing over it
+            guidance = {
+                "missing_fields": [],
+                "suggested_questions": [],
+                "behavioral_probes": [],
+                "technical_probes": [],
+                "fitment_notes": []
             }
+        return interview_data, guidance
 
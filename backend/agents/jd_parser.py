@@ -1,83 +1,84 @@
-"""
-JD Parser Agent - Extracts structured information from job descriptions
-"""
-from crewai import Agent, Task
-from langchain_openai import ChatOpenAI
-import os
-from dotenv import load_dotenv
-
-from backend.openai_env import openai_api_key_for_clients
-from backend.agents.crew_compat import run_crew_task_async, task_output_to_str
-
-load_dotenv()
-
-
-class JDParserAgent:
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model_name="gpt-4",
-            temperature=0.3,
-            openai_api_key=openai_api_key_for_clients()
-        )
-        
-        self.agent = Agent(
-            role="JD Parser",
-            goal="Extract structured information from job descriptions including job title, summary, responsibilities, and requirements",
-            backstory="You are an expert at parsing and extracting structured information from job descriptions. You understand the nuances of different job postings and can identify key sections accurately.",
-            llm=self.llm,
-            verbose=True
-        )
-    
-    async def parse_jd(self, pdf_content: str) -> dict:
-        """Parse JD and extract structured information"""
-        task = Task(
-            description=f"""
-            Parse the following job description and extract structured information:
-            
-            {pdf_content}
-            
-            Extract and return a JSON object with the following structure:
-            {{
-                "job_title": "string",
-                "job_summary": "string",
-                "responsibilities": ["string"],
-                "requirements": ["string"],
-                "skills": ["string"],
-                "experience_level": "string",
-                "location": "string",
-                "employment_type": "string"
-            }}
-            """,
-            agent=self.agent,
-            expected_output="A JSON object with job_title, job_summary, responsibilities, requirements, skills, experience_level, location, and employment_type fields"
-        )
-        
-        result = task_output_to_str(await run_crew_task_async(task))
-        
-        # Parse the result (assuming it's JSON)
-        import json
-        try:
-            # Try to extract JSON from the result
-            if "```json" in result:
-                json_str = result.split("```json")[1].split("```")[0].strip()
-            elif "```" in result:
-                json_str = result.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = result.strip()
-            
-            parsed_data = json.loads(json_str)
-            return parsed_data
-        except:
-            # Fallback: return structured dict with raw result
-            return {
-                "job_title": "",
-                "job_summary": result[:500] if result else "",
-                "responsibilities": [],
-                "requirements": [],
-                "skills": [],
-                "experience_level": "",
-                "location": "",
-                "employment_type": "",
-                "raw_content": result
-            }
-
+"""
+JD Parser Agent - Extracts structured information from job descriptions
+"""
+from dotenv import load_dotenv
+
+from backend.openai_env import shared_async_openai
+from backend.agents._response_cache import get_cached, store
+from backend.agents._util import extract_json, truncate_tokens
+
+load_dotenv()
+
+# System prompt replaces the old CrewAI role/goal/backstory; one-shot JSON
+# extraction doesn't need the agent scratchpad/tool loop, so the call goes
+# straight to the chat completions API (natively awaitable, no to_thread).
+_SYSTEM_PROMPT = (
+    "You are an expert at parsing and extracting structured information from job "
+    "descriptions. You understand the nuances of different job postings and can "
+    "identify key sections accurately."
+)
+
+# Static instruction prefix. Kept byte-identical across calls (dynamic PDF text
+# goes after it) so OpenAI's automatic prompt caching can hit on the prefix.
+_PARSE_JD_INSTRUCTIONS = """
+            Parse the job description below and extract structured information.
+            Respond ONLY with a JSON object.
+
+            Extract and return a JSON object with the following structure:
+            {
+                "job_title": "string",
+                "job_summary": "string",
+                "responsibilities": ["string"],
+                "requirements": ["string"],
+                "skills": ["string"],
+                "experience_level": "string",
+                "location": "string",
+                "employment_type": "string"
+            }
+            """
+
+
+class JDParserAgent:
+    def __init__(self):
+        # gpt-4o-mini: structured extraction needs schema-following, not prose
+        # quality; json_mode guarantees parseable output at a fraction of the cost
+        self.client = shared_async_openai()
+        self.model = "gpt-4o-mini"
+        self.temperature = 0.3
+
+    async def parse_jd(self, pdf_content: str) -> dict:
+        """Parse JD and extract structured information"""
+        pdf_content = truncate_tokens(pdf_content, 6000)
+        # Re-uploads of the same PDF are common; identical input + model
+        # deterministically yields an equivalent parse, so serve it from cache.
+        cached = get_cached(self.model, pdf_content)
+        if cached is not None:
+            return cached
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            temperature=self.temperature,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": f"{_PARSE_JD_INSTRUCTIONS}\n            JOB DESCRIPTION:\n            {pdf_content}\n            "},
+            ],
+        )
+        result = response.choices[0].message.content or ""
+
+        parsed_data = extract_json(result)
+        if parsed_data is not None:
+            if isinstance(parsed_data, dict):
+                store(self.model, pdf_content, parsed_data)
+            return parsed_data
+        # Fallback: return structured dict with raw result (not cached)
+        return {
+            "job_title": "",
+            "job_summary": result[:500] if result else "",
+            "responsibilities": [],
+            "requirements": [],
+            "skills": [],
+            "experience_level": "",
+            "location": "",
+            "employment_type": "",
+            "raw_content": result
+        }
@@ -1,161 +1,240 @@
-"""
-Outreach Writer Agent - Generates deeply personalized outreach messages for candidates
-"""
-from crewai import Agent, Task
-from langchain_openai import ChatOpenAI
-import os
-from dotenv import load_dotenv
-
-from backend.openai_env import openai_api_key_for_clients
-from backend.agents.crew_compat import run_crew_task_async, task_output_to_str
-
-load_dotenv()
-
-
-class OutreachWriterAgent:
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model_name="gpt-4",
-            temperature=0.8,
-            openai_api_key=openai_api_key_for_clients()
-        )
-        
-        self.agent = Agent(
-            role="Senior Recruiter & Outreach Specialist",
-            goal="Craft highly personalized, thoughtful outreach that sounds like it was written by a human recruiter who has genuinely studied the candidate—never generic or template-like.",
-            backstory="""You are an experienced recruiter who takes pride in writing outreach that candidates actually want to read.
-            You avoid clichés like 'I came across your profile' or 'I hope this finds you well.' You reference specific details:
-            projects, achievements, career moves, or skills that show you've actually read their background.
-            Your messages feel like a thoughtful note from a real person, not a mass email. You never sound salesy or robotic.""",
-            llm=self.llm,
-            verbose=True
-        )
-    
-    async def generate_outreach(
-        self,
-        role: dict,
-        candidate: dict,
-        jd: dict = None,
-        briefing: dict = None,
-        recruiter_notes: str = "",
-    ) -> str:
-        """Generate deeply personalized outreach message"""
-        jd_text = ""
-        if jd:
-            reqs = jd.get("requirements", [])
-            if isinstance(reqs, list):
-                reqs = ", ".join(str(r) for r in reqs)
-            jd_text = f"""
-            Job Title: {jd.get('job_title', '')}
-            Summary: {jd.get('job_summary', '')}
-            Requirements: {reqs}
-            """
-        
-        briefing_text = ""
-        if briefing:
-            ef = briefing.get("extracted_fields", {}) or {}
-            if not isinstance(ef, dict):
-                ef = {}
-            briefing_text = f"""
-            HR Briefing (use for context, priorities, team fit):
-            Summary: {briefing.get('summary') or ''}
-            Key points: {ef}
-            """
-        
-        insights = candidate.get("parsed_insights", {}) or {}
-        if not isinstance(insights, dict):
-            insights = {}
-        insights_text = "\n".join(f"  - {k}: {v}" for k, v in insights.items() if v)
-        
-        recruiter_hints = ""
-        if recruiter_notes and recruiter_notes.strip():
-            recruiter_hints = f"""
-            Recruiter's personal notes / customization hints (incorporate these naturally):
-            {recruiter_notes.strip()}
-            """
-        
-        skills_list = candidate.get("skills") or []
-        if not isinstance(skills_list, list):
-            skills_list = []
-        skill_bits = [str(s) if not isinstance(s, dict) else str(s.get("name", s)) for s in skills_list[:15]]
-
-        task = Task(
-            description=f"""
-            Write a personalized outreach message for this candidate. The message must sound like it was crafted by a real recruiter who has studied their profile—NOT a generic template.
-
-            CANDIDATE (study these details; reference specifics):
-            Name: {candidate.get('name') or ''}
-            Summary: {(candidate.get('summary') or '')[:2000]}
-            Experience: {(candidate.get('experience') or '')[:500]}...
-            Skills: {', '.join(skill_bits)}
-            Parsed insights:
-            {insights_text}
-
-            ROLE: {role.get('title', '')}
-            {jd_text}
-            {briefing_text}
-            {recruiter_hints}
-
-            REQUIREMENTS (strict):
-            - Reference at least one SPECIFIC thing from their profile (project, role, skill, achievement)—show you've read it
-            - NO generic openers: avoid "I came across your profile", "I hope this finds you well", "I was impressed by"
-            - Write 2-3 short paragraphs, conversational tone
-            - Sound like a human, not a bot. Vary sentence structure.
-            - End with a clear, low-pressure ask (e.g. open to a quick chat?)
-            - Return ONLY the message text, no subject line, no JSON, no formatting
-            """,
-            agent=self.agent,
-            expected_output="A personalized outreach message as plain text (2-3 paragraphs)"
-        )
-        
-        result = task_output_to_str(await run_crew_task_async(task))
-        return result.strip()
-
-    async def generate_recruiter_notes(
-        self,
-        role: dict,
-        candidate: dict,
-        jd: dict = None,
-        briefing: dict = None,
-    ) -> str:
-        """Generate suggested recruiter notes / customization hints for outreach"""
-        jd_text = ""
-        if jd and isinstance(jd, dict):
-            jsum = jd.get("job_summary") or ""
-            jd_text = f"Role: {role.get('title') or ''}. JD: {jd.get('job_title') or ''} - {jsum[:200]}"
-        briefing_text = ""
-        if briefing and isinstance(briefing, dict):
-            briefing_text = (briefing.get("summary") or "")[:300]
-        insights = candidate.get("parsed_insights", {}) or {}
-        if not isinstance(insights, dict):
-            insights = {}
-        insights_text = ", ".join(
-            f"{k}: {v}" for k, v in list(insights.items())[:5] if v
-        )
-        skills_list = candidate.get("skills") or []
-        if not isinstance(skills_list, list):
-            skills_list = []
-        skill_bits = [str(s) if not isinstance(s, dict) else str(s.get("name", s)) for s in skills_list[:10]]
-
-        task = Task(
-            description=f"""
-            A recruiter is about to write outreach to this candidate. Suggest 2-4 brief, actionable notes they could add to personalize the message.
-            Output as a short bullet list or comma-separated hints. Be specific to this candidate.
-
-            Candidate: {candidate.get('name') or ''}
-            Summary: {(candidate.get('summary') or '')[:300]}
-            Experience: {(candidate.get('experience') or '')[:300]}
-            Skills: {', '.join(skill_bits)}
-            Insights: {insights_text}
-
-            {jd_text}
-            {f"HR context: {briefing_text}" if briefing_text else ""}
-
-            Return ONLY the suggested notes (2-4 short bullets or phrases), no preamble.
-            """,
-            agent=self.agent,
-            expected_output="2-4 short personalization hints as plain text",
-        )
-        result = task_output_to_str(await run_crew_task_async(task))
-        return result.strip()
-
+"""
+Outreach Writer Agent - Generates deeply personalized outreach messages for candidates
+"""
+from typing import AsyncIterator
+
+from crewai import Agent, Task
+from langchain_openai import ChatOpenAI
+import os
+from dotenv import load_dotenv
+
+from backend.openai_env import openai_api_key_for_clients, shared_http_clients
+from backend.agents.crew_compat import run_crew_task_async, task_output_to_str
+from backend.agents._prompt_context import PromptContext, get_prompt_context
+from backend.agents._throttle import estimate_tokens, limiter
+from backend.agents._util import extract_json, truncate_tokens_cached
+
+load_dotenv()
+
+_http_client, _http_async_client = shared_http_clients()
+
+
+def _recruiter_hints(recruiter_notes: str) -> str:
+    if not recruiter_notes or not recruiter_notes.strip():
+        return ""
+    return f"""
+            Recruiter's personal notes / customization hints (incorporate these naturally):
+            {recruiter_notes.strip()}
+            """
+
+
+def _candidate_profile(candidate: dict) -> str:
+    insights = candidate.get("parsed_insights", {}) or {}
+    if not isinstance(insights, dict):
+        insights = {}
+    insights_text = "\n".join(f"  - {k}: {v}" for k, v in insights.items() if v)
+
+    skills_list = candidate.get("skills") or []
+    if not isinstance(skills_list, list):
+        skills_list = []
+    skill_bits = [str(s) if not isinstance(s, dict) else str(s.get("name", s)) for s in skills_list[:15]]
+
+    # Token-based budgets: char slices over- or under-shoot the intended
+    # prompt size depending on the text (and the same profile is trimmed
+    # repeatedly across outreach + notes, so the trim is cached).
+    return f"""Name: {candidate.get('name') or ''}
+            Summary: {truncate_tokens_cached(candidate.get('summary') or '', 500)}
+            Experience: {truncate_tokens_cached(candidate.get('experience') or '', 200)}...
+            Skills: {', '.join(skill_bits)}
+            Parsed insights:
+            {insights_text}"""
+
+
+_OUTREACH_RULES = """
+            REQUIREMENTS (strict):
+            - Reference at least one SPECIFIC thing from their profile (project, role, skill, achievement)—show you've read it
+            - NO generic openers: avoid "I came across your profile", "I hope this finds you well", "I was impressed by"
+            - Write 2-3 short paragraphs, conversational tone
+            - Sound like a human, not a bot. Vary sentence structure.
+            - End with a clear, low-pressure ask (e.g. open to a quick chat?)
+            """
+
+
+class OutreachWriterAgent:
+    def __init__(self):
+        self.llm = ChatOpenAI(
+            model_name="gpt-4",
+            temperature=0.8,
+            openai_api_key=openai_api_key_for_clients(),
+            http_client=_http_client,
+            http_async_client=_http_async_client,
+        )
+        
+        self.agent = Agent(
+            role="Senior Recruiter & Outreach Specialist",
+            goal="Craft highly personalized, thoughtful outreach that sounds like it was written by a human recruiter who has genuinely studied the candidate—never generic or template-like.",
+            backstory="""You are an experienced recruiter who takes pride in writing outreach that candidates actually want to read.
+            You avoid clichés like 'I came across your profile' or 'I hope this finds you well.' You reference specific details:
+            projects, achievements, career moves, or skills that show you've actually read their background.
+            Your messages feel like a thoughtful note from a real person, not a mass email. You never sound salesy or robotic.""",
+            llm=self.llm,
+            verbose=True
+        )
+    
+    async def generate_outreach(
+        self,
+        role: dict,
+        candidate: dict,
+        jd: dict = None,
+        briefing: dict = None,
+        recruiter_notes: str = "",
+        context: PromptContext = None,
+    ) -> str:
+        """Generate deeply personalized outreach message"""
+        messages = await self.generate_outreach_batch(role, [candidate], jd, briefing, recruiter_notes, context)
+        return messages[0]
+
+    async def generate_outreach_batch(
+        self,
+        role: dict,
+        candidates: list,
+        jd: dict = None,
+        briefing: dict = None,
+        recruiter_notes: str = "",
+        context: PromptContext = None,
+    ) -> list:
+        """Generate personalized outreach for several candidates in one LLM call.
+
+        The role/JD/briefing prefix is identical across candidates in a role, so
+        batching amortizes it and saves a round trip per candidate. Keep batches
+        to ~8-16 candidates: larger batches risk context limits and quality drops.
+        Returns one message per candidate, in input order ("" if missing).
+        """
+        if not candidates:
+            return []
+
+        ctx = context or get_prompt_context(role, jd, briefing)
+        candidate_blocks = [
+            f"""
+            <CAND id={idx}>
+            {_candidate_profile(candidate)}
+            </CAND>
+            """
+            for idx, candidate in enumerate(candidates, 1)
+        ]
+
+        task = Task(
+            description=f"""
+            Write a personalized outreach message for EACH of the {len(candidates)} candidates below. Every message must sound like it was crafted by a real recruiter who has studied that candidate's profile—NOT a generic template.
+
+            ROLE: {ctx.role_title}
+            {ctx.jd_text}
+            {ctx.briefing_text}
+            {_recruiter_hints(recruiter_notes)}
+
+            CANDIDATES (study each; reference specifics):
+            {''.join(candidate_blocks)}
+            {_OUTREACH_RULES}
+            - Vary sentence structure across candidates.
+            - Return ONLY a JSON array, one object per candidate: [{{"id": 1, "message": "..."}}, ...]
+            """,
+            agent=self.agent,
+            expected_output='A JSON array of {"id": <candidate id>, "message": "<outreach text>"} objects'
+        )
+
+        await limiter.acquire(estimate_tokens(task.description))
+        result = task_output_to_str(await run_crew_task_async(task))
+        messages = [""] * len(candidates)
+        parsed = extract_json(result)
+        if isinstance(parsed, list):
+            for entry in parsed:
+                if isinstance(entry, dict):
+                    i = entry.get("id")
+                    if isinstance(i, int) and 1 <= i <= len(candidates):
+                        messages[i - 1] = str(entry.get("message") or "").strip()
+        elif len(candidates) == 1:
+            # Single-candidate call and the model skipped the JSON wrapper
+            messages[0] = result.strip()
+        return messages
+
+    async def stream_outreach(
+        self,
+        role: dict,
+        candidate: dict,
+        jd: dict = None,
+        briefing: dict = None,
+        recruiter_notes: str = "",
+        context: PromptContext = None,
+    ) -> AsyncIterator[str]:
+        """Stream a single outreach message as token deltas.
+
+        Bypasses the CrewAI Task wrapper and calls the chat model directly so
+        the UI can render tokens as they arrive; perceived latency drops to
+        time-to-first-token instead of time-to-last-token.
+        """
+        ctx = context or get_prompt_context(role, jd, briefing)
+        prompt = f"""
+            Write a personalized outreach message for this candidate. The message must sound like it was crafted by a real recruiter who has studied their profile—NOT a generic template.
+
+            CANDIDATE (study these details; reference specifics):
+            {_candidate_profile(candidate)}
+
+            ROLE: {ctx.role_title}
+            {ctx.jd_text}
+            {ctx.briefing_text}
+            {_recruiter_hints(recruiter_notes)}
+            {_OUTREACH_RULES}
+            - Return ONLY the message text, no subject line, no JSON, no formatting
+            """
+        async for chunk in self.llm.astream(prompt):
+            if chunk.content:
+                yield chunk.content
+
+    async def generate_recruiter_notes(
+        self,
+        role: dict,
+        candidate: dict,
+        jd: dict = None,
+        briefing: dict = None,
+    ) -> str:
+        """Generate suggested recruiter notes / customization hints for outreach"""
+        jd_text = ""
+        if jd and isinstance(jd, dict):
+            jsum = jd.get("job_summary") or ""
+            jd_text = f"Role: {role.get('title') or ''}. JD: {jd.get('job_title') or ''} - {truncate_tokens_cached(jsum, 80)}"
+        briefing_text = ""
+        if briefing and isinstance(briefing, dict):
+            briefing_text = truncate_tokens_cached(briefing.get("summary") or "", 100)
+        insights = candidate.get("parsed_insights", {}) or {}
+        if not isinstance(insights, dict):
+            insights = {}
+        insights_text = ", ".join(
+            f"{k}: {v}" for k, v in list(insights.items())[:5] if v
+        )
+        skills_list = candidate.get("skills") or []
+        if not isinstance(skills_list, list):
+            skills_list = []
+        skill_bits = [str(s) if not isinstance(s, dict) else str(s.get("name", s)) for s in skills_list[:10]]
+
+        task = Task(
+            description=f"""
+            A recruiter is about to write outreach to this candidate. Suggest 2-4 brief, actionable notes they could add to personalize the message.
+            Output as a short bullet list or comma-separated hints. Be specific to this candidate.
+
+            Candidate: {candidate.get('name') or ''}
+            Summary: {truncate_tokens_cached(candidate.get('summary') or '', 150)}
+            Experience: {truncate_tokens_cached(candidate.get('experience') or '', 150)}
+            Skills: {', '.join(skill_bits)}
+            Insights: {insights_text}
+
+            {jd_text}
+            {f"HR context: {briefing_text}" if briefing_text else ""}
+
+            Return ONLY the suggested notes (2-4 short bullets or phrases), no preamble.
+            """,
+            agent=self.agent,
+            expected_output="2-4 short personalization hints as plain text",
+        )
+        result = task_output_to_str(await run_crew_task_async(task))
+        return result.strip()
+
@@ -1,33 +1,54 @@
 """
 Simulation Agent - Simulates candidate replies and generates mock interview audio
 """
-from crewai import Agent, Task
-from langchain_openai import ChatOpenAI
-import os
 from dotenv import load_dotenv
 
-from backend.openai_env import openai_api_key_for_clients
-from backend.agents.crew_compat import run_crew_task_async
+from backend.openai_env import shared_async_openai
+from backend.agents._util import extract_json
 
 load_dotenv()
 
+# System prompt replaces the old CrewAI role/goal/backstory; a simulated reply
+# is one prompt -> one JSON answer, so the call goes straight to the chat
+# completions API.
+_SYSTEM_PROMPT = (
+    "You are an expert at simulating candidate behavior. You can generate "
+    "realistic, varied responses that mimic how different candidates would reply "
+    "to recruitment outreach."
+)
+
+# Static instruction prefix. Dynamic candidate/outreach/sentiment details come
+# after it so OpenAI prompt caching can hit on the byte-identical prefix.
+_CANDIDATE_REPLY_INSTRUCTIONS = """
+            Generate a realistic candidate email reply to the recruitment outreach message below.
+
+            The reply should:
+            1. Be professional and natural
+            2. Match the candidate's profile and experience level
+            3. Reflect the requested sentiment appropriately
+            4. Be 2-4 sentences long
+            5. Include appropriate email formatting
+
+            Return a JSON object:
+            {
+                "subject": "string",
+                "body": "string"
+            }
+            """
+
+_SENTIMENT_MAP = {
+    "positive": "enthusiastic and interested",
+    "neutral": "cautious but open to discussion",
+    "negative": "polite but not interested"
+}
+
 
 class SimulationAgent:
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model_name="gpt-4",
-            temperature=0.8,
-            openai_api_key=openai_api_key_for_clients()
-        )
-        
-        self.agent = Agent(
-            role="Candidate Simulator",
-            goal="Simulate realistic candidate responses to outreach messages and generate mock interview content",
-            backstory="You are an expert at simulating candidate behavior. You can generate realistic, varied responses that mimic how different candidates would reply to recruitment outreach.",
-            llm=self.llm,
-            verbose=True
-        )
-    
+        self.client = shared_async_openai()
+        self.model = "gpt-4"
+        self.temperature = 0.8
+
     async def generate_candidate_reply(self, simulation_params: dict) -> dict:
         """Generate simulated candidate reply"""
         candidate_name = simulation_params.get("candidate_name", "Candidate")
@@ -35,80 +56,43 @@ class SimulationAgent:
         outreach_message = simulation_params.get("outreach_message", "")
         reply_type = simulation_params.get("reply_type", "positive")  # positive, neutral, negative
         delay_days = simulation_params.get("delay_days", 0)
-        
-        sentiment_map = {
-            "positive": "enthusiastic and interested",
-            "neutral": "cautious but open to discussion",
-            "negative": "polite but not interested"
-        }
-        
-        task = Task(
-            description=f"""
-            Generate a realistic candidate email reply to a recruitment outreach message.
-            
+
+        user_prompt = f"""{_CANDIDATE_REPLY_INSTRUCTIONS}
             Candidate Name: {candidate_name}
             Candidate Profile: {candidate_profile}
-            
+
             Original Outreach Message:
             {outreach_message}
-            
-            Generate a reply that is {sentiment_map.get(reply_type, 'neutral')}.
-            
-            The reply should:
-            1. Be professional and natural
-            2. Match the candidate's profile and experience level
-            3. Reflect the {reply_type} sentiment appropriately
-            4. Be 2-4 sentences long
-            5. Include appropriate email formatting
-            
-            Return a JSON object:
-            {{
-                "subject": "string",
-                "body": "string",
-                "sentiment": "{reply_type}",
-                "delay_days": {delay_days}
-            }}
-            """,
-            agent=self.agent,
-            expected_output="A JSON object with subject, body (2-4 sentences), sentiment, and delay_days fields"
-        )
-        
-        result = await run_crew_task_async(task)
-        # CrewAI may return TaskOutput or string; get string content
-        if result is None:
-            result_str = ""
-        elif isinstance(result, str):
-            result_str = result
-        elif hasattr(result, "raw"):
-            result_str = getattr(result, "raw", "") or ""
-        elif hasattr(result, "result"):
-            result_str = getattr(result, "result", "") or ""
-        elif hasattr(result, "output"):
-            result_str = getattr(result, "output", "") or ""
-        else:
-            result_str = str(result)
 
-        import json
-        try:
-            if "```json" in result_str:
-                json_str = result_str.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_str:
-                json_str = result_str.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = result_str.strip()
-            if not json_str:
-                raise ValueError("Empty JSON")
-            return json.loads(json_str)
-        except Exception:
-            body = result_str.strip() if result_str else (
-                "Thank you for reaching out. I'm very interested in learning more."
-                if reply_type == "positive" else
-                "Thank you for reaching out. I'm not looking to make a change at this time."
-            )
-            return {
-                "subject": f"Re: {(outreach_message[:50] + '...') if len(outreach_message or '') > 50 else (outreach_message or 'Your outreach')}",
-                "body": body,
-                "sentiment": reply_type,
-                "delay_days": delay_days
-            }
+            Generate a reply that is {_SENTIMENT_MAP.get(reply_type, 'neutral')}.
+            """
 
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            temperature=self.temperature,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+        )
+        result_str = response.choices[0].message.content or ""
+
+        parsed_data = extract_json(result_str)
+        if isinstance(parsed_data, dict):
+            # sentiment/delay_days are known inputs; set them here instead of
+            # round-tripping them through the model
+            parsed_data.setdefault("sentiment", reply_type)
+            parsed_data.setdefault("delay_days", delay_days)
+            return parsed_data
+        body = result_str.strip() if result_str else (
+            "Thank you for reaching out. I'm very interested in learning more."
+            if reply_type == "positive" else
+            "Thank you for reaching out. I'm not looking to make a change at this time."
+        )
+        subject_stub = (outreach_message or "Your outreach")[:50]
+        return {
+            "subject": f"Re: {subject_stub}{'...' if len(outreach_message or '') > 50 else ''}",
+            "body": body,
+            "sentiment": reply_type,
+            "delay_days": delay_days
+        }
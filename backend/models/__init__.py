@@ -8,5 +8,6 @@ from .role_hr_briefings import RoleHRBriefing
 from .evaluation_chats import EvaluationChat
 from .consent_templates import ConsentTemplate
 from .users import User
+from .llm_cache import LLMResponseCache
 
-__all__ = ["Base", "Role", "Candidate", "Interview", "JobDescription", "HRBriefing", "RoleHRBriefing", "EvaluationChat", "ConsentTemplate", "User"]
\ No newline at end of file
+__all__ = ["Base", "Role", "Candidate", "Interview", "JobDescription", "HRBriefing", "RoleHRBriefing", "EvaluationChat", "ConsentTemplate", "User", "LLMResponseCache"]
\ No newline at end of file
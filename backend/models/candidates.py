@@ -1,36 +1,50 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, JSON, DateTime
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from typing import Optional
+
+from sqlalchemy import Boolean, CheckConstraint, ForeignKey, Index, String, Text, JSON, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from backend.db.db import Base
-from pydantic import BaseModel
+from backend.models.mixins import TimestampMixin
+
 
-class Candidate(Base):
+class Candidate(TimestampMixin, Base):
     __tablename__ = "candidates"
-    
-    id = Column(String(36), primary_key=True)
-    role_id = Column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), nullable=False)
-    name = Column(String(500), default="")
-    summary = Column(Text, default="")
-    skills = Column(Text, default="[]")
-    experience = Column(Text, default="")
-    parsed_insights = Column(Text, default="{}")
-    column = Column(String(50), default="outreach")
-    color = Column(String(50), default="amber-transparent")
-    created_at = Column(String(50))
-    updated_at = Column(String(50))
-    outreach_sent = Column(Boolean, default=False)
-    outreach_message = Column(Text, nullable=True)
-    checklist = Column(Text, default="{}")
-    consent_form_sent = Column(Boolean, default=False)
-    consent_form_received = Column(Boolean, default=False)
-    email_status = Column(String(100), nullable=True)
-    not_pushing_forward = Column(Boolean, default=False)
-    sent_to_client = Column(Boolean, default=False)
-    consent_email = Column(Text, nullable=True)
-    consent_reply = Column(Text, nullable=True)
-    simulated_email = Column(Text, nullable=True)
-    outreach_reply = Column(Text, nullable=True)
-    resume_file_path = Column(String(1000), nullable=True)
+    __table_args__ = (
+        # Kanban board filters by role + column; dashboards sort by recency within a role
+        Index("ix_candidates_role_column", "role_id", "column"),
+        Index("ix_candidates_role_updated", "role_id", "updated_at"),
+        # Evaluation is the hottest stage (evaluate endpoint scans it per chat turn);
+        # a partial index keeps that lookup to just the rows on that board column.
+        Index(
+            "ix_candidates_evaluation_stage",
+            "role_id",
+            sqlite_where=text("\"column\" = 'evaluation'"),
+            postgresql_where=text("\"column\" = 'evaluation'"),
+        ),
+        CheckConstraint("\"column\" IN ('outreach', 'follow-up', 'evaluation')", name="ck_candidate_column"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    role_id: Mapped[str] = mapped_column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), nullable=False)
+    name: Mapped[Optional[str]] = mapped_column(String(500), default="")
+    summary: Mapped[Optional[str]] = mapped_column(Text, default="")
+    skills: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    experience: Mapped[Optional[str]] = mapped_column(Text, default="")
+    parsed_insights: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    column: Mapped[Optional[str]] = mapped_column(String(50), default="outreach")
+    color: Mapped[Optional[str]] = mapped_column(String(50), default="amber-transparent")
+    outreach_sent: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    outreach_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    checklist: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    consent_form_sent: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    consent_form_received: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    email_status: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    not_pushing_forward: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    sent_to_client: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    consent_email: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    consent_reply: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    simulated_email: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    outreach_reply: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    resume_file_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
 
     role = relationship("Role", back_populates="candidates")
-    interview = relationship("Interview", back_populates="candidate", uselist=False, cascade="all, delete-orphan")
\ No newline at end of file
+    interview = relationship("Interview", back_populates="candidate", uselist=False, cascade="all, delete-orphan")
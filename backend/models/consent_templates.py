@@ -1,11 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, JSON
+from typing import Optional
+
+from sqlalchemy import String, Text
+from sqlalchemy.orm import Mapped, mapped_column
 from backend.db.db import Base
+from backend.models.mixins import TimestampMixin
+
 
-class ConsentTemplate(Base):
+class ConsentTemplate(TimestampMixin, Base):
     __tablename__ = "consent_templates"
-    
-    id = Column(String(36), primary_key=True)
-    name = Column(String(500), default="")
-    content = Column(Text, default="")
-    created_at = Column(String(50))
-    updated_at = Column(String(50))
\ No newline at end of file
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    name: Mapped[Optional[str]] = mapped_column(String(500), default="")
+    content: Mapped[Optional[str]] = mapped_column(Text, default="")
@@ -1,12 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, UniqueConstraint
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from typing import Optional
+
+from sqlalchemy import ForeignKey, String, JSON
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from backend.db.db import Base
 
+
 class EvaluationChat(Base):
     __tablename__ = "evaluation_chats"
-    role_id = Column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
-    messages = Column(Text, default="[]")
-    updated_at = Column(String(50))
 
-    role = relationship("Role", back_populates="evaluation_chat")
\ No newline at end of file
+    role_id: Mapped[str] = mapped_column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
+    messages: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    updated_at: Mapped[Optional[str]] = mapped_column(String(50), index=True)
+
+    role = relationship("Role", back_populates="evaluation_chat")
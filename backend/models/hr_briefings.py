@@ -1,13 +1,16 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, UniqueConstraint
-from sqlalchemy.sql import func
+from typing import Optional
+
+from sqlalchemy import String, Text, JSON
+from sqlalchemy.orm import Mapped, mapped_column
 from backend.db.db import Base
 
+
 class HRBriefing(Base):
     __tablename__ = "hr_briefings"
-    
-    id = Column(String(36), primary_key=True)
-    summary = Column(Text, default="")
-    extracted_fields = Column(Text, default="{}")
-    transcription = Column(Text, default="")
-    created_at = Column(String(50))
-    audio_file_path = Column(String(1000), nullable=True)
\ No newline at end of file
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    summary: Mapped[Optional[str]] = mapped_column(Text, default="")
+    extracted_fields: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    transcription: Mapped[Optional[str]] = mapped_column(Text, default="")
+    created_at: Mapped[Optional[str]] = mapped_column(String(50))
+    audio_file_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
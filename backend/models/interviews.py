@@ -1,25 +1,34 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, ForeignKey, JSON, UniqueConstraint
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from typing import Optional
+
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Text, UniqueConstraint, JSON
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from backend.db.db import Base
+from backend.models.mixins import TimestampMixin
+
 
-class Interview(Base):
+class Interview(TimestampMixin, Base):
     __tablename__ = "interviews"
-    __table_args__ = (UniqueConstraint("role_id", "candidate_id", name="uq_interview_role_candidate"),)
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    role_id = Column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), nullable=False)
-    candidate_id = Column(String(36), ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False)
-    summary = Column(Text, default="")
-    transcription = Column(Text, default="")
-    fit_score = Column(Integer, nullable=True)
-    key_points = Column(Text, default="[]")
-    strengths = Column(Text, default="[]")
-    concerns = Column(Text, default="[]")
-    recommendation = Column(String(50), nullable=True)
-    candidate_responses = Column(Text, default="{}")
-    interview_completed = Column(Boolean, default=True)
-    created_at = Column(String(50))
-    updated_at = Column(String(50))
-    audio_file_path = Column(String(1000), nullable=True)
+    __table_args__ = (
+        UniqueConstraint("role_id", "candidate_id", name="uq_interview_role_candidate"),
+        # The unique constraint's index already covers role_id-prefixed lookups;
+        # these cover fetch-by-candidate and the role dashboard's
+        # recommendation/fit_score listing without touching the table.
+        Index("ix_interviews_candidate_id", "candidate_id"),
+        Index("ix_interviews_role_recommendation", "role_id", "recommendation", "fit_score"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    role_id: Mapped[str] = mapped_column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), nullable=False)
+    candidate_id: Mapped[str] = mapped_column(String(36), ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False)
+    summary: Mapped[Optional[str]] = mapped_column(Text, default="")
+    transcription: Mapped[Optional[str]] = mapped_column(Text, default="")
+    fit_score: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    key_points: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    strengths: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    concerns: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    recommendation: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    candidate_responses: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    interview_completed: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    audio_file_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
 
-    candidate = relationship("Candidate", back_populates="interview")
\ No newline at end of file
+    candidate = relationship("Candidate", back_populates="interview")
@@ -1,15 +1,19 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from typing import Optional
+
+from sqlalchemy import ForeignKey, String, Text, JSON
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from backend.db.db import Base
 
+
 class JobDescription(Base):
     __tablename__ = "job_descriptions"
-    role_id = Column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
-    job_title = Column(String(500), default="")
-    job_summary = Column(Text, default="")
-    responsibilities = Column(Text, default="[]")
-    requirements = Column(Text, default="[]")
-    skills = Column(Text, default="[]")
-    jd_file_path = Column(String(1000), nullable=True)
-
-    role = relationship("Role", back_populates="jd")
\ No newline at end of file
+
+    role_id: Mapped[str] = mapped_column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
+    job_title: Mapped[Optional[str]] = mapped_column(String(500), default="")
+    job_summary: Mapped[Optional[str]] = mapped_column(Text, default="")
+    responsibilities: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    requirements: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    skills: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    jd_file_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+
+    role = relationship("Role", back_populates="jd")
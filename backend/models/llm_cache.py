@@ -0,0 +1,20 @@
+from typing import Optional
+
+from sqlalchemy import String, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+from backend.db.db import Base
+
+
+class LLMResponseCache(Base):
+    """Content-addressed cache of structured LLM extraction results.
+
+    JD parsing and briefing extraction are functions of (input text, model);
+    re-running them on identical input burns a full API call for the same
+    answer. No TTL: input+model uniquely determine the row.
+    """
+    __tablename__ = "llm_response_cache"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    response: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[Optional[str]] = mapped_column(String(50))
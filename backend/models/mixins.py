@@ -0,0 +1,16 @@
+from typing import Optional
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class TimestampMixin:
+    """Shared created_at/updated_at columns.
+
+    Stored as ISO-8601 strings because every writer uses
+    datetime.now().isoformat() and the API/frontend exchange them verbatim;
+    ISO strings also sort correctly for ORDER BY.
+    """
+
+    created_at: Mapped[Optional[str]] = mapped_column(String(50))
+    updated_at: Mapped[Optional[str]] = mapped_column(String(50))
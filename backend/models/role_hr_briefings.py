@@ -1,9 +1,18 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, UniqueConstraint
-from sqlalchemy.sql import func
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from backend.db.db import Base
 
+
 class RoleHRBriefing(Base):
     __tablename__ = "role_hr_briefings"
-    
-    role_id = Column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
-    briefing_id = Column(String(36), ForeignKey("hr_briefings.id", ondelete="CASCADE"), primary_key=True)
\ No newline at end of file
+    __table_args__ = (
+        # The composite PK covers role_id-prefixed lookups; this covers the
+        # reverse direction (links by briefing) used when listing briefings
+        # and replacing a briefing's role assignments.
+        Index("ix_role_hr_briefings_briefing_id", "briefing_id"),
+    )
+
+    role_id: Mapped[str] = mapped_column(String(36), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True)
+    briefing_id: Mapped[str] = mapped_column(String(36), ForeignKey("hr_briefings.id", ondelete="CASCADE"), primary_key=True)
+
+    role = relationship("Role", back_populates="hr_briefing_links")
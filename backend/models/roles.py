@@ -1,23 +1,26 @@
-from sqlalchemy import Column, Float, Integer, String, Text, DateTime, JSON, ForeignKey
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from typing import Optional
+
+from sqlalchemy import Float, Integer, String, JSON
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from backend.db.db import Base
+from backend.models.mixins import TimestampMixin
+
 
-class Role(Base):
+class Role(TimestampMixin, Base):
     __tablename__ = "roles"
-    id = Column(String(36), primary_key=True)
-    title = Column(String(500), default="")
-    status = Column(String(50), default="New")
-    created_at = Column(String(50))
-    updated_at = Column(String(50))
-    hiring_budget = Column(Float, nullable=True)
-    vacancies = Column(Integer, nullable=True)
-    urgency = Column(String(100), nullable=True)
-    timeline = Column(String(200), nullable=True)
-    candidate_requirement_fields = Column(Text, default="[]")
-    evaluation_criteria = Column(Text, default="[]")
-    created_by_user_id = Column(String(255), nullable=True)
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    title: Mapped[Optional[str]] = mapped_column(String(500), default="")
+    status: Mapped[Optional[str]] = mapped_column(String(50), default="New")
+    hiring_budget: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    vacancies: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    urgency: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    timeline: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    candidate_requirement_fields: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    evaluation_criteria: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    created_by_user_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     candidates = relationship("Candidate", back_populates="role", cascade="all, delete-orphan")
     jd = relationship("JobDescription", back_populates="role", uselist=False, cascade="all, delete-orphan")
-    evaluation_chat = relationship("EvaluationChat", back_populates="role", uselist=False, cascade="all, delete-orphan")
\ No newline at end of file
+    evaluation_chat = relationship("EvaluationChat", back_populates="role", uselist=False, cascade="all, delete-orphan")
+    hr_briefing_links = relationship("RoleHRBriefing", back_populates="role", cascade="all, delete-orphan")
@@ -1,11 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, JSON
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
 from backend.db.db import Base
 
+
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    password_hash = Column(String(255), nullable=False)
-    role = Column(String(20), default="user", nullable=False)
-    created_at = Column(String(50), nullable=False)
\ No newline at end of file
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    role: Mapped[str] = mapped_column(String(20), default="user", nullable=False)
+    created_at: Mapped[str] = mapped_column(String(50), nullable=False)
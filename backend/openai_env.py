@@ -1,6 +1,67 @@
 """Shared OpenAI key resolution for LangChain clients (allows app boot without a key)."""
 import os
 
+import httpx
+
+_http_client = None
+_http_async_client = None
+
+
+def shared_http_clients() -> tuple:
+    """One pooled (sync, async) httpx client pair for all ChatOpenAI instances.
+
+    Each ChatOpenAI otherwise builds its own httpx client, so five agents
+    meant five connection pools and a fresh TCP+TLS handshake per idle pool.
+    Sharing the pair keeps connections warm across agents and calls.
+    """
+    global _http_client, _http_async_client
+    if _http_client is None:
+        limits = httpx.Limits(max_keepalive_connections=20)
+        _http_client = httpx.Client(limits=limits)
+        _http_async_client = httpx.AsyncClient(limits=limits)
+    return _http_client, _http_async_client
+
+
+_sync_openai = None
+
+
+def shared_openai():
+    """One sync OpenAI client for blocking call sites (e.g. Whisper uploads).
+
+    Mirrors shared_async_openai: constructing OpenAI() per call builds a
+    fresh httpx pool and pays a TLS handshake per request; the shared client
+    keeps connections warm across transcriptions.
+    """
+    global _sync_openai
+    if _sync_openai is None:
+        from openai import OpenAI
+
+        _sync_openai = OpenAI(
+            api_key=openai_api_key_for_clients(),
+            http_client=shared_http_clients()[0],
+        )
+    return _sync_openai
+
+
+_async_openai = None
+
+
+def shared_async_openai():
+    """One AsyncOpenAI client for every agent making direct API calls.
+
+    Built lazily on first use and shared so all direct completions ride the
+    same keepalive pool instead of each module constructing its own client.
+    """
+    global _async_openai
+    if _async_openai is None:
+        from openai import AsyncOpenAI
+
+        _async_openai = AsyncOpenAI(
+            api_key=openai_api_key_for_clients(),
+            http_client=shared_http_clients()[1],
+        )
+    return _async_openai
+
 
 def openai_api_key_for_clients() -> str:
     key = (os.getenv("OPENAI_API_KEY") or "").strip()
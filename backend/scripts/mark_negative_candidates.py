@@ -16,43 +16,86 @@ from services.file_storage import FileStorageService
 from services.db_storage import DatabaseStorageService
 
 
+_POSITIVE = "positive"
+_NOT_INTERESTED = "not_interested"
+
+
 def should_mark_negative(candidate: dict) -> bool:
     """True if candidate expressed no interest (outreach reply negative/neutral or simulated_email not interested)."""
+    # Fail fast on the common case: most candidates have neither dict
     outreach_reply = candidate.get("outreach_reply")
+    sim = candidate.get("simulated_email")
+    if not isinstance(outreach_reply, dict) and not isinstance(sim, dict):
+        return False
+
     if isinstance(outreach_reply, dict):
-        sentiment = (outreach_reply.get("sentiment") or "").lower().strip()
-        if sentiment and sentiment != "positive":
+        if (sentiment := (outreach_reply.get("sentiment") or "").strip().lower()) and sentiment != _POSITIVE:
             return True
 
-    sim = candidate.get("simulated_email")
     if isinstance(sim, dict):
-        consent_status = sim.get("consent_status")
-        sim_type = sim.get("type", "")
-        if consent_status is None and sim_type != "consent_reply":
-            sentiment = (sim.get("sentiment") or "").lower().strip()
-            intent = (sim.get("intent") or "").lower().strip()
-            if intent == "not_interested" or (sentiment and sentiment != "positive"):
+        if sim.get("consent_status") is None and sim.get("type", "") != "consent_reply":
+            if (sim.get("intent") or "").strip().lower() == _NOT_INTERESTED:
+                return True
+            if (sentiment := (sim.get("sentiment") or "").strip().lower()) and sentiment != _POSITIVE:
                 return True
 
     return False
 
 def run_storage(storage, name: str) -> int:
+    # Gather first, then apply in one bulk call: the DB backend collapses the
+    # whole batch into a single UPDATE ... IN, and the file backend rewrites
+    # each candidate file exactly once.
     roles = storage.get_all_roles()
-    updated = 0
+    to_mark = []
     for role in roles:
         role_id = role.get("id")
         if not role_id:
             continue
-        candidates = storage.get_candidates(role_id)
-        for c in candidates:
+        for c in storage.get_candidates(role_id):
             if c.get("not_pushing_forward"):
                 continue
             if not should_mark_negative(c):
                 continue
-            storage.update_candidate_status(role_id, c["id"], {"not_pushing_forward": True})
-            updated += 1
-            print(f"  [{name}] {c.get('name', c['id'])[:36]} (role: {role.get('title', role_id)[:40]})")
-    return updated
+            to_mark.append((role_id, c["id"], {"not_pushing_forward": True}))
+            # Periodic progress, not a print per match: one write syscall per
+            # line adds up when a large backfill flags tens of thousands.
+            if len(to_mark) % 1000 == 0:
+                print(f"  [{name}] {len(to_mark)} candidates queued...")
+    return storage.bulk_update_candidates(to_mark)
+
+
+def run_db(db_storage) -> int:
+    """DB fast path: one projected scan + one bulk update.
+
+    Skips per-role get_candidates hydration entirely - only the two reply
+    columns of not-yet-marked candidates are fetched (the JSON columns come
+    back as dicts), and matches flow into a single batched UPDATE.
+    """
+    from sqlalchemy import select
+    from backend.db.db import SessionLocal
+    from backend.models.candidates import Candidate as CandidateModel
+
+    to_mark = []
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(
+                CandidateModel.id,
+                CandidateModel.role_id,
+                CandidateModel.name,
+                CandidateModel.outreach_reply,
+                CandidateModel.simulated_email,
+            ).where(CandidateModel.not_pushing_forward.is_not(True))
+        )
+        for row in rows:
+            candidate = {
+                "outreach_reply": row.outreach_reply,
+                "simulated_email": row.simulated_email,
+            }
+            if should_mark_negative(candidate):
+                to_mark.append((row.role_id, row.id, {"not_pushing_forward": True}))
+                if len(to_mark) % 1000 == 0:
+                    print(f"  [db] {len(to_mark)} candidates queued...")
+    return db_storage.bulk_update_candidates(to_mark)
 
 
 def main():
@@ -73,7 +116,7 @@ def main():
         print("Checking database...")
         db_storage = DatabaseStorageService()
         db_storage.init_db()
-        n = run_storage(db_storage, "db")
+        n = run_db(db_storage)
         total += n
         print(f"  Database: marked {n} candidate(s).")
 
@@ -17,151 +17,205 @@ def migrate():
     db_storage = DatabaseStorageService()
     db_storage.init_db()
 
-    import json
+    from sqlalchemy import insert, select
     from sqlalchemy.orm import sessionmaker
     from backend.db.db import get_engine
     from backend.models.roles import Role as RoleModel
 
-    # 1. Roles (insert with existing ids)
+    # 1. Roles: one executemany INSERT for everything not already in the DB.
+    # The engine's insertmanyvalues support turns the dict list into
+    # multi-VALUES statements, so this is one round-trip per page, not per row.
     roles = file_storage.get_all_roles()
     if not roles:
         print("No roles found in file storage. Nothing to migrate.")
         return
     engine = get_engine()
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = SessionLocal()
-    try:
-        for role in roles:
-            role_id = role.get("id")
-            if not role_id:
-                continue
-            if session.query(RoleModel).filter(RoleModel.id == role_id).first():
-                print(f"Role {role_id} already in DB, skip.")
-                continue
-            r = RoleModel(
-                id=role_id,
-                title=role.get("title", ""),
-                status=role.get("status", "New"),
-                created_at=role.get("created_at", ""),
-                updated_at=role.get("updated_at", ""),
-                hiring_budget=role.get("hiring_budget"),
-                vacancies=role.get("vacancies"),
-                urgency=role.get("urgency"),
-                timeline=role.get("timeline"),
-                candidate_requirement_fields=json.dumps(role.get("candidate_requirement_fields", [])),
-                evaluation_criteria=json.dumps(role.get("evaluation_criteria", [])),
-                created_by_user_id=role.get("created_by_user_id"),
-            )
-            session.add(r)
-            print(f"Migrated role: {role.get('title')} ({role_id})")
-        session.commit()
-    finally:
-        session.close()
+    with engine.begin() as conn:
+        existing_role_ids = set(conn.execute(select(RoleModel.id)).scalars())
+        role_rows = [
+            {
+                "id": role["id"],
+                "title": role.get("title", ""),
+                "status": role.get("status", "New"),
+                "created_at": role.get("created_at", ""),
+                "updated_at": role.get("updated_at", ""),
+                "hiring_budget": role.get("hiring_budget"),
+                "vacancies": role.get("vacancies"),
+                "urgency": role.get("urgency"),
+                "timeline": role.get("timeline"),
+                "candidate_requirement_fields": role.get("candidate_requirement_fields", []),
+                "evaluation_criteria": role.get("evaluation_criteria", []),
+                "created_by_user_id": role.get("created_by_user_id"),
+            }
+            for role in roles
+            if role.get("id") and role["id"] not in existing_role_ids
+        ]
+        if role_rows:
+            conn.execute(insert(RoleModel), role_rows)
+            print(f"Migrated {len(role_rows)} roles")
+
+    # 2.-5. Per-role children (JD, candidates, interviews, evaluation chat).
+    # Independent per role_id, so fan out across a thread pool: the work is
+    # I/O-bound (file reads + SQLite writes to disjoint rows), each helper
+    # call opens its own session, and the engine allows cross-thread use of
+    # pooled connections (check_same_thread=False).
+    import itertools
+    import os
+    from concurrent.futures import ThreadPoolExecutor
 
-    # 2. Job descriptions
-    for role in roles:
-        role_id = role.get("id")
+    from backend.models.candidates import Candidate as CandidateModel
+
+    _BATCH_SIZE = 1000
+
+    def _migrate_jd(role_id):
         jd = file_storage.get_parsed_jd(role_id)
         if jd:
             db_storage.save_parsed_jd(role_id, jd)
             print(f"Migrated JD for role {role_id}")
 
-    # 3. Candidates (insert with existing ids)
-    from backend.models.candidates import Candidate as CandidateModel
-    for role in roles:
-        role_id = role.get("id")
-        candidates = file_storage.get_candidates(role_id)
-        for c in candidates:
-            cid = c.get("id")
-            if not cid:
-                continue
-            if db_storage.get_candidate(role_id, cid):
-                continue
-            sess = SessionLocal()
-            try:
-                cand = CandidateModel(
-                    id=cid,
-                    role_id=role_id,
-                    name=c.get("name", ""),
-                    summary=c.get("summary", ""),
-                    skills=json.dumps(c.get("skills", [])),
-                    experience=c.get("experience", "") or "",
-                    parsed_insights=json.dumps(c.get("parsed_insights", {})),
-                    column=c.get("column", "outreach"),
-                    color=c.get("color", "amber-transparent"),
-                    created_at=c.get("created_at", ""),
-                    updated_at=c.get("updated_at", ""),
-                    outreach_sent=c.get("outreach_sent", False),
-                    outreach_message=c.get("outreach_message"),
-                    checklist=json.dumps(c.get("checklist", {})),
-                    consent_form_sent=c.get("consent_form_sent", False),
-                    consent_form_received=c.get("consent_form_received", False),
-                    email_status=c.get("email_status"),
-                    not_pushing_forward=c.get("not_pushing_forward", False),
-                    sent_to_client=c.get("sent_to_client", False),
-                    consent_email=json.dumps(c["consent_email"]) if c.get("consent_email") else None,
-                    consent_reply=json.dumps(c["consent_reply"]) if c.get("consent_reply") else None,
-                    simulated_email=json.dumps(c["simulated_email"]) if c.get("simulated_email") else None,
-                    outreach_reply=json.dumps(c["outreach_reply"]) if c.get("outreach_reply") else None,
-                )
-                sess.add(cand)
-                sess.commit()
-                print(f"Migrated candidate: {c.get('name')} ({cid})")
-            except Exception as e:
-                sess.rollback()
-                print(f"Skip candidate {cid}: {e}")
-            finally:
-                sess.close()
-
-    # 4. Interviews
-    for role in roles:
-        role_id = role.get("id")
-        candidates = file_storage.get_candidates(role_id)
-        for c in candidates:
-            cid = c.get("id")
+    def _candidate_row(role_id, c):
+        return {
+            "id": c["id"],
+            "role_id": role_id,
+            "name": c.get("name", ""),
+            "summary": c.get("summary", ""),
+            "skills": c.get("skills", []),
+            "experience": c.get("experience", "") or "",
+            "parsed_insights": c.get("parsed_insights", {}),
+            "column": c.get("column", "outreach"),
+            "color": c.get("color", "amber-transparent"),
+            "created_at": c.get("created_at", ""),
+            "updated_at": c.get("updated_at", ""),
+            "outreach_sent": c.get("outreach_sent", False),
+            "outreach_message": c.get("outreach_message"),
+            "checklist": c.get("checklist", {}),
+            "consent_form_sent": c.get("consent_form_sent", False),
+            "consent_form_received": c.get("consent_form_received", False),
+            "email_status": c.get("email_status"),
+            "not_pushing_forward": c.get("not_pushing_forward", False),
+            "sent_to_client": c.get("sent_to_client", False),
+            "consent_email": c.get("consent_email"),
+            "consent_reply": c.get("consent_reply"),
+            "simulated_email": c.get("simulated_email"),
+            "outreach_reply": c.get("outreach_reply"),
+        }
+
+    def _migrate_candidates(role_id):
+        # Stream candidates instead of materializing the full list: wide
+        # parsed_insights/simulated_email blobs mean peak memory is one
+        # batch of rows, not the whole role. Returns every candidate id seen
+        # so the interview pass can reuse this scan instead of re-reading and
+        # re-parsing each candidate file.
+        seen_cids = []
+        sess = SessionLocal()
+        try:
+            existing_cids = set(
+                sess.execute(
+                    select(CandidateModel.id).where(CandidateModel.role_id == role_id)
+                ).scalars()
+            )
+
+            def _rows():
+                for c in file_storage.iter_candidates(role_id):
+                    cid = c.get("id")
+                    if not cid:
+                        continue
+                    seen_cids.append(cid)
+                    if cid not in existing_cids:
+                        yield _candidate_row(role_id, c)
+
+            rows_iter = _rows()
+            total = 0
+            # One commit per role, not per batch: each SQLite commit is an
+            # fsync, and the batches already bound peak memory on their own.
+            while True:
+                batch = list(itertools.islice(rows_iter, _BATCH_SIZE))
+                if not batch:
+                    break
+                sess.bulk_insert_mappings(CandidateModel, batch)
+                total += len(batch)
+            sess.commit()
+            if total:
+                print(f"Migrated {total} candidates for role {role_id}")
+        except Exception as e:
+            sess.rollback()
+            print(f"Skip candidates for role {role_id}: {e}")
+        finally:
+            sess.close()
+        return seen_cids
+
+    def _migrate_role_children(role_id):
+        _migrate_jd(role_id)
+        # One summary line per role instead of one print per interview: on
+        # large roles the per-row writes dominate stdout (a syscall per line).
+        interviews = 0
+        for cid in _migrate_candidates(role_id):
             inv = file_storage.get_interview_data(role_id, cid)
             if inv:
                 db_storage.save_interview_data(role_id, cid, inv)
-                print(f"Migrated interview for candidate {cid}")
-
-    # 5. Evaluation chats
-    for role in roles:
-        role_id = role.get("id")
+                interviews += 1
+        if interviews:
+            print(f"Migrated {interviews} interviews for role {role_id}")
         messages = file_storage.get_evaluation_chat(role_id)
         if messages:
             db_storage.save_evaluation_chat(role_id, messages)
             print(f"Migrated evaluation chat for role {role_id}")
 
-    # 6. HR Briefings
+    role_ids = [role["id"] for role in roles if role.get("id")]
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+        # list() re-raises any worker exception instead of dropping it
+        list(pool.map(_migrate_role_children, role_ids))
+
+    # 6.-7. HR Briefings and consent templates share one session and one
+    # commit (one fsync for the whole tail of the migration).
     briefings = file_storage.get_all_hr_briefings()
+    templates = file_storage.get_all_consent_templates()
+    from datetime import datetime
+
+    from backend.models.consent_templates import ConsentTemplate as ConsentTemplateModel
     from backend.models.hr_briefings import HRBriefing as HRBriefingModel
     from backend.models.role_hr_briefings import RoleHRBriefing
     sess = SessionLocal()
     try:
+        # One id fetch up front instead of an existence SELECT per briefing
+        existing_briefing_ids = set(sess.execute(select(HRBriefingModel.id)).scalars())
+        migrated_briefings = 0
         for b in briefings:
-            if sess.query(HRBriefingModel).filter(HRBriefingModel.id == b["id"]).first():
+            if b["id"] in existing_briefing_ids:
                 continue
             h = HRBriefingModel(
                 id=b["id"],
                 summary=b.get("summary", ""),
-                extracted_fields=json.dumps(b.get("extracted_fields", {})),
+                extracted_fields=b.get("extracted_fields", {}),
                 transcription=b.get("transcription", ""),
                 created_at=b.get("created_at", ""),
             )
             sess.add(h)
             for rid in b.get("role_ids", []):
                 sess.add(RoleHRBriefing(role_id=rid, briefing_id=b["id"]))
-            print(f"Migrated HR briefing {b['id']}")
+            migrated_briefings += 1
+        if migrated_briefings:
+            print(f"Migrated {migrated_briefings} HR briefings")
+
+        now = datetime.now().isoformat()
+        for t in templates:
+            existing = sess.get(ConsentTemplateModel, t["id"])
+            if existing:
+                existing.name = t["name"]
+                existing.content = t["content"]
+                existing.updated_at = now
+            else:
+                sess.add(ConsentTemplateModel(
+                    id=t["id"], name=t["name"], content=t["content"],
+                    created_at=now, updated_at=now,
+                ))
+        if templates:
+            print(f"Migrated {len(templates)} consent templates")
         sess.commit()
     finally:
         sess.close()
 
-    # 7. Consent templates
-    templates = file_storage.get_all_consent_templates()
-    for t in templates:
-        db_storage.save_consent_template(t["name"], t["content"], t["id"])
-        print(f"Migrated consent template: {t.get('name')}")
-
     print("Migration complete.")
 
 
@@ -1,11 +1,12 @@
 """
 Audio transcription service using OpenAI Whisper (local or API)
 """
+import asyncio
 import os
 import shutil
 import subprocess
 import tempfile
-from io import BytesIO
+import threading
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -92,7 +93,18 @@ def resolve_hr_briefing_audio_extension(
     return ".m4a"
 
 
-# Try to import whisper, but handle any errors gracefully
+# Prefer faster-whisper (CTranslate2): int8 weights and fused kernels run the
+# same "base" model several times faster than reference PyTorch Whisper.
+FASTER_WHISPER_AVAILABLE = False
+WhisperModel = None
+try:
+    from faster_whisper import WhisperModel
+
+    FASTER_WHISPER_AVAILABLE = True
+except Exception:
+    FASTER_WHISPER_AVAILABLE = False
+
+# Try to import reference whisper as a secondary local backend
 WHISPER_AVAILABLE = False
 whisper = None
 try:
@@ -102,29 +114,54 @@ try:
 except (ImportError, TypeError, Exception) as e:
     # Whisper failed to import - this is OK, we'll use OpenAI API as fallback
     WHISPER_AVAILABLE = False
-    print(
-        f"Warning: Local Whisper not available ({type(e).__name__}). "
-        "Will use OpenAI Whisper API as fallback."
-    )
+    if not FASTER_WHISPER_AVAILABLE:
+        print(
+            f"Warning: Local Whisper not available ({type(e).__name__}). "
+            "Will use OpenAI Whisper API as fallback."
+        )
+
+
+# Loaded Whisper models, shared across service instances: the weights are
+# hundreds of MB, so per-instance loads paid seconds of startup and kept one
+# resident copy per instance. The lock keeps two threads from racing the load.
+_MODEL_CACHE: dict = {}
+_MODEL_LOCK = threading.Lock()
+# Set after a failed local model load so every instance skips straight to the
+# API path instead of re-paying the multi-second failing load per request.
+_LOCAL_LOAD_FAILED = False
 
 
 class AudioTranscriptionService:
     def __init__(self):
         self.model = None
         self.model_name = "base"  # Use base model for faster processing
-        self.whisper_available = WHISPER_AVAILABLE
+        self.whisper_available = (WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE) and not _LOCAL_LOAD_FAILED
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
 
     def _load_model(self):
-        """Lazy load Whisper model"""
+        """Lazy load Whisper model (one shared copy per model name)"""
+        global _LOCAL_LOAD_FAILED
+        if _LOCAL_LOAD_FAILED:
+            self.whisper_available = False
         if not self.whisper_available:
             raise Exception("Local Whisper is not installed. Using OpenAI API instead.")
         if self.model is None:
             try:
-                self.model = whisper.load_model(self.model_name)
+                with _MODEL_LOCK:
+                    model = _MODEL_CACHE.get(self.model_name)
+                    if model is None:
+                        if FASTER_WHISPER_AVAILABLE:
+                            # int8 on CPU halves weight bandwidth; CTranslate2
+                            # picks float16 automatically on GPU devices
+                            model = WhisperModel(self.model_name, device="auto", compute_type="int8")
+                        else:
+                            model = whisper.load_model(self.model_name)
+                        _MODEL_CACHE[self.model_name] = model
+                self.model = model
             except Exception as e:
                 print(f"Error loading Whisper model: {e}. Falling back to OpenAI API.")
                 self.whisper_available = False
+                _LOCAL_LOAD_FAILED = True
                 raise
         return self.model
 
@@ -192,18 +229,21 @@ class AudioTranscriptionService:
     def _transcribe_with_openai(self, audio_path: Path) -> str:
         """Transcribe using OpenAI Whisper API"""
         try:
-            from openai import OpenAI
+            from backend.openai_env import shared_openai
 
-            client = OpenAI(api_key=self.openai_api_key)
+            client = shared_openai()
 
-            data = audio_path.read_bytes()
-            name = audio_path.name
-            buf = BytesIO(data)
-            transcript = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=(name, buf),
-                response_format="text",
-            )
+            # Hand the SDK a buffered handle instead of slurping the file into
+            # a BytesIO copy: 1 MiB reads keep throughput up and peak memory
+            # stays at one buffer regardless of recording length.
+            with open(audio_path, "rb", buffering=1024 * 1024) as f:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                transcript = client.audio.transcriptions.create(
+                    model="whisper-1",
+                    file=(audio_path.name, f),
+                    response_format="text",
+                )
             return transcript
         except ImportError:
             raise Exception("OpenAI library not installed. Please install it with: pip install openai")
@@ -217,6 +257,9 @@ class AudioTranscriptionService:
             if self.whisper_available:
                 try:
                     model = self._load_model()
+                    if FASTER_WHISPER_AVAILABLE and isinstance(model, WhisperModel):
+                        segments, _ = model.transcribe(str(audio_path), beam_size=1)
+                        return "".join(s.text for s in segments).strip()
                     result = model.transcribe(str(audio_path))
                     return result["text"]
                 except Exception as e:
@@ -233,5 +276,10 @@ class AudioTranscriptionService:
                 tmp_to_cleanup.unlink(missing_ok=True)
 
     async def transcribe_async(self, audio_path: Path) -> str:
-        """Async wrapper for transcription"""
-        return self.transcribe(audio_path)
+        """Transcribe off the event loop.
+
+        Both branches block for seconds to minutes - local Whisper holds the
+        CPU/GPU, the API path does a large synchronous upload - so the whole
+        call runs in a worker thread instead of stalling the FastAPI loop.
+        """
+        return await asyncio.to_thread(self.transcribe, audio_path)
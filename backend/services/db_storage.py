@@ -1,10 +1,13 @@
 """
 Database storage service - SQLite backend with same API as FileStorageService.
 """
-import json
 import os
+import threading
+import time
 import uuid
 import shutil
+
+import orjson
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -25,9 +28,11 @@ from backend.models.role_hr_briefings import RoleHRBriefing
 from backend.models.interviews import Interview as InterviewModel
 from backend.models.evaluation_chats import EvaluationChat as EvaluationChatModel
 from backend.models.consent_templates import ConsentTemplate as ConsentTemplateModel
+from backend.models.llm_cache import LLMResponseCache  # noqa: F401  (registers table for create_all)
 from backend.services.audio_transcription import resolve_hr_briefing_audio_extension
-from sqlalchemy import desc
-from sqlalchemy.orm import Session, sessionmaker
+from backend.services.file_storage import _write_upload
+from sqlalchemy import desc, func, insert, select, text, update
+from sqlalchemy.orm import Session, joinedload, sessionmaker
 
 
 def _resolve_data_dir() -> Path:
@@ -37,25 +42,30 @@ def _resolve_data_dir() -> Path:
     return data_dir
 
 
-def _json_loads(s: Optional[str], default=None):
-    if s is None or s == "":
-        return default if default is not None else {}
-    try:
-        return json.loads(s)
-    except Exception:
-        return default if default is not None else {}
-
-
 def _json_dumps(obj) -> str:
     if obj is None:
         return "null"
-    return json.dumps(obj, ensure_ascii=False)
+    return orjson.dumps(obj).decode()
+
+
+def _now_iso() -> str:
+    """Timestamp for created_at/updated_at fields. Write paths capture this
+    once per operation and reuse it rather than re-allocating a datetime and
+    a formatted string per field."""
+    return datetime.now().isoformat()
 
 
 def _to_str(val: Any, max_len: int = 500) -> str:
     """Coerce value to string for DB text columns. Lists (e.g. multiple job titles) are joined with ', '."""
     if val is None:
         return ""
+    if type(val) is str:
+        # Overwhelmingly common case on the JD save path: a short string
+        # that is already clean passes through without strip/slice copies.
+        if val and len(val) <= max_len and not val[0].isspace() and not val[-1].isspace():
+            return val
+        s = val.strip()
+        return (s[:max_len] + "…") if len(s) > max_len else s
     if isinstance(val, list):
         s = ", ".join(str(x).strip() for x in val if x is not None and str(x).strip())
         return (s[:max_len] + "…") if len(s) > max_len else s
@@ -63,42 +73,156 @@ def _to_str(val: Any, max_len: int = 500) -> str:
     return (s[:max_len] + "…") if len(s) > max_len else s
 
 
+# Read-through cache tuning for hot single-row lookups (roles, parsed JDs,
+# consent templates). Short TTL keeps multi-process deployments from serving
+# long-stale rows; writers invalidate their own keys immediately.
+_CACHE_TTL_SECONDS = 30.0
+_CACHE_MAX_ENTRIES = 1024
+_CACHE_MISS = object()
+
+
+# Columns _candidate_to_dict reads, in one place so the Core-select list
+# paths and the ORM single-row paths can't drift apart.
+_CANDIDATE_COLS = (
+    CandidateModel.id,
+    CandidateModel.name,
+    CandidateModel.summary,
+    CandidateModel.skills,
+    CandidateModel.experience,
+    CandidateModel.parsed_insights,
+    CandidateModel.column,
+    CandidateModel.color,
+    CandidateModel.created_at,
+    CandidateModel.updated_at,
+    CandidateModel.outreach_sent,
+    CandidateModel.outreach_message,
+    CandidateModel.checklist,
+    CandidateModel.consent_form_sent,
+    CandidateModel.consent_form_received,
+    CandidateModel.email_status,
+    CandidateModel.not_pushing_forward,
+    CandidateModel.sent_to_client,
+    CandidateModel.consent_email,
+    CandidateModel.consent_reply,
+    CandidateModel.simulated_email,
+    CandidateModel.outreach_reply,
+)
+
+# Built once at import so the per-update loops do frozenset membership tests
+# instead of re-walking __table__.columns (or hasattr reflection) per field.
+_CANDIDATE_COL_KEYS = frozenset(CandidateModel.__table__.columns.keys())
+_ROLE_COL_KEYS = frozenset(RoleModel.__table__.columns.keys())
+# JSON columns where a None patch value means "leave as is", not "clear".
+_CANDIDATE_JSON_COLS = frozenset({
+    "skills", "parsed_insights", "checklist",
+    "consent_email", "consent_reply", "simulated_email", "outreach_reply",
+})
+
+# Checklist seeded when a candidate first moves to follow-up.
+_DEFAULT_CHECKLIST = {
+    "consent_form_sent": False,
+    "consent_form_received": False,
+    "updated_cv_received": False,
+    "screening_interview_scheduled": False,
+    "screening_interview_completed": False,
+}
+
+
 class DatabaseStorageService:
     def __init__(self):
         self.base_dir = _resolve_data_dir()
         self.engine = get_engine()
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # expire_on_commit=False: methods read attributes after commit (e.g.
+        # to build the returned dict); the default would silently re-SELECT
+        # the row for each of those reads.
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine)
         self.roles_dir = self.base_dir / "roles"
         self.roles_dir.mkdir(parents=True, exist_ok=True)
+        # Read-through caches: send_consent_email, kanban renders and the
+        # outreach routes hit the same role/JD rows many times per request.
+        # Entries are (expiry, value); writers drop their key on commit.
+        self._cache_lock = threading.Lock()
+        self._role_cache: Dict[str, tuple] = {}
+        self._jd_cache: Dict[str, tuple] = {}
+        self._template_cache: Dict[str, tuple] = {}
+        # Directories already created this process; lets the per-access
+        # mkdir in the dir helpers skip its stat() in tight loops.
+        self._known_dirs: set = set()
+        self._known_dirs_lock = threading.Lock()
+
+    def _cache_get(self, cache: Dict[str, tuple], key: str):
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                # Shallow copy so callers mutating the dict don't poison the cache
+                return dict(entry[1])
+            if entry:
+                del cache[key]
+        return _CACHE_MISS
+
+    def _cache_put(self, cache: Dict[str, tuple], key: str, value: Dict[str, Any]):
+        with self._cache_lock:
+            if len(cache) >= _CACHE_MAX_ENTRIES:
+                cache.clear()
+            cache[key] = (time.monotonic() + _CACHE_TTL_SECONDS, dict(value))
+
+    def _cache_drop(self, cache: Dict[str, tuple], key: str):
+        with self._cache_lock:
+            cache.pop(key, None)
 
     def init_db(self):
-        """Create all tables and add any missing columns (e.g. created_by_user_id)."""
+        """Create all tables and add any missing columns (e.g. created_by_user_id).
+
+        SQLite write-throughput PRAGMAs (WAL, synchronous=NORMAL, memory temp
+        store, mmap) are not issued here: backend/db/db.py applies them on
+        every new pooled connection via a connect listener, which also covers
+        reconnects after recycling.
+        """
         Base.metadata.create_all(bind=self.engine)
-        from sqlalchemy import text
-        try:
-            with self.engine.connect() as conn:
+        with self.engine.connect() as conn:
+            # Check first rather than issuing a doomed ALTER inside a bare
+            # try/except: the failed statement cost a write attempt plus a
+            # rollback on every startup, and the except hid real errors.
+            cols = {row[1] for row in conn.execute(text("PRAGMA table_info(roles)"))}
+            if "created_by_user_id" not in cols:
                 conn.execute(text("ALTER TABLE roles ADD COLUMN created_by_user_id VARCHAR(255)"))
-                conn.commit()
-        except Exception:
-            pass  # column likely already exists
+            # create_all only builds indexes alongside new tables; databases
+            # that predate ix_role_hr_briefings_briefing_id need it added
+            # explicitly (IF NOT EXISTS makes the re-run free).
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_role_hr_briefings_briefing_id "
+                "ON role_hr_briefings (briefing_id)"
+            ))
+            conn.commit()
 
     def _get_session(self) -> Session:
         return self.SessionLocal()
 
+    def _ensure_dir(self, path: Path) -> Path:
+        """mkdir(exist_ok=True) still costs a stat() per call; skip it for
+        directories this process has already created. Deletion paths clear
+        the set so removed directories are recreated on next access."""
+        key = str(path)
+        with self._known_dirs_lock:
+            if key in self._known_dirs:
+                return path
+        path.mkdir(parents=True, exist_ok=True)
+        with self._known_dirs_lock:
+            if len(self._known_dirs) >= 4096:
+                self._known_dirs.clear()
+            self._known_dirs.add(key)
+        return path
+
     def _get_role_dir(self, role_id: str) -> Path:
-        role_dir = self.roles_dir / role_id
-        role_dir.mkdir(parents=True, exist_ok=True)
-        return role_dir
+        return self._ensure_dir(self.roles_dir / role_id)
 
     def _get_candidate_dir(self, role_id: str, candidate_id: str) -> Path:
-        candidate_dir = self._get_role_dir(role_id) / "candidates" / candidate_id
-        candidate_dir.mkdir(parents=True, exist_ok=True)
-        return candidate_dir
+        return self._ensure_dir(self._get_role_dir(role_id) / "candidates" / candidate_id)
 
     # ---------- Roles ----------
     def create_role(self, role_data: Dict[str, Any]) -> str:
         role_id = str(uuid.uuid4())
-        now = datetime.now().isoformat()
+        now = _now_iso()
         req_fields = role_data.get("candidate_requirement_fields") or [
             "expected_salary", "earliest_start_date", "work_authorization",
             "location_preferences", "notice_period"
@@ -113,8 +237,8 @@ class DatabaseStorageService:
                 status=role_data.get("status", "New"),
                 created_at=now,
                 updated_at=now,
-                candidate_requirement_fields=_json_dumps(req_fields),
-                evaluation_criteria=_json_dumps(eval_criteria),
+                candidate_requirement_fields=req_fields,
+                evaluation_criteria=eval_criteria,
                 created_by_user_id=role_data.get("created_by_user_id"),
             )
             session.add(r)
@@ -123,42 +247,106 @@ class DatabaseStorageService:
 
     def get_all_roles(self) -> List[Dict[str, Any]]:
         with self._get_session() as session:
-            roles = session.query(RoleModel).all()
+            # Core select with EXISTS flags instead of ORM rows plus eager
+            # loads: the JD and briefing links were only hydrated to compute
+            # two booleans, so fold them into the role query itself. The
+            # whole listing is two statements regardless of role count.
+            roles = session.execute(
+                select(
+                    RoleModel.id,
+                    RoleModel.title,
+                    RoleModel.status,
+                    RoleModel.created_at,
+                    RoleModel.updated_at,
+                    RoleModel.created_by_user_id,
+                    RoleModel.hiring_budget,
+                    RoleModel.vacancies,
+                    RoleModel.urgency,
+                    RoleModel.timeline,
+                    RoleModel.candidate_requirement_fields,
+                    RoleModel.evaluation_criteria,
+                    select(1)
+                    .where(JDModel.role_id == RoleModel.id)
+                    .exists()
+                    .label("has_jd"),
+                    select(1)
+                    .where(RoleHRBriefing.role_id == RoleModel.id)
+                    .exists()
+                    .label("has_hr_briefing"),
+                )
+            ).all()
+            # Candidate counters come from one grouped aggregate rather than
+            # hydrating every candidate row (JSON columns included) just to
+            # count it in Python six times over.
+            counts_by_role: Dict[str, Dict[str, int]] = {}
+            rows = session.execute(
+                select(
+                    CandidateModel.role_id,
+                    CandidateModel.column,
+                    CandidateModel.sent_to_client,
+                    CandidateModel.not_pushing_forward,
+                    func.count(),
+                ).group_by(
+                    CandidateModel.role_id,
+                    CandidateModel.column,
+                    CandidateModel.sent_to_client,
+                    CandidateModel.not_pushing_forward,
+                )
+            )
+            for role_id, column, sent_to_client, not_pushing_forward, n in rows:
+                agg = counts_by_role.setdefault(role_id, {
+                    "total": 0, "outreach": 0, "follow-up": 0, "evaluation": 0,
+                    "sent_to_client": 0, "not_pushing_forward": 0,
+                })
+                agg["total"] += n
+                col = column or "outreach"
+                if col in agg:
+                    agg[col] += n
+                if sent_to_client:
+                    agg["sent_to_client"] += n
+                if not_pushing_forward:
+                    agg["not_pushing_forward"] += n
+            _empty: Dict[str, int] = {}
             result = []
             for r in roles:
-                candidates = session.query(CandidateModel).filter(CandidateModel.role_id == r.id).all()
+                agg = counts_by_role.get(r.id, _empty)
                 role_dict = {
                     "id": r.id,
                     "title": r.title,
                     "status": r.status,
                     "created_at": r.created_at,
                     "updated_at": r.updated_at,
-                    "created_by_user_id": getattr(r, "created_by_user_id", None),
-                    "candidates_count": len(candidates),
-                    "successful_candidates_count": sum(1 for c in candidates if c.sent_to_client),
+                    "created_by_user_id": r.created_by_user_id,
+                    "candidates_count": agg.get("total", 0),
+                    "successful_candidates_count": agg.get("sent_to_client", 0),
                     "hiring_budget": r.hiring_budget,
                     "vacancies": r.vacancies,
                     "urgency": r.urgency,
                     "timeline": r.timeline,
-                    "candidate_requirement_fields": _json_loads(r.candidate_requirement_fields, []),
-                    "evaluation_criteria": _json_loads(r.evaluation_criteria, []),
+                    "candidate_requirement_fields": r.candidate_requirement_fields or [],
+                    "evaluation_criteria": r.evaluation_criteria or [],
                 }
-                role_dict["outreach_count"] = sum(1 for c in candidates if (c.column or "outreach") == "outreach")
-                role_dict["follow_up_count"] = sum(1 for c in candidates if c.column == "follow-up")
-                role_dict["evaluation_count"] = sum(1 for c in candidates if c.column == "evaluation")
-                role_dict["sent_to_client_count"] = sum(1 for c in candidates if c.sent_to_client)
-                role_dict["not_pushing_forward_count"] = sum(1 for c in candidates if c.not_pushing_forward)
-                role_dict["has_jd"] = session.query(JDModel).filter(JDModel.role_id == r.id).first() is not None
-                role_dict["has_hr_briefing"] = session.query(RoleHRBriefing).filter(RoleHRBriefing.role_id == r.id).first() is not None
+                role_dict["outreach_count"] = agg.get("outreach", 0)
+                role_dict["follow_up_count"] = agg.get("follow-up", 0)
+                role_dict["evaluation_count"] = agg.get("evaluation", 0)
+                role_dict["sent_to_client_count"] = agg.get("sent_to_client", 0)
+                role_dict["not_pushing_forward_count"] = agg.get("not_pushing_forward", 0)
+                role_dict["has_jd"] = bool(r.has_jd)
+                role_dict["has_hr_briefing"] = bool(r.has_hr_briefing)
                 result.append(role_dict)
             return result
 
     def get_role(self, role_id: str) -> Optional[Dict[str, Any]]:
+        cached = self._cache_get(self._role_cache, role_id)
+        if cached is not _CACHE_MISS:
+            return cached
         with self._get_session() as session:
-            r = session.query(RoleModel).filter(RoleModel.id == role_id).first()
+            # session.get checks the identity map first and skips query
+            # compilation; same for the other primary-key lookups below.
+            r = session.get(RoleModel, role_id)
             if not r:
                 return None
-            return {
+            role = {
                 "id": r.id,
                 "title": r.title,
                 "status": r.status,
@@ -169,42 +357,53 @@ class DatabaseStorageService:
                 "vacancies": r.vacancies,
                 "urgency": r.urgency,
                 "timeline": r.timeline,
-                "candidate_requirement_fields": _json_loads(r.candidate_requirement_fields, []),
-                "evaluation_criteria": _json_loads(r.evaluation_criteria, []),
+                "candidate_requirement_fields": r.candidate_requirement_fields or [],
+                "evaluation_criteria": r.evaluation_criteria or [],
             }
+            self._cache_put(self._role_cache, role_id, role)
+            return role
 
     def update_role(self, role_id: str, updates: Dict[str, Any]) -> bool:
+        # Single UPDATE ... WHERE instead of SELECT + mutate + UPDATE: role
+        # updates are plain field assignments, so nothing needs hydrating.
+        sanitized = {
+            k: v for k, v in updates.items()
+            if k != "id" and k in _ROLE_COL_KEYS
+        }
         with self._get_session() as session:
-            r = session.query(RoleModel).filter(RoleModel.id == role_id).first()
-            if not r:
-                return False
-            for k, v in updates.items():
-                if k in ("candidate_requirement_fields", "evaluation_criteria") and isinstance(v, list):
-                    setattr(r, k, _json_dumps(v))
-                elif hasattr(r, k):
-                    setattr(r, k, v)
-            r.updated_at = datetime.now().isoformat()
+            result = session.execute(
+                update(RoleModel)
+                .where(RoleModel.id == role_id)
+                .values(updated_at=_now_iso(), **sanitized),
+                execution_options={"synchronize_session": False},
+            )
             session.commit()
+        if result.rowcount == 0:
+            return False
+        self._cache_drop(self._role_cache, role_id)
         return True
 
     def delete_role(self, role_id: str) -> bool:
         with self._get_session() as session:
-            r = session.query(RoleModel).filter(RoleModel.id == role_id).first()
+            r = session.get(RoleModel, role_id)
             if not r:
                 return False
             session.delete(r)
             session.commit()
+        self._cache_drop(self._role_cache, role_id)
+        self._cache_drop(self._jd_cache, role_id)
         role_dir = self.roles_dir / role_id
         if role_dir.exists():
             shutil.rmtree(role_dir)
+        with self._known_dirs_lock:
+            self._known_dirs.clear()
         return True
 
     # ---------- Job Description ----------
-    def save_jd(self, role_id: str, file) -> Path:
+    def save_jd(self, role_id: str, content) -> Path:
         role_dir = self._get_role_dir(role_id)
         jd_path = role_dir / "jd.pdf"
-        with open(jd_path, "wb") as f:
-            f.write(file.file.read())
+        _write_upload(jd_path, content)
         with self._get_session() as session:
             jd = session.query(JDModel).filter(JDModel.role_id == role_id).first()
             if jd:
@@ -223,23 +422,29 @@ class DatabaseStorageService:
             # Normalize string fields: LLM may return lists (e.g. multiple job titles)
             jd.job_title = _to_str(parsed_jd.get("job_title", ""), max_len=500)
             jd.job_summary = _to_str(parsed_jd.get("job_summary", ""), max_len=10000)
-            jd.responsibilities = _json_dumps(parsed_jd.get("responsibilities", []))
-            jd.requirements = _json_dumps(parsed_jd.get("requirements", []))
-            jd.skills = _json_dumps(parsed_jd.get("skills", []))
+            jd.responsibilities = parsed_jd.get("responsibilities", [])
+            jd.requirements = parsed_jd.get("requirements", [])
+            jd.skills = parsed_jd.get("skills", [])
             session.commit()
+        self._cache_drop(self._jd_cache, role_id)
 
     def get_parsed_jd(self, role_id: str) -> Optional[Dict[str, Any]]:
+        cached = self._cache_get(self._jd_cache, role_id)
+        if cached is not _CACHE_MISS:
+            return cached
         with self._get_session() as session:
             jd = session.query(JDModel).filter(JDModel.role_id == role_id).first()
             if not jd:
                 return None
-            return {
+            parsed = {
                 "job_title": jd.job_title,
                 "job_summary": jd.job_summary,
-                "responsibilities": _json_loads(jd.responsibilities, []),
-                "requirements": _json_loads(jd.requirements, []),
-                "skills": _json_loads(jd.skills, []),
+                "responsibilities": jd.responsibilities or [],
+                "requirements": jd.requirements or [],
+                "skills": jd.skills or [],
             }
+            self._cache_put(self._jd_cache, role_id, parsed)
+            return parsed
 
     def update_parsed_jd(self, role_id: str, jd_data: Dict[str, Any]):
         existing = self.get_parsed_jd(role_id) or {}
@@ -247,90 +452,210 @@ class DatabaseStorageService:
         self.save_parsed_jd(role_id, existing)
 
     # ---------- Candidates ----------
-    def save_candidate_pdf(self, role_id: str, file) -> tuple:
+    def save_candidate_pdf(self, role_id: str, content) -> tuple:
         candidate_id = str(uuid.uuid4())
         candidate_dir = self._get_candidate_dir(role_id, candidate_id)
         pdf_path = candidate_dir / "resume.pdf"
-        with open(pdf_path, "wb") as f:
-            f.write(file.file.read())
+        _write_upload(pdf_path, content)
         return pdf_path, candidate_id
 
+    @staticmethod
+    def _candidate_row(role_id: str, candidate_id: str, data: Dict[str, Any], now: str) -> Dict[str, Any]:
+        return {
+            "id": candidate_id,
+            "role_id": role_id,
+            "name": data.get("name", ""),
+            "summary": data.get("summary", ""),
+            "skills": data.get("skills", []),
+            "experience": data.get("experience", ""),
+            "parsed_insights": data.get("parsed_insights", {}),
+            "column": "outreach",
+            "color": "amber-transparent",
+            "created_at": now,
+            "updated_at": now,
+            "checklist": dict(_DEFAULT_CHECKLIST),
+        }
+
     def create_candidate(self, role_id: str, candidate_data: Dict[str, Any], candidate_id: str = None) -> str:
         if not candidate_id:
             candidate_id = str(uuid.uuid4())
-        now = datetime.now().isoformat()
-        checklist = {
-            "consent_form_sent": False,
-            "consent_form_received": False,
-            "updated_cv_received": False,
-            "screening_interview_scheduled": False,
-            "screening_interview_completed": False,
-        }
         with self._get_session() as session:
-            c = CandidateModel(
-                id=candidate_id,
-                role_id=role_id,
-                name=candidate_data.get("name", ""),
-                summary=candidate_data.get("summary", ""),
-                skills=_json_dumps(candidate_data.get("skills", [])),
-                experience=candidate_data.get("experience", ""),
-                parsed_insights=_json_dumps(candidate_data.get("parsed_insights", {})),
-                column="outreach",
-                color="amber-transparent",
-                created_at=now,
-                updated_at=now,
-                checklist=_json_dumps(checklist),
+            session.execute(
+                insert(CandidateModel),
+                [self._candidate_row(role_id, candidate_id, candidate_data, _now_iso())],
             )
-            session.add(c)
             session.commit()
         return candidate_id
 
+    def create_candidates_bulk(self, role_id: str, candidates: List[Dict[str, Any]]) -> List[str]:
+        """Insert many candidates in one transaction; returns the new ids.
+
+        Bulk resume ingestion called create_candidate per resume, paying a
+        session, an INSERT and a commit (fsync) each time. One executemany
+        insert amortizes all three — insertmanyvalues batches the rows into
+        multi-VALUES statements under the page-size cap.
+        """
+        if not candidates:
+            return []
+        now = _now_iso()
+        ids = [str(uuid.uuid4()) for _ in candidates]
+        rows = [
+            self._candidate_row(role_id, cid, data, now)
+            for cid, data in zip(ids, candidates)
+        ]
+        with self._get_session() as session:
+            session.execute(insert(CandidateModel), rows)
+            session.commit()
+        return ids
+
     def get_candidates(self, role_id: str) -> List[Dict[str, Any]]:
+        # Core select instead of ORM hydration: the list path never mutates
+        # candidates, so there is no reason to pay instrumentation and
+        # identity-map setup per row just to build plain dicts.
         with self._get_session() as session:
-            candidates = session.query(CandidateModel).filter(CandidateModel.role_id == role_id).all()
-            return [self._candidate_to_dict(c) for c in candidates]
+            rows = session.execute(
+                select(*_CANDIDATE_COLS).where(CandidateModel.role_id == role_id)
+            ).all()
+            return [self._candidate_to_dict(r) for r in rows]
 
-    def _candidate_to_dict(self, c: CandidateModel) -> Dict[str, Any]:
+    def iter_candidates(self, role_id: str):
+        """Yield candidates one at a time (bounded memory for batch jobs)."""
+        with self._get_session() as session:
+            rows = session.execute(
+                select(*_CANDIDATE_COLS).where(CandidateModel.role_id == role_id),
+                execution_options={"yield_per": 500},
+            )
+            for r in rows:
+                yield self._candidate_to_dict(r)
+
+    def _candidate_to_dict(self, c) -> Dict[str, Any]:
+        """Build the public candidate dict from an ORM instance or a Core row
+        (both expose the columns as attributes)."""
         return {
             "id": c.id,
             "name": c.name or "",
             "summary": c.summary or "",
-            "skills": _json_loads(c.skills, []),
+            "skills": c.skills or [],
             "experience": c.experience or "",
-            "parsed_insights": _json_loads(c.parsed_insights, {}),
+            "parsed_insights": c.parsed_insights or {},
             "column": c.column or "outreach",
             "color": c.color or "amber-transparent",
             "created_at": c.created_at,
             "updated_at": c.updated_at,
             "outreach_sent": c.outreach_sent or False,
             "outreach_message": c.outreach_message,
-            "checklist": _json_loads(c.checklist, {}),
+            "checklist": c.checklist or {},
             "consent_form_sent": c.consent_form_sent or False,
             "consent_form_received": c.consent_form_received or False,
             "email_status": c.email_status,
             "not_pushing_forward": c.not_pushing_forward or False,
             "sent_to_client": c.sent_to_client or False,
-            "consent_email": _json_loads(c.consent_email) if c.consent_email else None,
-            "consent_reply": _json_loads(c.consent_reply) if c.consent_reply else None,
-            "simulated_email": _json_loads(c.simulated_email) if c.simulated_email else None,
-            "outreach_reply": _json_loads(c.outreach_reply) if c.outreach_reply else None,
+            "consent_email": c.consent_email,
+            "consent_reply": c.consent_reply,
+            "simulated_email": c.simulated_email,
+            "outreach_reply": c.outreach_reply,
         }
 
+    def get_candidates_with_interviews(self, role_id: str) -> List[Dict[str, Any]]:
+        """Get candidates for a role with their interviews (two queries, no N+1).
+
+        Projects only the columns the evaluation prompt uses; the large Text
+        columns (consent/outreach emails and replies) never leave the database.
+        """
+        with self._get_session() as session:
+            rows = (
+                session.query(
+                    CandidateModel.id,
+                    CandidateModel.name,
+                    CandidateModel.summary,
+                    CandidateModel.skills,
+                    CandidateModel.experience,
+                    CandidateModel.parsed_insights,
+                    CandidateModel.column,
+                    CandidateModel.color,
+                    CandidateModel.not_pushing_forward,
+                )
+                .filter(CandidateModel.role_id == role_id)
+                .all()
+            )
+            interviews = {}
+            if rows:
+                for inv in (
+                    session.query(
+                        InterviewModel.candidate_id,
+                        InterviewModel.summary,
+                        InterviewModel.fit_score,
+                        InterviewModel.key_points,
+                        InterviewModel.strengths,
+                        InterviewModel.concerns,
+                        InterviewModel.recommendation,
+                        InterviewModel.interview_completed,
+                    )
+                    .filter(InterviewModel.candidate_id.in_([r.id for r in rows]))
+                    .all()
+                ):
+                    interviews[inv.candidate_id] = {
+                        "summary": inv.summary,
+                        "fit_score": inv.fit_score,
+                        "key_points": inv.key_points or [],
+                        "strengths": inv.strengths or [],
+                        "concerns": inv.concerns or [],
+                        "recommendation": inv.recommendation,
+                        "interview_completed": inv.interview_completed if inv.interview_completed is not None else True,
+                    }
+            return [
+                {
+                    "id": r.id,
+                    "name": r.name or "",
+                    "summary": r.summary or "",
+                    "skills": r.skills or [],
+                    "experience": r.experience or "",
+                    "parsed_insights": r.parsed_insights or {},
+                    "column": r.column or "outreach",
+                    "color": r.color or "amber-transparent",
+                    "not_pushing_forward": r.not_pushing_forward or False,
+                    "interview": interviews.get(r.id),
+                }
+                for r in rows
+            ]
+
+    def _get_candidate_row(self, session: Session, role_id: str, candidate_id: str, options=None):
+        """Fetch a candidate by primary key via session.get, which consults
+        the identity map and skips query compilation; the role_id scope
+        check the old filters enforced happens in Python."""
+        c = session.get(CandidateModel, candidate_id, options=options)
+        if c is None or c.role_id != role_id:
+            return None
+        return c
+
     def get_candidate(self, role_id: str, candidate_id: str) -> Optional[Dict[str, Any]]:
         with self._get_session() as session:
-            c = session.query(CandidateModel).filter(
-                CandidateModel.role_id == role_id,
-                CandidateModel.id == candidate_id
-            ).first()
+            c = self._get_candidate_row(session, role_id, candidate_id)
             return self._candidate_to_dict(c) if c else None
 
+    def get_candidate_with_interview(self, role_id: str, candidate_id: str) -> Optional[Dict[str, Any]]:
+        """Get a candidate with their interview attached under "interview".
+
+        One JOIN instead of the get_candidate + get_interview_data pair;
+        the joined 1:1 row is small enough that widening the SELECT beats a
+        second round-trip. Callers that don't need the interview should stay
+        on get_candidate to avoid the over-fetch.
+        """
+        with self._get_session() as session:
+            c = self._get_candidate_row(
+                session, role_id, candidate_id,
+                options=[joinedload(CandidateModel.interview)],
+            )
+            if not c:
+                return None
+            result = self._candidate_to_dict(c)
+            result["interview"] = self._interview_to_dict(c.interview) if c.interview else None
+            return result
+
     def delete_candidate(self, role_id: str, candidate_id: str) -> bool:
         """Delete a candidate (and their interview via cascade). Returns True if deleted."""
         with self._get_session() as session:
-            c = session.query(CandidateModel).filter(
-                CandidateModel.role_id == role_id,
-                CandidateModel.id == candidate_id
-            ).first()
+            c = self._get_candidate_row(session, role_id, candidate_id)
             if not c:
                 return False
             session.delete(c)
@@ -338,49 +663,123 @@ class DatabaseStorageService:
         return True
 
     def update_candidate_status(self, role_id: str, candidate_id: str, status: Dict[str, Any]):
+        # Fast path: plain field assignment needs no read-modify-write, so a
+        # single UPDATE ... WHERE replaces the SELECT + mutate + UPDATE pair.
+        if "checklist" not in status and status.get("column") != "follow-up":
+            sanitized = {
+                k: v for k, v in status.items()
+                if k != "id" and k in _CANDIDATE_COL_KEYS
+                and not (v is None and k in _CANDIDATE_JSON_COLS)
+            }
+            with self._get_session() as session:
+                session.execute(
+                    update(CandidateModel)
+                    .where(
+                        CandidateModel.role_id == role_id,
+                        CandidateModel.id == candidate_id,
+                    )
+                    .values(updated_at=_now_iso(), **sanitized),
+                    execution_options={"synchronize_session": False},
+                )
+                session.commit()
+            return
+        # Merge path: the checklist merge and the follow-up seed run inside
+        # SQLite via json_patch(), so a checklist tick is still one UPDATE
+        # rather than a read-decode-merge-encode-write cycle. json_patch
+        # drops null-valued patch keys (RFC 7386) where dict.update would
+        # store None; checklist values are booleans, so that never arises.
+        params: Dict[str, Any] = {
+            "_now": _now_iso(), "_rid": role_id, "_cid": candidate_id,
+        }
+        sets = ['"updated_at" = :_now']
+        merged = "json_patch(coalesce(\"checklist\", '{}'), :_patch)"
+        patch = status.get("checklist")
+        if isinstance(patch, dict):
+            params["_patch"] = _json_dumps(patch)
+            if status.get("column") == "follow-up":
+                # Moving to follow-up with an empty checklist seeds the
+                # default instead of applying the patch, matching the
+                # pre-merge seeding order.
+                params["_default"] = _json_dumps(_DEFAULT_CHECKLIST)
+                sets.append(
+                    "\"checklist\" = CASE WHEN coalesce(\"checklist\", '{}') = '{}' "
+                    f"THEN :_default ELSE {merged} END"
+                )
+            else:
+                sets.append(f'"checklist" = {merged}')
+            if "column" not in status:
+                # Completing the screening interview promotes the candidate;
+                # an explicit column in the patch takes precedence.
+                sets.append(
+                    f"\"column\" = CASE WHEN json_extract({merged}, "
+                    "'$.screening_interview_completed') "
+                    "THEN 'evaluation' ELSE \"column\" END"
+                )
+        elif status.get("column") == "follow-up":
+            params["_default"] = _json_dumps(_DEFAULT_CHECKLIST)
+            sets.append(
+                "\"checklist\" = CASE WHEN coalesce(\"checklist\", '{}') = '{}' "
+                'THEN :_default ELSE "checklist" END'
+            )
+        for k, v in status.items():
+            if k in ("id", "checklist") or k not in _CANDIDATE_COL_KEYS:
+                continue
+            if k in _CANDIDATE_JSON_COLS:
+                if v is None:
+                    continue
+                v = _json_dumps(v)
+            sets.append(f'"{k}" = :{k}')
+            params[k] = v
         with self._get_session() as session:
-            c = session.query(CandidateModel).filter(
-                CandidateModel.role_id == role_id,
-                CandidateModel.id == candidate_id
-            ).first()
-            if not c:
-                return
-            if status.get("column") == "follow-up" and not _json_loads(c.checklist):
-                status["checklist"] = {
-                    "consent_form_sent": False,
-                    "consent_form_received": False,
-                    "updated_cv_received": False,
-                    "screening_interview_scheduled": False,
-                    "screening_interview_completed": False,
-                }
-            if "checklist" in status and isinstance(status.get("checklist"), dict):
-                current = _json_loads(c.checklist, {})
-                current.update(status["checklist"])
-                status = {k: v for k, v in status.items() if k != "checklist"}
-                c.checklist = _json_dumps(current)
-                if current.get("screening_interview_completed"):
-                    c.column = "evaluation"
-            for k, v in status.items():
-                if k in ("skills", "parsed_insights", "checklist", "consent_email", "consent_reply", "simulated_email", "outreach_reply"):
-                    if v is not None:
-                        setattr(c, k, _json_dumps(v) if isinstance(v, (dict, list)) else v)
-                elif hasattr(c, k):
-                    setattr(c, k, v)
-            c.updated_at = datetime.now().isoformat()
+            session.execute(
+                text(
+                    f'UPDATE candidates SET {", ".join(sets)} '
+                    'WHERE "role_id" = :_rid AND "id" = :_cid'
+                ),
+                params,
+            )
             session.commit()
 
+    def bulk_update_candidates(self, updates: List[tuple]) -> int:
+        """Apply plain field patches to many candidates in one transaction.
+
+        updates is a list of (role_id, candidate_id, patch) tuples. Identical
+        patches collapse into a single UPDATE ... WHERE id IN (...), so a
+        batch job flipping one flag across N candidates costs one statement
+        instead of N SELECT+UPDATE pairs. Skips the checklist-merge semantics
+        of update_candidate_status.
+        """
+        if not updates:
+            return 0
+        now = _now_iso()
+        groups: Dict[str, tuple] = {}
+        for _role_id, candidate_id, patch in updates:
+            key = _json_dumps(dict(sorted(patch.items())))
+            groups.setdefault(key, (patch, []))[1].append(candidate_id)
+        count = 0
+        with self._get_session() as session:
+            for patch, ids in groups.values():
+                result = session.execute(
+                    update(CandidateModel)
+                    .where(CandidateModel.id.in_(ids))
+                    .values(updated_at=now, **patch),
+                    # Nothing is loaded in this short-lived session, so skip
+                    # the identity-map synchronization scan entirely.
+                    execution_options={"synchronize_session": False},
+                )
+                count += result.rowcount
+            session.commit()
+        return count
+
     def save_outreach_message(self, role_id: str, candidate_id: str, message: str):
         self.update_candidate_status(role_id, candidate_id, {"outreach_message": message, "outreach_sent": True})
 
     def update_outreach_message(self, role_id: str, candidate_id: str, message: str):
         with self._get_session() as session:
-            c = session.query(CandidateModel).filter(
-                CandidateModel.role_id == role_id,
-                CandidateModel.id == candidate_id
-            ).first()
+            c = self._get_candidate_row(session, role_id, candidate_id)
             if c:
                 c.outreach_message = message
-                c.updated_at = datetime.now().isoformat()
+                c.updated_at = _now_iso()
                 session.commit()
 
     def record_outreach_reply(
@@ -390,32 +789,36 @@ class DatabaseStorageService:
         reply_data: Dict[str, Any],
         move_to_follow_up_if_positive: bool = True,
     ) -> Optional[Dict[str, Any]]:
-        candidate = self.get_candidate(role_id, candidate_id)
-        if not candidate:
-            return None
-        sentiment = reply_data.get("sentiment", "neutral")
-        outreach_reply = {
-            "content": reply_data.get("content") or reply_data.get("body") or "",
-            "subject": reply_data.get("subject", ""),
-            "sentiment": sentiment,
-            "intent": reply_data.get("intent", "needs_info"),
-            "analysis": reply_data.get("analysis", {}),
-            "received_at": datetime.now().isoformat(),
-        }
-        updates = {"outreach_reply": outreach_reply}
-        if move_to_follow_up_if_positive and sentiment == "positive":
-            updates["column"] = "follow-up"
-            existing = candidate.get("checklist") or {}
-            updates["checklist"] = {
-                **existing,
-                "consent_form_sent": False,
-                "consent_form_received": False,
-                "updated_cv_received": False,
-                "screening_interview_scheduled": False,
-                "screening_interview_completed": False,
+        # One session for the whole operation: the previous
+        # get_candidate -> update_candidate_status -> get_candidate chain
+        # opened three sessions and queried the same row three times.
+        with self._get_session() as session:
+            c = self._get_candidate_row(session, role_id, candidate_id)
+            if not c:
+                return None
+            sentiment = reply_data.get("sentiment", "neutral")
+            now = _now_iso()
+            c.outreach_reply = {
+                "content": reply_data.get("content") or reply_data.get("body") or "",
+                "subject": reply_data.get("subject", ""),
+                "sentiment": sentiment,
+                "intent": reply_data.get("intent", "needs_info"),
+                "analysis": reply_data.get("analysis", {}),
+                "received_at": now,
             }
-        self.update_candidate_status(role_id, candidate_id, updates)
-        return self.get_candidate(role_id, candidate_id)
+            if move_to_follow_up_if_positive and sentiment == "positive":
+                c.column = "follow-up"
+                c.checklist = {
+                    **(c.checklist or {}),
+                    "consent_form_sent": False,
+                    "consent_form_received": False,
+                    "updated_cv_received": False,
+                    "screening_interview_scheduled": False,
+                    "screening_interview_completed": False,
+                }
+            c.updated_at = now
+            session.commit()
+            return self._candidate_to_dict(c)
 
     # ---------- HR Briefings ----------
     def save_hr_briefing(
@@ -433,18 +836,23 @@ class DatabaseStorageService:
     def create_hr_briefing(self, briefing_data: Dict[str, Any], role_ids: List[str], briefing_id: str = None) -> str:
         if not briefing_id:
             briefing_id = str(uuid.uuid4())
-        now = datetime.now().isoformat()
+        now = _now_iso()
         with self._get_session() as session:
             b = HRBriefingModel(
                 id=briefing_id,
                 summary=briefing_data.get("summary", ""),
-                extracted_fields=_json_dumps(briefing_data.get("extracted_fields", {})),
+                extracted_fields=briefing_data.get("extracted_fields", {}),
                 transcription=briefing_data.get("transcription", ""),
                 created_at=now,
             )
             session.add(b)
-            for rid in role_ids:
-                session.add(RoleHRBriefing(role_id=rid, briefing_id=briefing_id))
+            if role_ids:
+                # One executemany INSERT for the link rows instead of an ORM
+                # add (and its unit-of-work bookkeeping) per role
+                session.execute(
+                    insert(RoleHRBriefing),
+                    [{"role_id": rid, "briefing_id": briefing_id} for rid in role_ids],
+                )
             session.commit()
         return briefing_id
 
@@ -455,19 +863,32 @@ class DatabaseStorageService:
                 .order_by(desc(HRBriefingModel.created_at))
                 .all()
             )
+            # Three queries total: briefings, all links grouped by briefing,
+            # and the titles of every referenced role - instead of one link
+            # query per briefing plus one role query per assigned role.
+            links_by_briefing: Dict[str, List[str]] = {}
+            for link_briefing_id, link_role_id in session.execute(
+                select(RoleHRBriefing.briefing_id, RoleHRBriefing.role_id)
+            ):
+                links_by_briefing.setdefault(link_briefing_id, []).append(link_role_id)
+            all_role_ids = {rid for rids in links_by_briefing.values() for rid in rids}
+            titles = {}
+            if all_role_ids:
+                titles = dict(session.execute(
+                    select(RoleModel.id, RoleModel.title).where(RoleModel.id.in_(all_role_ids))
+                ).all())
             result = []
             for b in briefings:
-                links = session.query(RoleHRBriefing).filter(RoleHRBriefing.briefing_id == b.id).all()
-                role_ids = [l.role_id for l in links]
+                role_ids = links_by_briefing.get(b.id, [])
                 # Resolve role titles so Assigned Roles display even when role not in main roles list
-                assigned_roles = []
-                for rid in role_ids:
-                    r = session.query(RoleModel).filter(RoleModel.id == rid).first()
-                    assigned_roles.append({"id": rid, "title": r.title if r else f"Unknown role ({rid[:8]})"})
+                assigned_roles = [
+                    {"id": rid, "title": titles[rid] if rid in titles else f"Unknown role ({rid[:8]})"}
+                    for rid in role_ids
+                ]
                 result.append({
                     "id": b.id,
                     "summary": b.summary,
-                    "extracted_fields": _json_loads(b.extracted_fields, {}),
+                    "extracted_fields": b.extracted_fields or {},
                     "transcription": b.transcription or "",
                     "role_ids": role_ids,
                     "assigned_roles": assigned_roles,
@@ -480,7 +901,7 @@ class DatabaseStorageService:
             link = session.query(RoleHRBriefing).filter(RoleHRBriefing.role_id == role_id).first()
             if not link:
                 return None
-            b = session.query(HRBriefingModel).filter(HRBriefingModel.id == link.briefing_id).first()
+            b = session.get(HRBriefingModel, link.briefing_id)
             if not b:
                 return None
             all_links = session.query(RoleHRBriefing).filter(RoleHRBriefing.briefing_id == b.id).all()
@@ -488,7 +909,7 @@ class DatabaseStorageService:
             return {
                 "id": b.id,
                 "summary": b.summary,
-                "extracted_fields": _json_loads(b.extracted_fields, {}),
+                "extracted_fields": b.extracted_fields or {},
                 "transcription": b.transcription or "",
                 "role_ids": role_ids,
                 "created_at": b.created_at,
@@ -497,12 +918,15 @@ class DatabaseStorageService:
     def update_hr_briefing_roles(self, briefing_id: str, role_ids: List[str]) -> bool:
         """Set the assigned roles for a briefing (replaces existing)."""
         with self._get_session() as session:
-            b = session.query(HRBriefingModel).filter(HRBriefingModel.id == briefing_id).first()
+            b = session.get(HRBriefingModel, briefing_id)
             if not b:
                 return False
             session.query(RoleHRBriefing).filter(RoleHRBriefing.briefing_id == briefing_id).delete()
-            for rid in role_ids:
-                session.add(RoleHRBriefing(role_id=rid, briefing_id=briefing_id))
+            if role_ids:
+                session.execute(
+                    insert(RoleHRBriefing),
+                    [{"role_id": rid, "briefing_id": briefing_id} for rid in role_ids],
+                )
             session.commit()
         return True
 
@@ -510,7 +934,7 @@ class DatabaseStorageService:
         """Delete briefing row (role links cascade) and optional audio folder on disk."""
         briefing_dir = self.base_dir / "hr_briefings" / briefing_id
         with self._get_session() as session:
-            b = session.query(HRBriefingModel).filter(HRBriefingModel.id == briefing_id).first()
+            b = session.get(HRBriefingModel, briefing_id)
             if not b:
                 return False
             session.delete(b)
@@ -520,19 +944,18 @@ class DatabaseStorageService:
         return True
 
     # ---------- Interviews ----------
-    def save_interview_audio(self, role_id: str, candidate_id: str, file) -> tuple:
+    def save_interview_audio(self, role_id: str, candidate_id: str, filename: Optional[str], content) -> tuple:
         candidate_dir = self._get_candidate_dir(role_id, candidate_id)
         interviews_dir = candidate_dir / "interviews"
         interviews_dir.mkdir(parents=True, exist_ok=True)
         interview_id = str(uuid.uuid4())
-        ext = Path(file.filename).suffix if file.filename else ".mp3"
+        ext = Path(filename).suffix if filename else ".mp3"
         audio_path = interviews_dir / f"{interview_id}{ext}"
-        with open(audio_path, "wb") as f:
-            f.write(file.file.read())
+        _write_upload(audio_path, content)
         return audio_path, interview_id
 
     def save_interview_data(self, role_id: str, candidate_id: str, interview_data: Dict[str, Any]):
-        now = datetime.now().isoformat()
+        now = _now_iso()
         with self._get_session() as session:
             inv = session.query(InterviewModel).filter(
                 InterviewModel.role_id == role_id,
@@ -542,11 +965,11 @@ class DatabaseStorageService:
                 inv.summary = interview_data.get("summary", "")
                 inv.transcription = interview_data.get("transcription", "")
                 inv.fit_score = interview_data.get("fit_score")
-                inv.key_points = _json_dumps(interview_data.get("key_points", []))
-                inv.strengths = _json_dumps(interview_data.get("strengths", []))
-                inv.concerns = _json_dumps(interview_data.get("concerns", []))
+                inv.key_points = interview_data.get("key_points", [])
+                inv.strengths = interview_data.get("strengths", [])
+                inv.concerns = interview_data.get("concerns", [])
                 inv.recommendation = interview_data.get("recommendation")
-                inv.candidate_responses = _json_dumps(interview_data.get("candidate_responses", {}))
+                inv.candidate_responses = interview_data.get("candidate_responses", {})
                 inv.interview_completed = interview_data.get("interview_completed", True)
                 inv.updated_at = now
             else:
@@ -556,11 +979,11 @@ class DatabaseStorageService:
                     summary=interview_data.get("summary", ""),
                     transcription=interview_data.get("transcription", ""),
                     fit_score=interview_data.get("fit_score"),
-                    key_points=_json_dumps(interview_data.get("key_points", [])),
-                    strengths=_json_dumps(interview_data.get("strengths", [])),
-                    concerns=_json_dumps(interview_data.get("concerns", [])),
+                    key_points=interview_data.get("key_points", []),
+                    strengths=interview_data.get("strengths", []),
+                    concerns=interview_data.get("concerns", []),
                     recommendation=interview_data.get("recommendation"),
-                    candidate_responses=_json_dumps(interview_data.get("candidate_responses", {})),
+                    candidate_responses=interview_data.get("candidate_responses", {}),
                     interview_completed=interview_data.get("interview_completed", True),
                     created_at=now,
                     updated_at=now,
@@ -575,37 +998,40 @@ class DatabaseStorageService:
             ).first()
             if not inv:
                 return None
-            return {
-                "summary": inv.summary,
-                "transcription": inv.transcription,
-                "fit_score": inv.fit_score,
-                "key_points": _json_loads(inv.key_points, []),
-                "strengths": _json_loads(inv.strengths, []),
-                "concerns": _json_loads(inv.concerns, []),
-                "recommendation": inv.recommendation,
-                "candidate_responses": _json_loads(inv.candidate_responses, {}),
-                "interview_completed": inv.interview_completed if inv.interview_completed is not None else True,
-            }
+            return self._interview_to_dict(inv)
+
+    def _interview_to_dict(self, inv: InterviewModel) -> Dict[str, Any]:
+        return {
+            "summary": inv.summary,
+            "transcription": inv.transcription,
+            "fit_score": inv.fit_score,
+            "key_points": inv.key_points or [],
+            "strengths": inv.strengths or [],
+            "concerns": inv.concerns or [],
+            "recommendation": inv.recommendation,
+            "candidate_responses": inv.candidate_responses or {},
+            "interview_completed": inv.interview_completed if inv.interview_completed is not None else True,
+        }
 
     # ---------- Evaluation Chat ----------
     def save_evaluation_chat(self, role_id: str, messages: List[Dict[str, Any]]) -> bool:
-        now = datetime.now().isoformat()
+        now = _now_iso()
         with self._get_session() as session:
-            chat = session.query(EvaluationChatModel).filter(EvaluationChatModel.role_id == role_id).first()
+            chat = session.get(EvaluationChatModel, role_id)
             if chat:
-                chat.messages = _json_dumps(messages)
+                chat.messages = list(messages)  # fresh list so the JSON column registers the change
                 chat.updated_at = now
             else:
-                session.add(EvaluationChatModel(role_id=role_id, messages=_json_dumps(messages), updated_at=now))
+                session.add(EvaluationChatModel(role_id=role_id, messages=list(messages), updated_at=now))
             session.commit()
         return True
 
     def get_evaluation_chat(self, role_id: str) -> List[Dict[str, Any]]:
         with self._get_session() as session:
-            chat = session.query(EvaluationChatModel).filter(EvaluationChatModel.role_id == role_id).first()
+            chat = session.get(EvaluationChatModel, role_id)
             if not chat or not chat.messages:
                 return []
-            return _json_loads(chat.messages, [])
+            return chat.messages
 
     # ---------- Consents (generic) ----------
     def get_all_consents(self) -> List[Dict[str, Any]]:
@@ -621,45 +1047,58 @@ class DatabaseStorageService:
             ]
 
     def get_consent_template(self, content_id: str) -> Optional[Dict[str, Any]]:
+        cached = self._cache_get(self._template_cache, content_id)
+        if cached is not _CACHE_MISS:
+            return cached
         with self._get_session() as session:
-            t = session.query(ConsentTemplateModel).filter(ConsentTemplateModel.id == content_id).first()
+            t = session.get(ConsentTemplateModel, content_id)
             if not t:
                 return None
-            return {"id": t.id, "name": t.name, "content": t.content, "created_at": t.created_at, "updated_at": t.updated_at}
+            template = {"id": t.id, "name": t.name, "content": t.content, "created_at": t.created_at, "updated_at": t.updated_at}
+            self._cache_put(self._template_cache, content_id, template)
+            return template
 
     def save_consent_template(self, name: str, content: str, content_id: str = None) -> str:
         if not content_id:
             content_id = str(uuid.uuid4())
-        now = datetime.now().isoformat()
+        now = _now_iso()
         with self._get_session() as session:
-            t = session.query(ConsentTemplateModel).filter(ConsentTemplateModel.id == content_id).first()
-            if t:
-                t.name = name
-                t.content = content
-                t.updated_at = now
-            else:
+            # UPDATE first: the common re-save is one statement; only a
+            # brand-new template pays the extra INSERT.
+            result = session.execute(
+                update(ConsentTemplateModel)
+                .where(ConsentTemplateModel.id == content_id)
+                .values(name=name, content=content, updated_at=now),
+                execution_options={"synchronize_session": False},
+            )
+            if result.rowcount == 0:
                 session.add(ConsentTemplateModel(id=content_id, name=name, content=content, created_at=now, updated_at=now))
             session.commit()
+        self._cache_drop(self._template_cache, content_id)
         return content_id
 
     def delete_consent_template(self, content_id: str) -> bool:
         with self._get_session() as session:
-            t = session.query(ConsentTemplateModel).filter(ConsentTemplateModel.id == content_id).first()
+            t = session.get(ConsentTemplateModel, content_id)
             if t:
                 session.delete(t)
                 session.commit()
+                self._cache_drop(self._template_cache, content_id)
                 return True
         return False
 
     # ---------- Consent email & reply ----------
     def send_consent_email(self, role_id: str, candidate_id: str, consent_data: Dict[str, Any]) -> bool:
-        role = self.get_role(role_id)
-        candidate = self.get_candidate(role_id, candidate_id)
-        if not candidate:
-            return False
-        role_title = (role or {}).get("title", consent_data.get("role_title", "Position"))
-        subject = consent_data.get("subject", f"Consent Request - {role_title}")
-        email_content = f"""Dear {consent_data.get('candidate_name', candidate.get('name', 'Candidate'))},
+        # Single session: the role title lookup and the candidate update ride
+        # one connection instead of three separate sessions.
+        with self._get_session() as session:
+            c = self._get_candidate_row(session, role_id, candidate_id)
+            if not c:
+                return False
+            role = session.get(RoleModel, role_id)
+            role_title = role.title if role and role.title else consent_data.get("role_title", "Position")
+            subject = consent_data.get("subject", f"Consent Request - {role_title}")
+            email_content = f"""Dear {consent_data.get('candidate_name', c.name or 'Candidate')},
 
 Thank you for your interest in the {role_title} role.
 
@@ -673,55 +1112,52 @@ Please reply to this email with either:
 
 Best regards,
 Recruitment Team"""
-        consent_email = {
-            "to": consent_data.get("email", f"{candidate.get('name', '')}@example.com"),
-            "subject": subject,
-            "content": email_content,
-            "consent_content": consent_data.get("consent_content", ""),
-            "consent_content_id": consent_data.get("consent_content_id", ""),
-            "candidate_name": consent_data.get("candidate_name", candidate.get("name", "")),
-            "sent_at": datetime.now().isoformat(),
-            "status": "sent",
-        }
-        checklist = (candidate.get("checklist") or {}).copy()
-        checklist["consent_form_sent"] = True
-        self.update_candidate_status(role_id, candidate_id, {
-            "consent_email": consent_email,
-            "consent_form_sent": True,
-            "email_status": "consent_sent",
-            "checklist": checklist,
-        })
+            now = _now_iso()
+            c.consent_email = {
+                "to": consent_data.get("email", f"{c.name or ''}@example.com"),
+                "subject": subject,
+                "content": email_content,
+                "consent_content": consent_data.get("consent_content", ""),
+                "consent_content_id": consent_data.get("consent_content_id", ""),
+                "candidate_name": consent_data.get("candidate_name", c.name or ""),
+                "sent_at": now,
+                "status": "sent",
+            }
+            c.consent_form_sent = True
+            c.email_status = "consent_sent"
+            c.checklist = {**(c.checklist or {}), "consent_form_sent": True}
+            c.updated_at = now
+            session.commit()
         return True
 
     def record_consent_reply(self, role_id: str, candidate_id: str, reply_data: Dict[str, Any]) -> bool:
-        candidate = self.get_candidate(role_id, candidate_id)
-        if not candidate:
-            return False
-        consent_status = reply_data.get("consent_status", "consented")
-        simulated_email = {
-            "content": reply_data.get("content", ""),
-            "sentiment": reply_data.get("sentiment", "positive"),
-            "intent": reply_data.get("intent", "interested"),
-            "analysis": reply_data.get("analysis", {}),
-            "timestamp": datetime.now().isoformat(),
-            "type": "consent_reply",
-            "consent_status": consent_status,
-            "consent_content": (candidate.get("consent_email") or {}).get("consent_content", ""),
-            "consent_content_id": (candidate.get("consent_email") or {}).get("consent_content_id", ""),
-        }
-        consent_reply = {
-            "received_at": datetime.now().isoformat(),
-            "status": consent_status,
-            "responded_by": candidate.get("name", ""),
-            "response": reply_data.get("response", "I CONSENT" if consent_status == "consented" else "I DO NOT CONSENT"),
-        }
-        checklist = (candidate.get("checklist") or {}).copy()
-        checklist["consent_form_received"] = consent_status == "consented"
-        self.update_candidate_status(role_id, candidate_id, {
-            "simulated_email": simulated_email,
-            "consent_reply": consent_reply,
-            "consent_form_received": consent_status == "consented",
-            "email_status": "consent_received" if consent_status == "consented" else "consent_declined",
-            "checklist": checklist,
-        })
+        with self._get_session() as session:
+            c = self._get_candidate_row(session, role_id, candidate_id)
+            if not c:
+                return False
+            consent_status = reply_data.get("consent_status", "consented")
+            consented = consent_status == "consented"
+            now = _now_iso()
+            c.simulated_email = {
+                "content": reply_data.get("content", ""),
+                "sentiment": reply_data.get("sentiment", "positive"),
+                "intent": reply_data.get("intent", "interested"),
+                "analysis": reply_data.get("analysis", {}),
+                "timestamp": now,
+                "type": "consent_reply",
+                "consent_status": consent_status,
+                "consent_content": (c.consent_email or {}).get("consent_content", ""),
+                "consent_content_id": (c.consent_email or {}).get("consent_content_id", ""),
+            }
+            c.consent_reply = {
+                "received_at": now,
+                "status": consent_status,
+                "responded_by": c.name or "",
+                "response": reply_data.get("response", "I CONSENT" if consented else "I DO NOT CONSENT"),
+            }
+            c.consent_form_received = consented
+            c.email_status = "consent_received" if consented else "consent_declined"
+            c.checklist = {**(c.checklist or {}), "consent_form_received": consented}
+            c.updated_at = now
+            session.commit()
         return True
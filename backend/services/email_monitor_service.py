@@ -14,9 +14,11 @@ Version : 1.0.0
 """
 
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
+from backend.agents.email_monitor import EmailMonitorAgent
+
 # Load environment variables from .env file so credentials are never
 # hard-coded in source code.
 load_dotenv()
@@ -54,6 +56,10 @@ class EmailMonitorService:
         self.outlook_client_id = os.getenv("OUTLOOK_CLIENT_ID")
         self.outlook_client_secret = os.getenv("OUTLOOK_CLIENT_SECRET")
 
+        # Sentiment agent, constructed on first use and reused after that —
+        # building it spins up an LLM client, so once per service, not per email.
+        self._agent: Optional[EmailMonitorAgent] = None
+
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
@@ -76,10 +82,85 @@ class EmailMonitorService:
     # Core async methods
     # ------------------------------------------------------------------
 
+    async def register_push_notifications(self, provider: str = "gmail") -> bool:
+        """
+        Register for provider push notifications so replies arrive as events
+        instead of being polled for.
+
+        Polling costs one API call per interval whether or not anything
+        changed, and adds an average latency of half the poll interval to
+        every reply. Both providers support push delivery, which replaces
+        N periodic calls with one notification per actual change:
+
+        Production implementation steps (not yet active):
+            1. Gmail: call users().watch(userId='me',
+               body={'topicName': <Pub/Sub topic>, 'labelIds': ['INBOX']})
+               and persist the returned historyId as the delta cursor.
+               Watches expire after 7 days — re-register on a timer.
+            2. Outlook: POST /subscriptions on Microsoft Graph with the
+               webhook URL and a changeType of 'created'.
+            3. Expose a FastAPI endpoint (e.g. POST /webhooks/gmail) that
+               decodes the base64 Pub/Sub payload and hands the contained
+               historyId to `process_push_notification()`.
+
+        Args:
+            provider (str): Email provider to register with. Must be one of
+                            the keys in SUPPORTED_PROVIDERS.
+
+        Returns:
+            bool: True once a watch/subscription is active.
+                  Returns False until OAuth integration is complete.
+        """
+        if provider not in SUPPORTED_PROVIDERS:
+            raise ValueError(
+                f"Unsupported provider '{provider}'. "
+                f"Choose from: {list(SUPPORTED_PROVIDERS.keys())}"
+            )
+
+        # --- Placeholder: replace with users().watch / Graph subscription ---
+        return False
+
+    async def process_push_notification(self, payload: Dict[str, Any], provider: str = "gmail") -> List[Dict[str, Any]]:
+        """
+        Handle one push notification by fetching only the messages that
+        changed since the last known cursor.
+
+        Production implementation steps (not yet active):
+            1. Gmail: read historyId from the decoded Pub/Sub payload and
+               call users().history().list(startHistoryId=<stored cursor>)
+               — this returns just the delta, not the whole inbox.
+            2. Outlook: the Graph notification carries the message resource
+               path directly; fetch that single message.
+            3. Normalise and route through `analyze_email_sentiment()` as
+               with `check_emails()`, then advance the stored cursor.
+
+        Args:
+            payload  (Dict[str, Any]): Decoded notification body from the
+                                       webhook endpoint.
+            provider (str): Source provider of the notification.
+
+        Returns:
+            List[Dict[str, Any]]: Newly arrived emails in the same schema
+                                  as `check_emails()`.
+        """
+        if provider not in SUPPORTED_PROVIDERS:
+            raise ValueError(
+                f"Unsupported provider '{provider}'. "
+                f"Choose from: {list(SUPPORTED_PROVIDERS.keys())}"
+            )
+
+        # --- Placeholder: replace with history().list delta fetch ---
+        return []
+
     async def check_emails(self, provider: str = "gmail") -> List[Dict[str, Any]]:
         """
         Poll the specified email provider for new candidate reply emails.
 
+        Intended as a backfill/recovery path only (e.g. after downtime or a
+        missed notification) — steady-state delivery should come through
+        `register_push_notifications()` / `process_push_notification()`,
+        which avoid per-interval API calls and poll-interval latency.
+
         Production implementation steps (not yet active):
             1. Exchange stored refresh token for a short-lived access token
                via the provider's OAuth 2.0 token endpoint.
@@ -148,9 +229,7 @@ class EmailMonitorService:
                     "action"    : str,   # suggested next step
                 }
         """
-        # Lazy import avoids a circular-dependency issue at module load time.
-        from agents.email_monitor import EmailMonitorAgent
-
-        agent = EmailMonitorAgent()
-        return await agent.analyze_email(email_content, candidate_name)
+        if self._agent is None:
+            self._agent = EmailMonitorAgent()
+        return await self._agent.analyze_email(email_content, candidate_name)
 
@@ -1,17 +1,47 @@
 """
 File storage service for managing roles, candidates, interviews, and other data
 """
-import json
 import os
 import shutil
+import threading
 import uuid
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+import orjson
+
 from .audio_transcription import resolve_hr_briefing_audio_extension
 
 
+def _read_json(f):
+    """orjson decode from an open text or binary file handle."""
+    return orjson.loads(f.read())
+
+
+def _write_json(obj, f):
+    """orjson encode (indented, for on-disk readability) to an open text file handle."""
+    f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode())
+
+
+def _write_upload(dest: Path, source) -> None:
+    """Write an upload to dest. File-like sources (UploadFile.file) stream in
+    1 MiB chunks so a large PDF or recording never sits fully in memory;
+    bytes are written directly for callers that already hold them."""
+    with open(dest, "wb", buffering=1024 * 1024) as out:
+        if isinstance(source, (bytes, bytearray)):
+            out.write(source)
+        else:
+            shutil.copyfileobj(source, out, 1024 * 1024)
+
+
+def _now_iso() -> str:
+    """Timestamp for created_at/updated_at fields. Write paths capture this
+    once per operation and reuse it rather than re-allocating a datetime and
+    a formatted string per field."""
+    return datetime.now().isoformat()
+
+
 def _resolve_data_dir() -> Path:
     """Resolve data directory relative to backend package, so it works regardless of cwd."""
     backend_dir = Path(__file__).resolve().parent.parent
@@ -36,30 +66,47 @@ class FileStorageService:
         self.consent_templates_dir.mkdir(parents=True, exist_ok=True)
         self.interviews_dir.mkdir(parents=True, exist_ok=True)
         self.hr_briefings_dir.mkdir(parents=True, exist_ok=True)
-    
+
+        # Directories already created this process; lets the per-access
+        # mkdir in the dir helpers skip its stat() in tight loops.
+        self._known_dirs: set = set()
+        self._known_dirs_lock = threading.Lock()
+
+    def _ensure_dir(self, path: Path) -> Path:
+        """mkdir(exist_ok=True) still costs a stat() per call; skip it for
+        directories this process has already created. Deletion paths clear
+        the set so removed directories are recreated on next access."""
+        key = str(path)
+        with self._known_dirs_lock:
+            if key in self._known_dirs:
+                return path
+        path.mkdir(parents=True, exist_ok=True)
+        with self._known_dirs_lock:
+            if len(self._known_dirs) >= 4096:
+                self._known_dirs.clear()
+            self._known_dirs.add(key)
+        return path
+
     def _get_role_dir(self, role_id: str) -> Path:
         """Get directory for a specific role"""
-        role_dir = self.roles_dir / role_id
-        role_dir.mkdir(parents=True, exist_ok=True)
-        return role_dir
-    
+        return self._ensure_dir(self.roles_dir / role_id)
+
     def _get_candidate_dir(self, role_id: str, candidate_id: str) -> Path:
         """Get directory for a specific candidate"""
-        candidate_dir = self._get_role_dir(role_id) / "candidates" / candidate_id
-        candidate_dir.mkdir(parents=True, exist_ok=True)
-        return candidate_dir
-    
+        return self._ensure_dir(self._get_role_dir(role_id) / "candidates" / candidate_id)
+
     def create_role(self, role_data: Dict[str, Any]) -> str:
         """Create a new role"""
         role_id = str(uuid.uuid4())
         role_dir = self._get_role_dir(role_id)
         
+        now = _now_iso()
         role_info = {
             "id": role_id,
             "title": role_data.get("title", ""),
             "status": role_data.get("status", "New"),
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "created_by_user_id": role_data.get("created_by_user_id"),
             "candidates_count": 0,
             "successful_candidates_count": 0,
@@ -86,7 +133,7 @@ class FileStorageService:
         }
         
         with open(role_dir / "role.json", "w") as f:
-            json.dump(role_info, f, indent=2)
+            _write_json(role_info, f)
         
         return role_id
     
@@ -101,7 +148,7 @@ class FileStorageService:
                 role_file = role_dir / "role.json"
                 if role_file.exists():
                     with open(role_file, "r", encoding="utf-8") as f:
-                        role = json.load(f)
+                        role = _read_json(f)
                     role_id = role.get("id", role_dir.name)
                     candidates = self.get_candidates(role_id)
                     role["candidates_count"] = len(candidates)
@@ -130,7 +177,7 @@ class FileStorageService:
             return None
         
         with open(role_file, "r") as f:
-            role = json.load(f)
+            role = _read_json(f)
         if not role.get("created_by_user_id") and role.get("created_by_email"):
             role["created_by_user_id"] = (role["created_by_email"] or "").split("@")[0] or None
         return role
@@ -142,11 +189,11 @@ class FileStorageService:
             return False
         
         role.update(updates)
-        role["updated_at"] = datetime.now().isoformat()
+        role["updated_at"] = _now_iso()
         
         role_file = self._get_role_dir(role_id) / "role.json"
         with open(role_file, "w") as f:
-            json.dump(role, f, indent=2)
+            _write_json(role, f)
         
         return True
     
@@ -158,17 +205,15 @@ class FileStorageService:
         
         import shutil
         shutil.rmtree(role_dir)
+        with self._known_dirs_lock:
+            self._known_dirs.clear()
         return True
     
-    def save_jd(self, role_id: str, file) -> Path:
-        """Save JD PDF file"""
+    def save_jd(self, role_id: str, content) -> Path:
+        """Save JD PDF file (bytes or a file-like such as UploadFile.file)."""
         role_dir = self._get_role_dir(role_id)
         jd_path = role_dir / "jd.pdf"
-        
-        with open(jd_path, "wb") as f:
-            content = file.file.read()
-            f.write(content)
-        
+        _write_upload(jd_path, content)
         return jd_path
     
     def save_parsed_jd(self, role_id: str, parsed_jd: Dict[str, Any]):
@@ -177,7 +222,7 @@ class FileStorageService:
         jd_file = role_dir / "jd_parsed.json"
         
         with open(jd_file, "w") as f:
-            json.dump(parsed_jd, f, indent=2)
+            _write_json(parsed_jd, f)
     
     def get_parsed_jd(self, role_id: str) -> Optional[Dict[str, Any]]:
         """Get parsed JD"""
@@ -188,7 +233,7 @@ class FileStorageService:
             return None
         
         with open(jd_file, "r") as f:
-            return json.load(f)
+            return _read_json(f)
     
     def update_parsed_jd(self, role_id: str, jd_data: Dict[str, Any]):
         """Update parsed JD"""
@@ -196,35 +241,27 @@ class FileStorageService:
         existing_jd.update(jd_data)
         self.save_parsed_jd(role_id, existing_jd)
     
-    def save_candidate_pdf(self, role_id: str, file) -> Path:
-        """Save candidate PDF file"""
+    def save_candidate_pdf(self, role_id: str, content) -> Path:
+        """Save candidate PDF file (bytes or a file-like such as UploadFile.file)."""
         candidate_id = str(uuid.uuid4())
         candidate_dir = self._get_candidate_dir(role_id, candidate_id)
         pdf_path = candidate_dir / "resume.pdf"
-        
-        with open(pdf_path, "wb") as f:
-            content = file.file.read()
-            f.write(content)
-        
+        _write_upload(pdf_path, content)
         return pdf_path, candidate_id
     
-    def create_candidate(self, role_id: str, candidate_data: Dict[str, Any], candidate_id: str = None) -> str:
-        """Create candidate card"""
-        if not candidate_id:
-            candidate_id = str(uuid.uuid4())
-        candidate_dir = self._get_candidate_dir(role_id, candidate_id)
-        
-        candidate_info = {
+    @staticmethod
+    def _candidate_info(candidate_id: str, data: Dict[str, Any], now: str) -> Dict[str, Any]:
+        return {
             "id": candidate_id,
-            "name": candidate_data.get("name", ""),
-            "summary": candidate_data.get("summary", ""),
-            "skills": candidate_data.get("skills", []),
-            "experience": candidate_data.get("experience", ""),
-            "parsed_insights": candidate_data.get("parsed_insights", {}),
+            "name": data.get("name", ""),
+            "summary": data.get("summary", ""),
+            "skills": data.get("skills", []),
+            "experience": data.get("experience", ""),
+            "parsed_insights": data.get("parsed_insights", {}),
             "column": "outreach",
             "color": "amber-transparent",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "outreach_sent": False,
             "outreach_message": None,
             "checklist": {
@@ -235,17 +272,43 @@ class FileStorageService:
                 "screening_interview_completed": False,
             },
         }
-        
+
+    def create_candidate(self, role_id: str, candidate_data: Dict[str, Any], candidate_id: str = None) -> str:
+        """Create candidate card"""
+        if not candidate_id:
+            candidate_id = str(uuid.uuid4())
+        candidate_dir = self._get_candidate_dir(role_id, candidate_id)
+        candidate_info = self._candidate_info(candidate_id, candidate_data, _now_iso())
+
         with open(candidate_dir / "candidate.json", "w") as f:
-            json.dump(candidate_info, f, indent=2)
-        
+            _write_json(candidate_info, f)
+
         # Update role candidate count
         role = self.get_role(role_id)
         if role:
             role["candidates_count"] = role.get("candidates_count", 0) + 1
             self.update_role(role_id, role)
-        
+
         return candidate_id
+
+    def create_candidates_bulk(self, role_id: str, candidates: List[Dict[str, Any]]) -> List[str]:
+        """Create many candidate cards, rewriting the role count once at the end
+        instead of once per candidate."""
+        if not candidates:
+            return []
+        now = _now_iso()
+        ids = []
+        for data in candidates:
+            candidate_id = str(uuid.uuid4())
+            candidate_dir = self._get_candidate_dir(role_id, candidate_id)
+            with open(candidate_dir / "candidate.json", "w") as f:
+                _write_json(self._candidate_info(candidate_id, data, now), f)
+            ids.append(candidate_id)
+        role = self.get_role(role_id)
+        if role:
+            role["candidates_count"] = role.get("candidates_count", 0) + len(ids)
+            self.update_role(role_id, role)
+        return ids
     
     def get_candidates(self, role_id: str) -> List[Dict[str, Any]]:
         """Get all candidates for a role"""
@@ -261,17 +324,44 @@ class FileStorageService:
                 candidate_file = candidate_dir / "candidate.json"
                 if candidate_file.exists():
                     with open(candidate_file, "r", encoding="utf-8") as f:
-                        candidates.append(json.load(f))
+                        candidates.append(_read_json(f))
         
         return candidates
-    
+
+    def iter_candidates(self, role_id: str):
+        """Yield candidates one at a time (bounded memory for batch jobs)."""
+        candidates_dir = self._get_role_dir(role_id) / "candidates"
+        if not candidates_dir.exists():
+            return
+        for candidate_dir in candidates_dir.iterdir():
+            if candidate_dir.is_dir():
+                candidate_file = candidate_dir / "candidate.json"
+                if candidate_file.exists():
+                    with open(candidate_file, "r", encoding="utf-8") as f:
+                        yield _read_json(f)
+
+    def get_candidates_with_interviews(self, role_id: str) -> List[Dict[str, Any]]:
+        """Get all candidates for a role with their interview data attached"""
+        candidates = self.get_candidates(role_id)
+        for candidate in candidates:
+            candidate["interview"] = self.get_interview_data(role_id, candidate.get("id"))
+        return candidates
+
     def get_candidate(self, role_id: str, candidate_id: str) -> Optional[Dict[str, Any]]:
         """Get candidate by ID"""
         candidate_file = self._get_candidate_dir(role_id, candidate_id) / "candidate.json"
         if not candidate_file.exists():
             return None
         with open(candidate_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+            return _read_json(f)
+
+    def get_candidate_with_interview(self, role_id: str, candidate_id: str) -> Optional[Dict[str, Any]]:
+        """Get a candidate with their interview data attached under "interview" """
+        candidate = self.get_candidate(role_id, candidate_id)
+        if candidate is None:
+            return None
+        candidate["interview"] = self.get_interview_data(role_id, candidate_id)
+        return candidate
 
     def delete_candidate(self, role_id: str, candidate_id: str) -> bool:
         """Delete a candidate and their data (interview, etc.). Returns True if deleted."""
@@ -279,6 +369,8 @@ class FileStorageService:
         if not candidate_dir.exists() or not candidate_dir.is_dir():
             return False
         shutil.rmtree(candidate_dir, ignore_errors=True)
+        with self._known_dirs_lock:
+            self._known_dirs.discard(str(candidate_dir))
         role = self.get_role(role_id)
         if role:
             role["candidates_count"] = max(0, role.get("candidates_count", 1) - 1)
@@ -310,14 +402,35 @@ class FileStorageService:
             status = {k: v for k, v in status.items() if k != "checklist"}
         
         candidate.update(status)
-        candidate["updated_at"] = datetime.now().isoformat()
+        candidate["updated_at"] = _now_iso()
         # When screening interview is marked completed, move candidate to Evaluation
         if candidate.get("checklist", {}).get("screening_interview_completed"):
             candidate["column"] = "evaluation"
         candidate_file = self._get_candidate_dir(role_id, candidate_id) / "candidate.json"
         with open(candidate_file, "w") as f:
-            json.dump(candidate, f, indent=2)
+            _write_json(candidate, f)
     
+    def bulk_update_candidates(self, updates: List[tuple]) -> int:
+        """Apply plain field patches to many candidates, one file write each.
+
+        updates is a list of (role_id, candidate_id, patch) tuples. Skips the
+        checklist-merge semantics of update_candidate_status; meant for batch
+        jobs flipping simple fields across many candidates.
+        """
+        now = _now_iso()
+        count = 0
+        for role_id, candidate_id, patch in updates:
+            candidate = self.get_candidate(role_id, candidate_id)
+            if not candidate:
+                continue
+            candidate.update(patch)
+            candidate["updated_at"] = now
+            candidate_file = self._get_candidate_dir(role_id, candidate_id) / "candidate.json"
+            with open(candidate_file, "w") as f:
+                _write_json(candidate, f)
+            count += 1
+        return count
+
     def save_outreach_message(self, role_id: str, candidate_id: str, message: str):
         """Save outreach message and mark as sent"""
         candidate = self.get_candidate(role_id, candidate_id)
@@ -331,10 +444,10 @@ class FileStorageService:
         candidate = self.get_candidate(role_id, candidate_id)
         if candidate:
             candidate["outreach_message"] = message
-            candidate["updated_at"] = datetime.now().isoformat()
+            candidate["updated_at"] = _now_iso()
             candidate_file = self._get_candidate_dir(role_id, candidate_id) / "candidate.json"
             with open(candidate_file, "w", encoding="utf-8") as f:
-                json.dump(candidate, f, indent=2)
+                _write_json(candidate, f)
 
     def record_outreach_reply(
         self,
@@ -353,13 +466,14 @@ class FileStorageService:
             return None
         content = reply_data.get("content") or reply_data.get("body") or ""
         sentiment = reply_data.get("sentiment", "neutral")
+        now = _now_iso()
         candidate["outreach_reply"] = {
             "content": content,
             "subject": reply_data.get("subject", ""),
             "sentiment": sentiment,
             "intent": reply_data.get("intent", "needs_info"),
             "analysis": reply_data.get("analysis", {}),
-            "received_at": datetime.now().isoformat(),
+            "received_at": now,
         }
         if move_to_follow_up_if_positive and sentiment == "positive":
             candidate["column"] = "follow-up"
@@ -371,10 +485,10 @@ class FileStorageService:
                     "screening_interview_scheduled": False,
                     "screening_interview_completed": False,
                 }
-        candidate["updated_at"] = datetime.now().isoformat()
+        candidate["updated_at"] = now
         candidate_file = self._get_candidate_dir(role_id, candidate_id) / "candidate.json"
         with open(candidate_file, "w", encoding="utf-8") as f:
-            json.dump(candidate, f, indent=2)
+            _write_json(candidate, f)
         return candidate
 
     def save_hr_briefing(
@@ -406,11 +520,11 @@ class FileStorageService:
             "extracted_fields": briefing_data.get("extracted_fields", {}),
             "transcription": briefing_data.get("transcription", ""),
             "role_ids": role_ids,
-            "created_at": datetime.now().isoformat(),
+            "created_at": _now_iso(),
         }
         
         with open(briefing_dir / "briefing.json", "w") as f:
-            json.dump(briefing_info, f, indent=2)
+            _write_json(briefing_info, f)
         
         return briefing_id
     
@@ -425,7 +539,7 @@ class FileStorageService:
                 briefing_file = briefing_dir / "briefing.json"
                 if briefing_file.exists():
                     with open(briefing_file, "r") as f:
-                        briefings.append(json.load(f))
+                        briefings.append(_read_json(f))
 
         briefings.sort(key=lambda x: x.get("created_at") or "", reverse=True)
         return briefings
@@ -445,11 +559,11 @@ class FileStorageService:
         if not briefing_file.exists():
             return False
         with open(briefing_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            data = _read_json(f)
         data["role_ids"] = list(role_ids)
-        data["updated_at"] = datetime.now().isoformat()
+        data["updated_at"] = _now_iso()
         with open(briefing_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+            _write_json(data, f)
         return True
 
     def delete_hr_briefing(self, briefing_id: str) -> bool:
@@ -460,20 +574,16 @@ class FileStorageService:
         shutil.rmtree(briefing_dir)
         return True
 
-    def save_interview_audio(self, role_id: str, candidate_id: str, file) -> Path:
-        """Save interview audio file"""
+    def save_interview_audio(self, role_id: str, candidate_id: str, filename: Optional[str], content) -> Path:
+        """Save interview audio file (bytes or a file-like such as UploadFile.file)."""
         candidate_dir = self._get_candidate_dir(role_id, candidate_id)
         interviews_dir = candidate_dir / "interviews"
         interviews_dir.mkdir(parents=True, exist_ok=True)
-        
+
         interview_id = str(uuid.uuid4())
-        ext = Path(file.filename).suffix if file.filename else ".mp3"
+        ext = Path(filename).suffix if filename else ".mp3"
         audio_path = interviews_dir / f"{interview_id}{ext}"
-        
-        with open(audio_path, "wb") as f:
-            content = file.file.read()
-            f.write(content)
-        
+        _write_upload(audio_path, content)
         return audio_path, interview_id
     
     def save_interview_data(self, role_id: str, candidate_id: str, interview_data: Dict[str, Any]):
@@ -482,7 +592,7 @@ class FileStorageService:
         interview_file = candidate_dir / "interview.json"
         
         with open(interview_file, "w") as f:
-            json.dump(interview_data, f, indent=2)
+            _write_json(interview_data, f)
     
     def get_interview_data(self, role_id: str, candidate_id: str) -> Optional[Dict[str, Any]]:
         """Get interview data"""
@@ -493,15 +603,15 @@ class FileStorageService:
             return None
         
         with open(interview_file, "r") as f:
-            return json.load(f)
+            return _read_json(f)
 
     def save_evaluation_chat(self, role_id: str, messages: List[Dict[str, Any]]) -> bool:
         """Save evaluation chat messages for a role"""
         role_dir = self._get_role_dir(role_id)
         chat_file = role_dir / "evaluation_chat.json"
-        data = {"messages": messages, "updated_at": datetime.now().isoformat()}
+        data = {"messages": messages, "updated_at": _now_iso()}
         with open(chat_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+            _write_json(data, f)
         return True
 
     def get_evaluation_chat(self, role_id: str) -> List[Dict[str, Any]]:
@@ -511,7 +621,7 @@ class FileStorageService:
         if not chat_file.exists():
             return []
         with open(chat_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            data = _read_json(f)
         return data.get("messages", [])
     
     def get_all_consents(self) -> List[Dict[str, Any]]:
@@ -522,7 +632,7 @@ class FileStorageService:
         
         for consent_file in self.consents_dir.glob("*.json"):
             with open(consent_file, "r") as f:
-                consents.append(json.load(f))
+                consents.append(_read_json(f))
         
         return consents
 
@@ -539,7 +649,7 @@ class FileStorageService:
                 content_file = template_dir / "content.json"
                 if content_file.exists():
                     with open(content_file, "r", encoding="utf-8") as f:
-                        templates.append(json.load(f))
+                        templates.append(_read_json(f))
         return templates
 
     def get_consent_template(self, content_id: str) -> Optional[Dict[str, Any]]:
@@ -548,7 +658,7 @@ class FileStorageService:
         if not content_file.exists():
             return None
         with open(content_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+            return _read_json(f)
 
     def save_consent_template(self, name: str, content: str, content_id: str = None) -> str:
         """Save or create a consent template"""
@@ -556,15 +666,16 @@ class FileStorageService:
             content_id = str(uuid.uuid4())
         template_dir = self.consent_templates_dir / content_id
         template_dir.mkdir(parents=True, exist_ok=True)
+        now = _now_iso()
         data = {
             "id": content_id,
             "name": name,
             "content": content,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now,
+            "updated_at": now,
         }
         with open(template_dir / "content.json", "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+            _write_json(data, f)
         return content_id
 
     def delete_consent_template(self, content_id: str) -> bool:
@@ -601,6 +712,7 @@ Please reply to this email with either:
 
 Best regards,
 Recruitment Team"""
+        now = _now_iso()
         consent_email = {
             "to": consent_data.get("email", f"{candidate.get('name', '')}@example.com"),
             "subject": subject,
@@ -608,7 +720,7 @@ Recruitment Team"""
             "consent_content": consent_data.get("consent_content", ""),
             "consent_content_id": consent_data.get("consent_content_id", ""),
             "candidate_name": consent_data.get("candidate_name", candidate.get("name", "")),
-            "sent_at": datetime.now().isoformat(),
+            "sent_at": now,
             "status": "sent",
         }
         candidate["consent_email"] = consent_email
@@ -617,10 +729,10 @@ Recruitment Team"""
         if "checklist" not in candidate:
             candidate["checklist"] = {}
         candidate["checklist"]["consent_form_sent"] = True
-        candidate["updated_at"] = datetime.now().isoformat()
+        candidate["updated_at"] = now
         candidate_file = self._get_candidate_dir(role_id, candidate_id) / "candidate.json"
         with open(candidate_file, "w") as f:
-            json.dump(candidate, f, indent=2)
+            _write_json(candidate, f)
         return True
 
     def record_consent_reply(self, role_id: str, candidate_id: str, reply_data: Dict[str, Any]) -> bool:
@@ -632,19 +744,20 @@ Recruitment Team"""
         if not candidate:
             return False
         consent_status = reply_data.get("consent_status", "consented")
+        now = _now_iso()
         candidate["simulated_email"] = {
             "content": reply_data.get("content", ""),
             "sentiment": reply_data.get("sentiment", "positive"),
             "intent": reply_data.get("intent", "interested"),
             "analysis": reply_data.get("analysis", {}),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "type": "consent_reply",
             "consent_status": consent_status,
             "consent_content": candidate.get("consent_email", {}).get("consent_content", ""),
             "consent_content_id": candidate.get("consent_email", {}).get("consent_content_id", ""),
         }
         candidate["consent_reply"] = {
-            "received_at": datetime.now().isoformat(),
+            "received_at": now,
             "status": consent_status,
             "responded_by": candidate.get("name", ""),
             "response": reply_data.get("response", "I CONSENT" if consent_status == "consented" else "I DO NOT CONSENT"),
@@ -654,9 +767,9 @@ Recruitment Team"""
         if "checklist" not in candidate:
             candidate["checklist"] = {}
         candidate["checklist"]["consent_form_received"] = consent_status == "consented"
-        candidate["updated_at"] = datetime.now().isoformat()
+        candidate["updated_at"] = now
         candidate_file = self._get_candidate_dir(role_id, candidate_id) / "candidate.json"
         with open(candidate_file, "w") as f:
-            json.dump(candidate, f, indent=2)
+            _write_json(candidate, f)
         return True
 
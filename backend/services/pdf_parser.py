@@ -1,105 +1,200 @@
-"""
-PDF Parser Service
-==================
-Extracts plain text from PDF files uploaded by users — primarily used for
-parsing Job Descriptions (JDs) and candidate resumes before they are passed
-to the CrewAI agent pipeline for structured analysis.
-
-Consumed by:
-    - JDParserAgent     (backend/agents/jd_parser.py)
-    - CandidateParser   (backend/agents/candidate_parser.py)
-
-Note: PyPDF2 works well for digitally-created PDFs. Scanned / image-based
-PDFs will return empty or garbled text — an OCR library (e.g. pytesseract)
-would be required for those cases.
-
-Authors : Modern Software Solutions — IS631 Group Project
-Version : 1.0.0
-"""
-import PyPDF2
-from pypdf import PdfReader
-from pathlib import Path
-
-
-class PDFParserService:
-    """
-    Service for extracting plain text content from PDF files.
-
-    Used as the first step in the document ingestion pipeline — the raw text
-    returned by this service is passed directly to CrewAI agents for further
-    parsing, structuring, and analysis.
-
-    Typical usage:
-        parser = PDFParserService()
-        text = parser.extract_text(Path("resume.pdf"))
-        page_count = parser.get_page_count(Path("resume.pdf"))
-    """
-
-    def extract_text(self, pdf_path: Path) -> str:
-        """
-        Read a PDF file and return its full text content as a single string.
-
-        Each page's text is extracted in order and separated by a newline,
-        preserving the natural reading flow of the document.
-
-        Note: Only works reliably on digitally-created PDFs (not scanned images).
-              If a page contains no selectable text, extract_text() returns an
-              empty string for that page — no error is raised.
-
-        Args:
-            pdf_path (Path): Absolute or relative path to the PDF file.
-
-        Returns:
-            str: Full concatenated text content of all pages.
-                 Returns an empty string if the PDF has no extractable text.
-
-        Raises:
-            Exception: Wraps any underlying IOError or PyPDF2 error with a
-                       descriptive message for easier upstream debugging.
-        """
-        try:
-            # Open in binary mode ("rb") — required by PyPDF2 for all platforms
-            with open(pdf_path, "rb") as file:
-                pdf_reader = PdfReader(file)
-                text = ""
-                # Iterate through every page and accumulate extracted text.
-                # A newline is appended after each page to preserve separation.
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-
-                return text
-
-        except Exception as e:
-            # Re-raise with context so callers know which file caused the issue
-            raise Exception(f"Error parsing PDF '{pdf_path}': {str(e)}")
-
-    def get_page_count(self, pdf_path: Path) -> int:
-        """
-        Return the total number of pages in a PDF without extracting all text.
-
-        Useful as a lightweight pre-check before processing — e.g. to reject
-        suspiciously large uploads or to log document size for auditing.
-
-        Args:
-            pdf_path (Path): Absolute or relative path to the PDF file.
-
-        Returns:
-            int: Total number of pages in the document.
-
-        Raises:
-            Exception: If the file cannot be opened or is not a valid PDF.
-
-        Example:
-            parser = PDFParserService()
-            count = parser.get_page_count(Path("jd.pdf"))
-            print(f"Document has {count} page(s).")
-        """
-        try:
-            # Open in binary mode and read only the page count — no text extraction
-            with open(pdf_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                return len(pdf_reader.pages)
-
-        except Exception as e:
-            raise Exception(f"Error reading page count from '{pdf_path}': {str(e)}")
-
+"""
+PDF Parser Service
+==================
+Extracts plain text from PDF files uploaded by users — primarily used for
+parsing Job Descriptions (JDs) and candidate resumes before they are passed
+to the CrewAI agent pipeline for structured analysis.
+
+Consumed by:
+    - JDParserAgent     (backend/agents/jd_parser.py)
+    - CandidateParser   (backend/agents/candidate_parser.py)
+
+Extraction runs on PyMuPDF (MuPDF's C parser — an order of magnitude faster
+than the pure-Python readers on typical resumes) and falls back to pypdf
+when PyMuPDF is not installed. Scanned / image-based pages yield no
+selectable text; if pytesseract is available those pages are rasterized and
+OCR'd, otherwise they return empty strings.
+
+Authors : Modern Software Solutions — IS631 Group Project
+Version : 1.0.0
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Prefer PyMuPDF: MuPDF extracts in C rather than walking the content stream
+# token-by-token in Python, and avoids pypdf's pathological cases on
+# malformed number tokens.
+PYMUPDF_AVAILABLE = False
+fitz = None
+try:
+    import fitz
+
+    PYMUPDF_AVAILABLE = True
+except Exception:
+    PYMUPDF_AVAILABLE = False
+
+from pypdf import PdfReader
+
+# OCR fallback for scanned pages — optional, needs the tesseract binary.
+OCR_AVAILABLE = False
+try:
+    import pytesseract
+    from PIL import Image
+
+    OCR_AVAILABLE = True
+except Exception:
+    OCR_AVAILABLE = False
+
+# Page parsing is CPU-bound (stream decompression + glyph decoding), so long
+# documents fan out across cores. Typical resumes are 1-3 pages, where worker
+# startup would dwarf the parse — those stay on the serial path.
+_PARALLEL_PAGE_THRESHOLD = 8
+
+
+def _extract_page(args) -> str:
+    """Process-pool worker: reopens the document because fitz handles can't
+    cross process boundaries (the OS page cache makes the reopen cheap)."""
+    path, index = args
+    doc = fitz.open(path)
+    try:
+        return doc[index].get_text()
+    finally:
+        doc.close()
+
+
+class PDFParserService:
+    """
+    Service for extracting plain text content from PDF files.
+
+    Used as the first step in the document ingestion pipeline — the raw text
+    returned by this service is passed directly to CrewAI agents for further
+    parsing, structuring, and analysis.
+
+    Typical usage:
+        parser = PDFParserService()
+        text = parser.extract_text(Path("resume.pdf"))
+        page_count = parser.get_page_count(Path("resume.pdf"))
+    """
+
+    def extract_text(self, pdf_path: Path) -> str:
+        """
+        Read a PDF file and return its full text content as a single string.
+
+        Each page's text is extracted in order and separated by a newline,
+        preserving the natural reading flow of the document.
+
+        Note: Pages with no selectable text (scanned images) are OCR'd when
+              pytesseract is installed; otherwise they contribute an empty
+              string — no error is raised.
+
+        Args:
+            pdf_path (Path): Absolute or relative path to the PDF file.
+
+        Returns:
+            str: Full concatenated text content of all pages.
+                 Returns an empty string if the PDF has no extractable text.
+
+        Raises:
+            Exception: Wraps any underlying IOError or parser error with a
+                       descriptive message for easier upstream debugging.
+        """
+        try:
+            if PYMUPDF_AVAILABLE:
+                doc = fitz.open(pdf_path)
+                try:
+                    if doc.page_count >= _PARALLEL_PAGE_THRESHOLD:
+                        work = [(str(pdf_path), i) for i in range(doc.page_count)]
+                        with ProcessPoolExecutor() as pool:
+                            pages = list(pool.map(_extract_page, work, chunksize=4))
+                    else:
+                        pages = [page.get_text() for page in doc]
+                    if OCR_AVAILABLE:
+                        for i, page_text in enumerate(pages):
+                            if not page_text.strip():
+                                pages[i] = self._ocr_page(doc[i])
+                    return "\n".join(pages)
+                finally:
+                    doc.close()
+
+            # Fallback: pure-Python extraction when PyMuPDF is absent.
+            # Collect per-page parts and join once — += on a growing str
+            # recopies the accumulated prefix every page.
+            with open(pdf_path, "rb") as file:
+                pdf_reader = PdfReader(file)
+                parts = []
+                for page in pdf_reader.pages:
+                    parts.append(page.extract_text() or "")
+                parts.append("")  # preserve the trailing newline of the += form
+                return "\n".join(parts)
+
+        except Exception as e:
+            # Re-raise with context so callers know which file caused the issue
+            raise Exception(f"Error parsing PDF '{pdf_path}': {str(e)}")
+
+    def iter_page_text(self, pdf_path: Path):
+        """
+        Yield each page's text in reading order.
+
+        Streaming alternative to extract_text for very large documents:
+        peak memory stays at one page rather than the whole concatenated
+        text. Same OCR fallback per page as extract_text.
+        """
+        if PYMUPDF_AVAILABLE:
+            doc = fitz.open(pdf_path)
+            try:
+                for page in doc:
+                    page_text = page.get_text()
+                    if not page_text.strip() and OCR_AVAILABLE:
+                        page_text = self._ocr_page(page)
+                    yield page_text
+            finally:
+                doc.close()
+            return
+        with open(pdf_path, "rb") as file:
+            for page in PdfReader(file).pages:
+                yield page.extract_text() or ""
+
+    @staticmethod
+    def _ocr_page(page) -> str:
+        """Rasterize a text-less page and run tesseract over it so scanned
+        resumes still yield content instead of empty strings."""
+        pixmap = page.get_pixmap(dpi=200)
+        image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+        return pytesseract.image_to_string(image)
+
+    def get_page_count(self, pdf_path: Path) -> int:
+        """
+        Return the total number of pages in a PDF without extracting all text.
+
+        Useful as a lightweight pre-check before processing — e.g. to reject
+        suspiciously large uploads or to log document size for auditing.
+
+        Args:
+            pdf_path (Path): Absolute or relative path to the PDF file.
+
+        Returns:
+            int: Total number of pages in the document.
+
+        Raises:
+            Exception: If the file cannot be opened or is not a valid PDF.
+
+        Example:
+            parser = PDFParserService()
+            count = parser.get_page_count(Path("jd.pdf"))
+            print(f"Document has {count} page(s).")
+        """
+        try:
+            if PYMUPDF_AVAILABLE:
+                doc = fitz.open(pdf_path)
+                try:
+                    return doc.page_count
+                finally:
+                    doc.close()
+
+            # Open in binary mode and read only the page count — no text extraction
+            with open(pdf_path, "rb") as file:
+                pdf_reader = PdfReader(file)
+                return len(pdf_reader.pages)
+
+        except Exception as e:
+            raise Exception(f"Error reading page count from '{pdf_path}': {str(e)}")
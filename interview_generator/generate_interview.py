@@ -2,12 +2,16 @@
 Interview Audio Generator
 Generates realistic interview audio conversations for testing the main app
 """
+import asyncio
+import hashlib
 import os
-import json
+import numpy as np
+import orjson
+import shutil
 from pathlib import Path
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 import time
 import subprocess
 import sys
@@ -37,6 +41,41 @@ else:
     # Try loading from environment
     load_dotenv()
 
+# Static instructions live in the system message so the provider's prompt
+# caching can reuse the shared prefix across calls; only the short user
+# message with the three variable fields changes per request.
+SCRIPT_SYSTEM_PROMPT = """You are an expert at creating realistic interview conversations. Generate natural, flowing dialogue.
+
+Generate a realistic interview conversation between an interviewer and a candidate for the given position.
+
+Generate a natural conversation with:
+1. Interviewer greeting and introduction
+2. 5-7 interview questions covering:
+   - Technical skills
+   - Experience
+   - Behavioral questions
+   - Salary expectations
+   - Start date
+   - Work authorization
+   - Location preferences
+   - Notice period
+3. Candidate responses that are realistic and detailed
+4. Natural back-and-forth conversation
+
+Format as a JSON array where each item has:
+- "speaker": "interviewer" or "candidate"
+- "text": "the spoken text"
+
+Make it sound natural and conversational. Include pauses and natural speech patterns.
+
+IMPORTANT: Respond with ONLY a valid JSON object. Do not include any explanatory text before or after the JSON."""
+
+# Closely-related postings ("Software Engineer" vs "Senior Software Engineer")
+# produce near-identical scripts; above this cosine similarity the cached
+# script is reused instead of paying for a fresh GPT-4 generation.
+SEMANTIC_CACHE_THRESHOLD = 0.92
+
+
 class InterviewGenerator:
     def __init__(self):
         api_key = os.getenv("OPENAI_API_KEY")
@@ -50,47 +89,111 @@ class InterviewGenerator:
                 "\nOr run: export OPENAI_API_KEY='your-key-here'"
             )
         self.client = OpenAI(api_key=api_key)
-        
+        # Async client for the TTS fan-out in generate_interview_audio
+        self.async_client = AsyncOpenAI(api_key=api_key)
+
         # Set output directory relative to script location
         script_dir = Path(__file__).parent
         self.output_dir = script_dir / "output"
         self.output_dir.mkdir(parents=True, exist_ok=True)
-    
+
+        # Disk cache for GPT scripts and TTS audio: identical inputs produce
+        # the same request, so re-runs (example_usage.py, repeated
+        # generate_from_role_data) skip the API round trip and its cost.
+        self.cache_dir = self.output_dir / ".script_cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Semantic cache: scripts indexed by an embedding of the posting, so
+        # an exact-cache miss on a near-duplicate title can still be served
+        # from disk. One cheap embeddings call replaces one GPT-4 generation.
+        self.sem_cache_dir = self.output_dir / ".sem_cache"
+        self.sem_cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # FFmpeg probe result and resolved PATH, filled on first check_ffmpeg
+        # call — the probe costs a subprocess spawn plus (on Windows) a full
+        # Program Files scan, so it must not run per invocation.
+        self._ffmpeg_available = None
+        self._ffmpeg_env = None
+
+    @staticmethod
+    def _cache_key(*parts: str) -> str:
+        """Stable filename for a set of request inputs."""
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def _cache_write(self, cache_path: Path, data: bytes):
+        """Write-then-rename so a crash mid-write never leaves a partial
+        cache entry to be replayed."""
+        tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+
+    def _embed_posting(self, job_title: str, job_description: str) -> np.ndarray:
+        """Embed a posting for semantic cache lookups, normalized so a dot
+        product against stored entries is the cosine similarity."""
+        response = self.client.embeddings.create(
+            model="text-embedding-3-small",
+            input=f"{job_title} {job_description}",
+        )
+        embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return embedding / np.linalg.norm(embedding)
+
+    def _sem_cache_lookup(self, embedding: np.ndarray) -> Optional[List[Dict[str, str]]]:
+        """Return the cached script closest to the embedding, or None if
+        nothing clears SEMANTIC_CACHE_THRESHOLD. Brute-force scan: entries
+        number in the dozens, so a vector index would be overhead."""
+        best_score = SEMANTIC_CACHE_THRESHOLD
+        best_script = None
+        for entry_path in self.sem_cache_dir.glob("*.json"):
+            try:
+                entry = orjson.loads(entry_path.read_bytes())
+            except orjson.JSONDecodeError:
+                continue
+            score = float(np.dot(embedding, np.asarray(entry["embedding"], dtype=np.float32)))
+            if score >= best_score:
+                best_score = score
+                best_script = entry["script"]
+        return best_script
+
+    def _sem_cache_store(self, embedding: np.ndarray, key: str, script: List[Dict[str, str]]):
+        """Record a freshly generated script under its posting embedding."""
+        entry = {"embedding": embedding.tolist(), "script": script}
+        self._cache_write(self.sem_cache_dir / (key + ".json"), orjson.dumps(entry))
+
     def generate_interview_script(self, job_title: str, job_description: str = None, 
                                   candidate_profile: str = None) -> List[Dict[str, str]]:
         """Generate interview conversation script using GPT"""
         
-        prompt = f"""Generate a realistic interview conversation between an interviewer and a candidate for the position of {job_title}.
+        prompt = f"""Position: {job_title}
 
 Job Description: {job_description or "General position"}
 
-Candidate Profile: {candidate_profile or "Experienced professional"}
-
-Generate a natural conversation with:
-1. Interviewer greeting and introduction
-2. 5-7 interview questions covering:
-   - Technical skills
-   - Experience
-   - Behavioral questions
-   - Salary expectations
-   - Start date
-   - Work authorization
-   - Location preferences
-   - Notice period
-3. Candidate responses that are realistic and detailed
-4. Natural back-and-forth conversation
+Candidate Profile: {candidate_profile or "Experienced professional"}"""
 
-Format as a JSON array where each item has:
-- "speaker": "interviewer" or "candidate"
-- "text": "the spoken text"
+        # Same inputs -> same request; serve repeats from disk instead of GPT-4
+        script_cache = self.cache_dir / (
+            self._cache_key(job_title, job_description or "", candidate_profile or "", "gpt-4", "0.7") + ".json"
+        )
+        if script_cache.exists():
+            return orjson.loads(script_cache.read_bytes())
 
-Make it sound natural and conversational. Include pauses and natural speech patterns."""
+        # Exact miss: try the semantic cache. A near-duplicate posting that
+        # was already generated costs one embeddings call instead of a full
+        # GPT-4 conversation (~5s and two orders of magnitude the price).
+        embedding = None
+        try:
+            embedding = self._embed_posting(job_title, job_description or "General position")
+            cached_script = self._sem_cache_lookup(embedding)
+            if cached_script is not None:
+                return cached_script
+        except Exception as e:
+            print(f"Warning: semantic cache lookup failed, generating fresh: {e}")
 
         response = self.client.chat.completions.create(
             model="gpt-4",
             messages=[
-                {"role": "system", "content": "You are an expert at creating realistic interview conversations. Generate natural, flowing dialogue. Always respond with valid JSON only, no additional text."},
-                {"role": "user", "content": prompt + "\n\nIMPORTANT: Respond with ONLY a valid JSON object. Do not include any explanatory text before or after the JSON."}
+                {"role": "system", "content": SCRIPT_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
             ],
             temperature=0.7
         )
@@ -105,26 +208,33 @@ Make it sound natural and conversational. Include pauses and natural speech patt
             elif "```" in content:
                 content = content.split("```")[1].split("```")[0].strip()
             
-            result = json.loads(content)
-            
+            # orjson: several times faster than stdlib json on the
+            # string-heavy payloads GPT returns
+            result = orjson.loads(content)
+
             # Handle different possible response formats
+            script = []
             if "conversation" in result:
-                return result["conversation"]
+                script = result["conversation"]
             elif isinstance(result, list):
-                return result
+                script = result
             elif "script" in result:
-                return result["script"]
+                script = result["script"]
             elif "dialogue" in result:
-                return result["dialogue"]
-            else:
-                # If it's a dict with speaker/text keys, return as list
-                if isinstance(result, dict) and any("speaker" in str(k).lower() or "text" in str(k).lower() for k in result.keys()):
-                    # Try to find array in the dict
-                    for key, value in result.items():
-                        if isinstance(value, list):
-                            return value
-                return []
-        except json.JSONDecodeError as e:
+                script = result["dialogue"]
+            elif isinstance(result, dict) and any("speaker" in str(k).lower() or "text" in str(k).lower() for k in result.keys()):
+                # Try to find array in the dict
+                for key, value in result.items():
+                    if isinstance(value, list):
+                        script = value
+                        break
+
+            if script:
+                self._cache_write(script_cache, orjson.dumps(script))
+                if embedding is not None:
+                    self._sem_cache_store(embedding, script_cache.stem, script)
+            return script
+        except orjson.JSONDecodeError as e:
             print(f"Warning: Failed to parse JSON response. Error: {e}")
             print(f"Response content: {content[:200]}...")
             # Try to extract conversation from text
@@ -134,22 +244,58 @@ Make it sound natural and conversational. Include pauses and natural speech patt
         """Convert text to speech using OpenAI TTS"""
         if output_path is None:
             output_path = self.output_dir / f"temp_{int(time.time())}.mp3"
-        
+
+        # TTS is deterministic per (model, voice, text): memoize the MP3 bytes
+        # so re-runs skip the network call entirely. Copy out of the cache
+        # because callers delete their segment files after combining.
+        tts_cache = self.cache_dir / (self._cache_key(text, voice, "tts-1") + ".mp3")
+        if tts_cache.exists():
+            shutil.copy(tts_cache, output_path)
+            return output_path
+
         response = self.client.audio.speech.create(
             model="tts-1",
             voice=voice,
             input=text
         )
-        
-        # Write response content directly to file
+
+        # Single SDK-internal copy instead of a Python loop over small
+        # iter_bytes chunks (thousands of tiny write() calls per MP3)
+        response.stream_to_file(output_path)
+
+        self._cache_write(tts_cache, output_path.read_bytes())
+        return output_path
+
+    async def _tts_async(self, text: str, voice: str, output_path: Path, semaphore: asyncio.Semaphore) -> Path:
+        """Async variant of text_to_speech sharing the same disk cache."""
+        tts_cache = self.cache_dir / (self._cache_key(text, voice, "tts-1") + ".mp3")
+        if tts_cache.exists():
+            shutil.copy(tts_cache, output_path)
+            return output_path
+
+        # The semaphore bounds in-flight requests to stay inside rate limits
+        async with semaphore:
+            response = await self.async_client.audio.speech.create(
+                model="tts-1",
+                voice=voice,
+                input=text
+            )
+
         with open(output_path, 'wb') as f:
-            for chunk in response.iter_bytes():
-                f.write(chunk)
-        
+            f.write(response.content)
+
+        self._cache_write(tts_cache, output_path.read_bytes())
         return output_path
-    
+
     def check_ffmpeg(self) -> bool:
-        """Check if FFmpeg is available"""
+        """Check if FFmpeg is available (probed once, then memoized)"""
+        if self._ffmpeg_available is None:
+            self._ffmpeg_available = self._probe_ffmpeg()
+        return self._ffmpeg_available
+
+    def _probe_ffmpeg(self) -> bool:
+        """Locate FFmpeg, remembering any extended PATH in self._ffmpeg_env
+        so later subprocess calls reuse it without re-scanning."""
         try:
             import os
             # First try with current PATH
@@ -190,12 +336,15 @@ Make it sound natural and conversational. Include pauses and natural speech patt
                     system_path = path + os.pathsep + system_path
             
             env['PATH'] = system_path
-            
-            result = subprocess.run(['ffmpeg', '-version'], 
+
+            result = subprocess.run(['ffmpeg', '-version'],
                                   capture_output=True,
                                   env=env,
                                   timeout=5)
-            return result.returncode == 0
+            if result.returncode == 0:
+                self._ffmpeg_env = env
+                return True
+            return False
         except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
             return False
     
@@ -222,27 +371,32 @@ Make it sound natural and conversational. Include pauses and natural speech patt
         interviewer_voice = "alloy"  # Neutral, professional
         candidate_voice = "shimmer"  # Slightly different tone
         
-        # Collect all audio files first
-        audio_files = []
-        
+        # TTS is latency-bound (~1s round trip per segment), so synthesize all
+        # segments concurrently instead of serializing the waits; per-index
+        # temp names keep parallel segments from clobbering each other.
+        run_id = int(time.time())
+        jobs = []
         for i, segment in enumerate(script):
             speaker = segment.get("speaker", "interviewer")
             text = segment.get("text", "")
-            
+
             if not text:
                 continue
-            
+
             print(f"  [{i+1}/{len(script)}] {speaker}: {text[:50]}...")
-            
+
             # Choose voice based on speaker
             voice = interviewer_voice if speaker == "interviewer" else candidate_voice
-            
-            # Generate speech (returns MP3 file)
-            temp_file = self.text_to_speech(text, voice)
-            
-            # Convert MP3 to WAV if FFmpeg not available, or keep MP3
-            audio_file = self.convert_mp3_to_wav(temp_file)
-            audio_files.append(audio_file)
+            jobs.append((text, voice, self.output_dir / f"temp_{run_id}_{i:03d}.mp3"))
+
+        async def _synthesize_all():
+            semaphore = asyncio.Semaphore(8)
+            return await asyncio.gather(
+                *(self._tts_async(text, voice, path, semaphore) for text, voice, path in jobs)
+            )
+
+        # Convert MP3 to WAV if FFmpeg not available, or keep MP3
+        audio_files = [self.convert_mp3_to_wav(f) for f in asyncio.run(_synthesize_all())]
         
         # Combine audio files using FFmpeg if available
         print("Combining audio segments...")
@@ -255,26 +409,35 @@ Make it sound natural and conversational. Include pauses and natural speech patt
                 output_filename = f"interview_{safe_job_title}_{timestamp}.mp3"
             
             output_path = self.output_dir / output_filename
-            
-            # Create file list for FFmpeg concat
-            file_list_path = self.output_dir / f"concat_list_{int(time.time())}.txt"
-            with open(file_list_path, 'w', encoding='utf-8') as f:
-                for audio_file in audio_files:
-                    # Escape single quotes in path for FFmpeg
-                    escaped_path = str(audio_file.absolute()).replace("'", "'\\''")
-                    f.write(f"file '{escaped_path}'\n")
-            
-            # Use FFmpeg to concatenate with 0.5s pause between files
+
+            # Combine in one FFmpeg process with a 0.5s pause between
+            # segments: every file is an -i input plus one lavfi silence
+            # source split N-1 ways, interleaved through the concat filter.
+            # The old concat demuxer with -c copy could only butt segments
+            # together (no pause) and needed a temp file list on disk.
             try:
-                # First, add silence to each file, then concat
-                subprocess.run(
-                    ['ffmpeg', '-f', 'concat', '-safe', '0', '-i', str(file_list_path), 
-                     '-c', 'copy', '-y', str(output_path)],
-                    check=True,
-                    capture_output=True,
-                    timeout=300
-                )
-                file_list_path.unlink()
+                if len(audio_files) == 1:
+                    shutil.copy(audio_files[0], output_path)
+                else:
+                    num = len(audio_files)
+                    cmd = ['ffmpeg']
+                    for audio_file in audio_files:
+                        cmd += ['-i', str(audio_file.absolute())]
+                    cmd += ['-f', 'lavfi', '-t', '0.5', '-i', 'anullsrc=r=24000:cl=mono']
+                    splits = ''.join(f'[s{i}]' for i in range(num - 1))
+                    chain = ''.join(f'[{i}:a][s{i}]' for i in range(num - 1)) + f'[{num - 1}:a]'
+                    filter_complex = (
+                        f'[{num}:a]asplit={num - 1}{splits};'
+                        f'{chain}concat=n={2 * num - 1}:v=0:a=1[out]'
+                    )
+                    subprocess.run(
+                        cmd + ['-filter_complex', filter_complex, '-map', '[out]',
+                               '-y', str(output_path)],
+                        check=True,
+                        capture_output=True,
+                        env=self._ffmpeg_env,
+                        timeout=300
+                    )
             except Exception as e:
                 print(f"Error combining with FFmpeg: {e}")
                 # Fallback: just copy first file
@@ -319,9 +482,10 @@ Make it sound natural and conversational. Include pauses and natural speech patt
             if self.check_ffmpeg():
                 # Use ffprobe to get duration
                 result = subprocess.run(
-                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', 
+                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
                      '-of', 'default=noprint_wrappers=1:nokey=1', str(output_path)],
                     capture_output=True,
+                    env=self._ffmpeg_env,
                     timeout=10
                 )
                 if result.returncode == 0:
@@ -376,15 +540,13 @@ def main():
     
     if args.role_file:
         # Load role data from main app
-        with open(args.role_file, 'r') as f:
-            role_data = json.load(f)
-        
+        role_data = orjson.loads(Path(args.role_file).read_bytes())
+
         # Try to load JD if available
         role_dir = Path(args.role_file).parent
         jd_file = role_dir / "jd_parsed.json"
         if jd_file.exists():
-            with open(jd_file, 'r') as f:
-                role_data["jd"] = json.load(f)
+            role_data["jd"] = orjson.loads(jd_file.read_bytes())
         
         output_path = generator.generate_from_role_data(role_data)
     else:
@@ -1,10 +1,13 @@
 import logging
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Body, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import os
+import time
+
+import orjson
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -32,7 +35,9 @@ from backend.services.db_storage import DatabaseStorageService
 from backend.services.pdf_parser import PDFParserService
 from backend.services.audio_transcription import AudioTranscriptionService
 
-app = FastAPI(title="Agentic AI Recruiter API", version="1.0.0")
+# orjson response class: candidate list payloads embed nested skills/insights/interview
+# blobs, so response serialization is on the hot path.
+app = FastAPI(title="Agentic AI Recruiter API", version="1.0.0", default_response_class=ORJSONResponse)
 
 
 @app.exception_handler(Exception)
@@ -120,6 +125,34 @@ evaluation_agent = EvaluationAgent()
 consent_engine = ConsentEngineAgent()
 simulation_agent = SimulationAgent()
 
+# Role/JD/briefing context for the evaluation chat changes on the minute scale
+# but is re-read on every chat turn. Cache it per role for a short TTL and
+# invalidate from the mutation endpoints below.
+_EVAL_CONTEXT_TTL_SECONDS = 60.0
+_eval_context_cache: Dict[str, Any] = {}
+
+
+def _get_eval_context(role_id: str):
+    """Return (role, jd, briefing) for a role, cached for a short TTL."""
+    entry = _eval_context_cache.get(role_id)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    context = (
+        file_storage.get_role(role_id),
+        file_storage.get_parsed_jd(role_id),
+        file_storage.get_role_hr_briefing(role_id),
+    )
+    _eval_context_cache[role_id] = (time.monotonic() + _EVAL_CONTEXT_TTL_SECONDS, context)
+    return context
+
+
+def _invalidate_eval_context(role_id: Optional[str] = None):
+    """Drop cached evaluation context for one role, or all roles if None."""
+    if role_id is None:
+        _eval_context_cache.clear()
+    else:
+        _eval_context_cache.pop(role_id, None)
+
 
 class RoleCreate(BaseModel):
     title: str
@@ -292,6 +325,7 @@ async def update_role(role_id: str, role_update: RoleUpdate):
     updated = file_storage.update_role(role_id, role_update.dict(exclude_unset=True))
     if not updated:
         raise HTTPException(status_code=404, detail="Role not found")
+    _invalidate_eval_context(role_id)
     return {"message": "Role updated successfully"}
 
 
@@ -301,6 +335,7 @@ async def delete_role(role_id: str):
     success = file_storage.delete_role(role_id)
     if not success:
         raise HTTPException(status_code=404, detail="Role not found")
+    _invalidate_eval_context(role_id)
     return {"message": "Role deleted successfully"}
 
 
@@ -313,8 +348,8 @@ async def upload_jd(role_id: str, file: UploadFile = File(...)):
         role = file_storage.get_role(role_id)
         if not role:
             raise HTTPException(status_code=404, detail="Role not found. Make sure the role exists.")
-        # Save file
-        file_path = file_storage.save_jd(role_id, file)
+        # Stream the upload straight to disk (no full in-memory copy)
+        file_path = file_storage.save_jd(role_id, file.file)
         # Parse PDF
         pdf_content = pdf_parser.extract_text(file_path)
         if not pdf_content or len(pdf_content.strip()) == 0:
@@ -326,6 +361,7 @@ async def upload_jd(role_id: str, file: UploadFile = File(...)):
         parsed_jd = await jd_parser.parse_jd(pdf_content)
         # Save parsed data
         file_storage.save_parsed_jd(role_id, parsed_jd)
+        _invalidate_eval_context(role_id)
         return {"message": "JD uploaded and parsed successfully", "jd": parsed_jd}
     except HTTPException:
         raise
@@ -350,6 +386,7 @@ async def get_jd(role_id: str):
 async def update_jd(role_id: str, jd_data: Dict[str, Any]):
     """Update parsed JD fields"""
     file_storage.update_parsed_jd(role_id, jd_data)
+    _invalidate_eval_context(role_id)
     return {"message": "JD updated successfully"}
 
 
@@ -360,8 +397,8 @@ async def upload_candidate(role_id: str, file: UploadFile = File(...)):
         if not file.filename or not file.filename.endswith('.pdf'):
             raise HTTPException(status_code=400, detail="File must be a PDF")
         
-        # Save file (returns tuple: file_path, candidate_id)
-        file_path, candidate_id = file_storage.save_candidate_pdf(role_id, file)
+        # Save file (returns tuple: file_path, candidate_id); streams to disk
+        file_path, candidate_id = file_storage.save_candidate_pdf(role_id, file.file)
         
         # Parse PDF
         pdf_content = pdf_parser.extract_text(file_path)
@@ -420,12 +457,10 @@ async def get_candidate(role_id: str, candidate_id: str):
 @app.post("/api/roles/{role_id}/candidates/{candidate_id}/outreach")
 async def generate_outreach(role_id: str, candidate_id: str, body: Optional[Dict[str, Any]] = Body(default=None)):
     """Generate personalized outreach message for candidate. Optional: recruiter_notes for customization hints."""
-    role = file_storage.get_role(role_id)
+    role, jd, briefing = _get_eval_context(role_id)
     candidate = file_storage.get_candidate(role_id, candidate_id)
     if not role or not candidate:
         raise HTTPException(status_code=404, detail="Role or candidate not found")
-    jd = file_storage.get_parsed_jd(role_id)
-    briefing = file_storage.get_role_hr_briefing(role_id)
     recruiter_notes = (body or {}).get("recruiter_notes", "")
     outreach_message = await outreach_writer.generate_outreach(
         role, candidate, jd, briefing=briefing, recruiter_notes=recruiter_notes
@@ -434,15 +469,36 @@ async def generate_outreach(role_id: str, candidate_id: str, body: Optional[Dict
     return {"outreach_message": outreach_message}
 
 
+@app.post("/api/roles/{role_id}/candidates/{candidate_id}/outreach/stream")
+async def stream_outreach(role_id: str, candidate_id: str, body: Optional[Dict[str, Any]] = Body(default=None)):
+    """Stream outreach generation as SSE token deltas; persists the full message when done."""
+    role, jd, briefing = _get_eval_context(role_id)
+    candidate = file_storage.get_candidate(role_id, candidate_id)
+    if not role or not candidate:
+        raise HTTPException(status_code=404, detail="Role or candidate not found")
+    recruiter_notes = (body or {}).get("recruiter_notes", "")
+
+    async def event_stream():
+        parts = []
+        async for token in outreach_writer.stream_outreach(
+            role, candidate, jd, briefing=briefing, recruiter_notes=recruiter_notes
+        ):
+            parts.append(token)
+            yield f"data: {orjson.dumps({'token': token}).decode()}\n\n"
+        outreach_message = "".join(parts).strip()
+        file_storage.update_outreach_message(role_id, candidate_id, outreach_message)
+        yield f"data: {orjson.dumps({'done': True, 'outreach_message': outreach_message}).decode()}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.post("/api/roles/{role_id}/candidates/{candidate_id}/outreach-notes")
 async def generate_outreach_notes(role_id: str, candidate_id: str):
     """Generate AI-suggested recruiter notes for personalization"""
-    role = file_storage.get_role(role_id)
+    role, jd, briefing = _get_eval_context(role_id)
     candidate = file_storage.get_candidate(role_id, candidate_id)
     if not role or not candidate:
         raise HTTPException(status_code=404, detail="Role or candidate not found")
-    jd = file_storage.get_parsed_jd(role_id)
-    briefing = file_storage.get_role_hr_briefing(role_id)
     notes = await outreach_writer.generate_recruiter_notes(role, candidate, jd, briefing)
     return {"recruiter_notes": notes}
 
@@ -504,6 +560,8 @@ async def upload_hr_briefing(
         role_id_list,
         briefing_id=briefing_id,
     )
+    # Briefings can touch several roles, so drop the whole context cache
+    _invalidate_eval_context()
 
     return {"message": "HR briefing processed successfully", "briefing_id": briefing_id, "briefing": briefing_data}
 
@@ -532,6 +590,7 @@ async def update_hr_briefing_roles(briefing_id: str, body: HRBriefingRolesUpdate
     success = file_storage.update_hr_briefing_roles(briefing_id, body.role_ids)
     if not success:
         raise HTTPException(status_code=404, detail="Briefing not found")
+    _invalidate_eval_context()
     return {"message": "Assigned roles updated", "role_ids": body.role_ids}
 
 
@@ -541,14 +600,15 @@ async def delete_hr_briefing(briefing_id: str):
     success = file_storage.delete_hr_briefing(briefing_id)
     if not success:
         raise HTTPException(status_code=404, detail="Briefing not found")
+    _invalidate_eval_context()
     return {"message": "Briefing deleted"}
 
 
 @app.post("/api/roles/{role_id}/candidates/{candidate_id}/interview")
 async def upload_interview(role_id: str, candidate_id: str, file: UploadFile = File(...)):
     """Upload interview audio file"""
-    # Save file (returns tuple: file_path, interview_id)
-    file_path, interview_id = file_storage.save_interview_audio(role_id, candidate_id, file)
+    # Save file (returns tuple: file_path, interview_id); streams to disk
+    file_path, interview_id = file_storage.save_interview_audio(role_id, candidate_id, file.filename, file.file)
     
     # Get role data to pass requirement fields (synchronous call, no await)
     role = file_storage.get_role(role_id)
@@ -642,24 +702,19 @@ async def get_interview_guidance(role_id: str, candidate_id: str, request_data:
 async def evaluate_candidate(role_id: str, query: Dict[str, Any]):
     """Evaluate candidate using LLM chat. Only includes candidates in Evaluation column who have completed interviews.
     Accepts conversation_history for context-aware follow-up questions."""
-    role = file_storage.get_role(role_id)
-    jd = file_storage.get_parsed_jd(role_id)
-    briefing = file_storage.get_role_hr_briefing(role_id)
-    all_candidates = file_storage.get_candidates(role_id)
+    # A chat conversation issues many evaluate calls for the same role; the
+    # role/JD/briefing context is served from a short-TTL cache after the first.
+    role, jd, briefing = _get_eval_context(role_id)
+    # Interviews are eager-loaded with the candidates to avoid one query per candidate
+    all_candidates = file_storage.get_candidates_with_interviews(role_id)
 
     # Filter: only candidates in Evaluation column with completed interviews
-    candidates_to_evaluate = []
-    for c in all_candidates:
-        if c.get("column") != "evaluation":
-            continue
-        if c.get("not_pushing_forward"):
-            continue
-        interview = file_storage.get_interview_data(role_id, c.get("id"))
-        if not interview:
-            continue
-        cand = dict(c)
-        cand["interview"] = interview
-        candidates_to_evaluate.append(cand)
+    candidates_to_evaluate = [
+        c for c in all_candidates
+        if c.get("column") == "evaluation"
+        and not c.get("not_pushing_forward")
+        and c.get("interview")
+    ]
 
     if not candidates_to_evaluate:
         return {
@@ -0,0 +1,20 @@
+"""Schema sanity checks: one canonical model per table, no metadata forks."""
+
+from __future__ import annotations
+
+from sqlalchemy import String
+
+from backend.db.db import Base
+
+
+def test_one_table_per_name() -> None:
+    names = [t.name for t in Base.metadata.tables.values()]
+    assert len(names) == len(set(names))
+
+
+def test_candidate_pk_is_uuid_string() -> None:
+    candidates = Base.metadata.tables["candidates"]
+    (pk,) = candidates.primary_key.columns
+    assert pk.name == "id"
+    assert isinstance(pk.type, String)
+    assert pk.type.length == 36